@@ -1,11 +1,10 @@
 import networkx as nx
 import matplotlib.pyplot as plt
 from typing import Final
+from sub_modules.indexed_priorityqueue import IndexedPriorityQueue
+from sub_modules.pairing_heap import PairingHeap
 
 # type alias
-Value = object
-Priority = int
-Index = int
 Node = object
 Edge = tuple[Node, Node]
 Distance = int
@@ -15,196 +14,6 @@ Weight = int
 INF: Final = float('inf')
 
 
-class IndexedMinPQ():
-    def __init__(self):
-        self.N = 0
-        self.values: list[Value] = [None]
-        self.priorities: list[Priority] = [None]
-
-        # value들을 모은 리스트에 각각의 value들이 해당 
-        # 리스트의 어느 인덱스에 존재하는지를 기록하기 위해 
-        # 각 value에 해당하는 index를 저장하는 변수.
-        # 해당 변수의 존재로, 특정 value를 O(1)만에 찾을 수 있음. 
-        # dictionary는 hashtable로 구성되어있기 때문. 
-        self.location: dict[Value, Index] = {}
-
-    def getCurrentSize(self) -> (int):
-        """
-        현재 힙 내에 저장된 데이터의 수 반환
-        """
-        return self.N
-    
-    def peek(self) -> (tuple[Value, Priority] | tuple[None, None]):
-        """
-        제일 먼저 출력될 아이템의 value와 priority를 반환. 
-        """
-        if self.N == 0:
-            return None, None
-        v = self.values[1]
-        p = self.priorities[1]
-        return v, p 
-    
-    def isEmpty(self) -> (bool):
-        """
-        우선순위 큐가 비어있는지 확인하는 메서드. 비어있으면 True 반환.
-        """
-        return self.N == 0
-
-    def __contains__(self, target_value: Value) -> (bool):
-        """
-        각 value의 리스트 내 인덱스 위치를 기록하는 변수 
-        self.location의 존재 덕분에 O(1)이라는 짧은 시간 내에 
-        해당 값이 우선순위 큐에 존재하는지 확인할 수 있다. 
-        """
-        return target_value in self.location
-    
-    def _less(self, i: Index, j: Index) -> (bool | None):
-        """
-        두 인덱스에 해당하는 value들의 우선순위를 비교하여 
-        i의 우선순위가 j의 것보다 더 작은지를 확인하는 메서드. 
-        우선순위의 수치값이 작은 value가 더 우선순위가 높은 구조를 가지는 
-        우선순위 큐이기에 i > j이면 True, 그렇지 않으면 False 반환. 
-        매개변수로 입력받은 두 인덱스 중 하나라도 None이라면 None을 반환. 
-        """
-        if (i is None) or (j is None): return None
-        return self.priorities[i] > self.priorities[j]
-    
-    def _swap(self, i: Index, j: Index) -> (None):
-        """
-        주어진 두 인덱스 i, j에 해당하는 두 개체의 위치를 바꾼다. 
-        """
-        self.values[i], self.values[j] = self.values[j], self.values[i]
-        self.priorities[i], self.priorities[j] = \
-        self.priorities[j], self.priorities[i]
-        self.location[self.values[i]] = i
-        self.location[self.values[j]] = j
-
-    def _getParentIndex(self, child_index: Index) -> (Index | None):
-        """
-        힙 내 특정 데이터의 부모 데이터의 인덱스 반환. 
-        부모 데이터가 존재하지 않으면 None을 반환. 
-        """
-        parent_index = child_index // 2
-        if parent_index >= 1:
-            return parent_index
-        return None
-    
-    def _getChildIndex(self, parent_index: Index) \
-        -> (tuple[Index | None, Index | None]):
-        """
-        힙 내의 특정 데이터의 두 (왼쪽, 오른쪽) 자식 데이터의 인덱스 반환. 
-        자식 데이터가 존재하지 않을 경우의 반환값) \n
-        - 두 자식 데이터 모두 없는 경우: (None, None) \n
-        - 왼쪽 자식 데이터만 없는 경우: (None, Index) \n
-        - 오른쪽 자식 데이터만 없는 경우: (Index, None) \n
-        """
-        lchild_index = parent_index * 2
-        rchild_index = parent_index * 2 + 1
-        if lchild_index > self.N:
-            lchild_index = None
-        if rchild_index > self.N:
-            rchild_index = None
-        return lchild_index, rchild_index
-    
-    def _goUp(self, target_idx: Index) -> (None):
-        """
-        enqueue를 통해 새 데이터 입력 시 힙 순위 특성에 맞게 재배치하기 위해 
-        새 데이터를 우선순위에 따라 더 높은 층으로 이동시킨다. 
-
-        매개변수
-        -------
-        target_idx: 새로 입력되어 힙 내에서 재배열이 필요한 데이터의 인덱스.
-        """
-        parent_idx = self._getParentIndex(target_idx)
-        while parent_idx:
-            if self._less(parent_idx, target_idx):
-                self._swap(parent_idx, target_idx)
-            else:
-                # 이미 경로 내 정렬이 모두 끝났으므로 작업 종료.
-                break
-
-    def _goDown(self, target_idx: Index):
-        """
-        dequeue 작업에 의해 맨 마지막에 있던 데이터가 최상위 층으로 이동한 경우, 
-        힙 순서 특성을 맞추기 위해 해당 데이터의 위치를 필요한 만큼 힙 구조의 
-        아래로 내려가게끔 하는 메서드. 
-
-        매개변수
-        -------
-        target_idx: dequeue 작업에 의해 최상위 층으로 이동된 데이터의 인덱스.
-        """
-        lchild_idx, rchild_idx = self._getChildIndex(target_idx)
-        while lchild_idx or rchild_idx:
-            if rchild_idx is None and self._less(target_idx, lchild_idx):
-                self._swap(target_idx, lchild_idx)
-            elif rchild_idx is None and not self._less(target_idx, lchild_idx):
-                break
-
-            if (self._less(target_idx, lchild_idx) or 
-                  self._less(target_idx, rchild_idx)):
-                if self._less(lchild_idx, rchild_idx):
-                    self._swap(target_idx, rchild_idx)
-                    target_idx = rchild_idx
-                else:
-                    self._swap(target_idx, lchild_idx)
-                    target_idx = lchild_idx
-                lchild_idx, rchild_idx = self._getChildIndex(target_idx)
-            else: break
-
-    def enqueue(self, v: Value, p: Priority) -> (None):
-        self.N += 1
-        #self.values[self.N], self.priorities[self.N] = v, p
-        self.values.append(v)
-        self.priorities.append(p)
-        self.location[v] = self.N
-        self._goUp(self.N)
-
-    def dequeue(self) -> (Value | None):
-        if self.isEmpty(): return
-
-        value_to_be_removed = self.values[1]
-        if self.N == 1: 
-            self.N -= 1
-            return value_to_be_removed
-        
-        self.values[1] = self.values.pop()
-        self.priorities[1] = self.priorities.pop()
-        self.location[self.values[1]] = 1
-        self.location.pop(value_to_be_removed)
-        self.N -= 1
-        self._goDown(1)
-        return value_to_be_removed
-
-    def decreasePriority(
-            self,
-            target_value: Value,
-            lower_priority: Priority
-        ) -> (None):
-        """
-        target_value 매개변수로 입력받은 값의 우선순위의 수치값을 
-        lower_priority 매개변수로 입력받은 우선순위 수치값으로 낮춰서 
-        해당 데이터의 우선순위를 키우는 메서드. 
-        target_value의 우선순위 수치값은 lower_priority의 값보다 더 
-        커야 한다. 
-        """
-        try:
-            target_idx = self.location[target_value]
-        except KeyError:
-            # target_value가 우선순위 큐에 없는 경우.
-            print(f"에러: 값 {target_value}는 우선순위 큐에 존재하지 않습니다.")
-            return
-        if self.priorities[target_idx] <= lower_priority:
-            error_msg = """
-            Error from decreasePriority() in class IndexedMinPQ. 
-            target_value의 우선순위 값이 lower_priority의 값보다 더 
-            작습니다. 
-            """
-            raise RuntimeError(error_msg)
-        
-        self.priorities[target_idx] = lower_priority
-        self._goUp(target_idx)
-
-
 class SingleNodeShortestPath():
     """
     weighted graph에서 가중치를 고려하여 source 노드에서 특정 노드까지의 
@@ -222,23 +31,29 @@ class SingleNodeShortestPath():
         self.dist_to: dict[Node, Distance] = {}
         self.edge_to: dict[Node, Edge] = {}
 
-    def dijkstraAlgorithm(self) -> (None):
+    def dijkstraAlgorithm(
+            self,
+            pq_class: type[IndexedPriorityQueue | PairingHeap] = IndexedPriorityQueue
+        ) -> (None):
         """
         weighted graph에서 가중치를 고려하여 source 노드로부터 특정 노드까지의 
         최단 거리와 그 경로를 구하는 함수. 해당 함수는 모든 가중치가 양수여야만 
         제대로 작동한다. 
         undirected graph에서도 잘 작동할 지 테스트 필요.
+
+        매개변수
+        -------
+        pq_class: 노드들을 거리 순으로 꺼내는 데 사용할 우선순위 큐 클래스. \
+        IndexedPriorityQueue 또는 PairingHeap처럼 fromItems(), dequeue(), \
+        decreaseKey()를 제공해야 한다. decreaseKey() 호출이 많은 조밀한 그래프에서는 \
+        decreaseKey()가 O(1)인 PairingHeap이 유리하다.
         """
         # source node는 거리를 0으로 초기화하고, 나머지 노드들에 대해서는 
         # 모두 무한대(inf)로 지정한다. 
         dist_to: dict[Node, Distance] = {v:INF for v in self.graph.nodes()}
         dist_to[self.src] = 0
 
-        impq = IndexedMinPQ()   #2
-        impq.enqueue(self.src, dist_to[self.src])
-        for v in self.graph.nodes():
-            if v != self.src:
-                impq.enqueue(v, INF)
+        impq = pq_class.fromItems(dist_to.items(), max_mode=False)   #2
 
         def relax(e) -> (None):
             """
@@ -261,12 +76,12 @@ class SingleNodeShortestPath():
                 # 노드 v의 우선순위 수치값을 새로 발견한 최단 거리값으로 낮춘다. 
                 # 이를 통해 후에 while 문에서 최단 경로를 가지는 노드 추출이 
                 # 가능해진다. 
-                impq.decreasePriority(v, dist_to[v])   #9
+                impq.decreaseKey(v, dist_to[v])   #9
 
         # edge_to: 탐색 동안 찾은 v 노드로 향하는 edge를 기록.
         edge_to: dict[Node, Edge] = {}    #3
         while not impq.isEmpty():
-            n = impq.dequeue()   #4
+            n = impq.dequeue().value   #4
 
             # G.edges(data=True): edge의 가중치(weight) 추출을 위해 
             # data=True로 설정해줘야 함.
@@ -290,6 +290,72 @@ class BinaryTree():
             node = self._search(node.rightChild, target_value)
         return node
 
+    def getMin(self) -> (NodeValue | None):
+        """이진 트리 내 최소값 반환. 빈 트리이면 None 반환."""
+        node = self._root
+        if node is None: return None
+        while node.leftChild: node = node.leftChild
+        return node.value
+
+    def getMax(self) -> (NodeValue | None):
+        """이진 트리 내 최대값 반환. 빈 트리이면 None 반환."""
+        node = self._root
+        if node is None: return None
+        while node.rightChild: node = node.rightChild
+        return node.value
+
+    def floor(self, target_value: NodeValue) -> (NodeValue | None):
+        """target_value 이하인 값들 중 최대값 반환. 없으면 None 반환."""
+        result = None
+        node = self._root
+        while node:
+            if node.value == target_value: return node.value
+            if node.value < target_value:
+                result = node.value
+                node = node.rightChild
+            else:
+                node = node.leftChild
+        return result
+
+    def ceiling(self, target_value: NodeValue) -> (NodeValue | None):
+        """target_value 이상인 값들 중 최소값 반환. 없으면 None 반환."""
+        result = None
+        node = self._root
+        while node:
+            if node.value == target_value: return node.value
+            if node.value > target_value:
+                result = node.value
+                node = node.leftChild
+            else:
+                node = node.rightChild
+        return result
+
+    def range(
+            self,
+            low: NodeValue,
+            high: NodeValue
+            ) -> (Generator[NodeValue, None, None]):
+        """low 이상 high 미만인 값들을 오름차순으로 반환하는 제너레이터. 
+
+        범위 밖의 하위 트리는 방문하지 않으므로, 
+        반환하는 값의 수가 k일 때 O(log n + k)이다.
+        """
+        stack: list[BNode] = []
+        node = self._root
+        while stack or node:
+            # low 이상인 가장 왼쪽 노드까지 내려가며 경로를 쌓는다.
+            while node:
+                if node.value < low:
+                    node = node.rightChild
+                else:
+                    stack.append(node)
+                    node = node.leftChild
+            if not stack: return
+            node = stack.pop()
+            if not node.value < high: return
+            yield node.value
+            node = node.rightChild
+
     def insert(self, new_value: NodeValue) -> (None):
         self._node_depth = 0
         self._root = self._insert(self._root, new_value)
@@ -382,7 +448,7 @@ class BinaryTree():
         """
         if node.leftChild is None: return node.rightChild
         node.leftChild = self._removeMin(node.leftChild)
-        node.leftChild.depth -= 1
+        if node.leftChild: node.leftChild.depth -= 1
         return node
 
     def popNode(self, target_value: NodeValue) -> (None):
@@ -671,7 +737,7 @@ class AVLTree(BinaryTree):
         """
         if node.leftChild is None: return node.rightChild
         node.leftChild = self._removeMin(node.leftChild)
-        node.leftChild.depth -= 1
+        if node.leftChild: node.leftChild.depth -= 1
         node = self.solver.solveWhenRightLeaning(node)
         node.calculateNodeHeight()
         return node
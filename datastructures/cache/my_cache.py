@@ -0,0 +1,403 @@
+"""해시 테이블과 이중 연결 리스트를 이용한 크기 제한 캐시(cache) 구현 모듈.
+LRU, LFU, TTL 방식의 캐시와 함수 결과를 캐시에 저장하는 memoize 데코레이터로 구성됨.
+
+모든 캐시는 HashTable로 키에 해당하는 DPNode를 O(1)만에 찾고,
+DoublyLinkedList 상에서 노드를 떼어내거나 맨 앞에 붙이는 방식으로
+사용 순서를 관리하므로 get, put 모두 O(1)이다.
+"""
+import functools
+import time
+from typing import Callable
+
+from sub_modules.my_hash_table import HashTable, HashMethod
+from sub_modules.my_linked_list import DoublyLinkedList, DPNode
+
+__all__ = [
+    'LRUCache',
+    'LFUCache',
+    'TTLCache',
+    'memoize',
+]
+
+# type alias
+Key = object
+Value = object
+
+# get()에서 캐시에 없는 키를 구분하기 위한 표식 객체.
+_MISSING = object()
+# memoize에서 위치 인자와 키워드 인자를 구분하기 위한 표식 객체.
+_KWD_MARK = object()
+
+
+class _Cache():
+    """캐시 공통 기능. (히트, 미스, 제거 횟수 집계)"""
+
+    def __init__(self, capacity: int) -> (None):
+        """
+        Parameters
+        ----------
+        capacity : int
+            캐시에 저장할 수 있는 최대 데이터 수.
+
+        Raises
+        ------
+        ValueError
+            capacity가 1보다 작은 경우.
+
+        """
+        if capacity < 1:
+            raise ValueError("캐시의 크기는 1 이상이어야 합니다.")
+        self.capacity = capacity
+        # 키 -> DPNode. 캐시의 키는 hashable 해야 한다.
+        self._table = HashTable(2 * capacity + 1, HashMethod.BUILTIN)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, key: Key) -> (bool):
+        """통계와 사용 순서에 영향을 주지 않고 키의 존재 여부만 확인."""
+        return self._table.findData(key) is not None
+
+    def getLength(self) -> (int):
+        """현재 캐시에 저장된 데이터 수 반환."""
+        return self._table.getLength()
+
+    def getStats(self) -> (dict):
+        """캐시 통계 반환.
+
+        Returns
+        -------
+        dict
+            hits, misses, evictions : 히트, 미스, 용량 초과로 인한 제거 횟수.
+            hit_ratio : 전체 조회 중 히트의 비율.
+            length, capacity : 현재 저장된 데이터 수, 최대 데이터 수.
+
+        """
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_ratio': self.hits / total if total else 0.0,
+            'length': self.getLength(),
+            'capacity': self.capacity,
+        }
+
+    def resetStats(self) -> (None):
+        """히트, 미스, 제거 횟수를 0으로 초기화."""
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+class LRUCache(_Cache):
+    """LRU(Least Recently Used) 캐시.
+    용량이 가득 찬 상태에서 새 데이터를 넣으면 가장 오래 전에 사용된 데이터를 제거한다.
+
+    이중 연결 리스트의 맨 앞에 가장 최근에 사용된 노드가,
+    맨 뒤에 가장 오래 전에 사용된 노드가 위치한다.
+    각 노드의 value는 [key, value] 리스트이다.
+    """
+    def __init__(self, capacity: int) -> (None):
+        super().__init__(capacity)
+        self._dll = DoublyLinkedList()
+
+    def __repr__(self):
+        return repr([tuple(node.value) for node in self._dll])
+
+    def _touch(self, node: DPNode) -> (None):
+        """노드를 이중 연결 리스트의 맨 앞으로 옮긴다."""
+        if node is self._dll.head_pointer:
+            return
+        self._dll.deleteNode(node)
+        self._dll._addNodeFront(node)
+
+    def _removeNode(self, node: DPNode) -> (None):
+        """노드를 이중 연결 리스트와 해시 테이블에서 모두 제거."""
+        self._dll.deleteNode(node)
+        self._table.removeData(node.value[0])
+
+    def _evict(self) -> (None):
+        """가장 오래 전에 사용된 데이터를 제거."""
+        self._removeNode(self._dll.tail_pointer)
+        self.evictions += 1
+
+    def get(self, key: Key, default: Value = None) -> (Value):
+        """키에 대응되는 값을 반환. 캐시에 없으면 default 반환.
+        조회된 데이터는 가장 최근에 사용된 데이터가 된다.
+        """
+        node = self._table.findData(key)
+        if node is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._touch(node)
+        return node.value[1]
+
+    def put(self, key: Key, value: Value) -> (None):
+        """캐시에 키-값 데이터 저장. 이미 있는 키라면 값만 바꾼다.
+        용량이 가득 찼다면 가장 오래 전에 사용된 데이터를 제거한다.
+        """
+        node = self._table.findData(key)
+        if node is not None:
+            node.value[1] = value
+            self._touch(node)
+            return
+        if self.getLength() >= self.capacity:
+            self._evict()
+        node = DPNode([key, value])
+        self._dll._addNodeFront(node)
+        self._table.addData((key, node))
+
+    def remove(self, key: Key) -> (None):
+        """캐시에서 키에 해당하는 데이터를 제거. 없으면 아무것도 하지 않는다."""
+        node = self._table.findData(key)
+        if node is not None:
+            self._removeNode(node)
+
+    def clear(self) -> (None):
+        """캐시를 모두 비운다. 통계는 유지된다."""
+        self._dll.clear()
+        self._table.clear()
+
+
+class LFUCache(_Cache):
+    """LFU(Least Frequently Used) 캐시.
+    용량이 가득 찬 상태에서 새 데이터를 넣으면 사용 횟수가 가장 적은 데이터를 제거한다.
+    사용 횟수가 같다면 그 중 가장 오래 전에 사용된 데이터를 제거한다.
+
+    사용 횟수별로 이중 연결 리스트를 하나씩 두고,
+    현재 가장 적은 사용 횟수(_min_freq)를 기록하여 O(1)만에 제거 대상을 찾는다.
+    각 노드의 value는 [key, value, freq] 리스트이다.
+    """
+    def __init__(self, capacity: int) -> (None):
+        super().__init__(capacity)
+        # 사용 횟수 -> 해당 사용 횟수를 가진 노드들의 이중 연결 리스트.
+        self._freq_lists = HashTable(11, HashMethod.BUILTIN)
+        self._min_freq = 0
+
+    def __repr__(self):
+        all_data = []
+        for _, dll in sorted(self._freq_lists.getAllData()):
+            all_data.extend(tuple(node.value[:2]) for node in dll)
+        return repr(all_data)
+
+    def __addToFreqList(self, node: DPNode) -> (None):
+        freq = node.value[2]
+        dll = self._freq_lists.findData(freq)
+        if dll is None:
+            dll = DoublyLinkedList()
+            self._freq_lists.addData((freq, dll))
+        dll._addNodeFront(node)
+
+    def __removeFromFreqList(self, node: DPNode) -> (None):
+        freq = node.value[2]
+        dll = self._freq_lists.findData(freq)
+        dll.deleteNode(node)
+        if dll.getLength() == 0:
+            self._freq_lists.removeData(freq)
+            if self._min_freq == freq:
+                self._min_freq += 1
+
+    def _touch(self, node: DPNode) -> (None):
+        """노드의 사용 횟수를 1 늘린다."""
+        self.__removeFromFreqList(node)
+        node.value[2] += 1
+        self.__addToFreqList(node)
+
+    def _evict(self) -> (None):
+        """사용 횟수가 가장 적은 데이터 중 가장 오래 전에 사용된 데이터를 제거."""
+        dll = self._freq_lists.findData(self._min_freq)
+        node = dll.tail_pointer
+        self.__removeFromFreqList(node)
+        self._table.removeData(node.value[0])
+        self.evictions += 1
+
+    def get(self, key: Key, default: Value = None) -> (Value):
+        """키에 대응되는 값을 반환. 캐시에 없으면 default 반환.
+        조회된 데이터의 사용 횟수가 1 늘어난다.
+        """
+        node = self._table.findData(key)
+        if node is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._touch(node)
+        return node.value[1]
+
+    def put(self, key: Key, value: Value) -> (None):
+        """캐시에 키-값 데이터 저장. 이미 있는 키라면 값을 바꾸고 사용 횟수를 1 늘린다.
+        용량이 가득 찼다면 사용 횟수가 가장 적은 데이터를 제거한다.
+        """
+        node = self._table.findData(key)
+        if node is not None:
+            node.value[1] = value
+            self._touch(node)
+            return
+        if self.getLength() >= self.capacity:
+            self._evict()
+        node = DPNode([key, value, 1])
+        self.__addToFreqList(node)
+        self._table.addData((key, node))
+        self._min_freq = 1
+
+    def remove(self, key: Key) -> (None):
+        """캐시에서 키에 해당하는 데이터를 제거. 없으면 아무것도 하지 않는다."""
+        node = self._table.findData(key)
+        if node is None:
+            return
+        self.__removeFromFreqList(node)
+        self._table.removeData(key)
+        if self.getLength() == 0:
+            self._min_freq = 0
+        elif self._freq_lists.findData(self._min_freq) is None:
+            # 제거로 인해 가장 적은 사용 횟수의 목록이 사라진 경우.
+            self._min_freq = min(freq for freq, _ in self._freq_lists.getAllData())
+
+    def clear(self) -> (None):
+        """캐시를 모두 비운다. 통계는 유지된다."""
+        for _, dll in self._freq_lists.getAllData():
+            dll.clear()
+        self._freq_lists.clear()
+        self._table.clear()
+        self._min_freq = 0
+
+
+class TTLCache(LRUCache):
+    """TTL(Time To Live) 캐시.
+    저장된 지 ttl초가 지난 데이터는 만료되어 조회되지 않는다.
+    용량이 가득 찬 경우에는 LRUCache와 같이 가장 오래 전에 사용된 데이터를 제거한다.
+    각 노드의 value는 [key, value, expire_time] 리스트이다.
+    """
+    def __init__(
+            self,
+            capacity: int,
+            ttl: float,
+            timer: Callable[[], float] = time.monotonic
+        ) -> (None):
+        """
+        Parameters
+        ----------
+        capacity : int
+            캐시에 저장할 수 있는 최대 데이터 수.
+        ttl : float
+            데이터가 저장된 후 만료되기까지의 시간. (초)
+        timer : callable, default time.monotonic
+            현재 시각을 반환하는 함수. 테스트 시 시간을 조작하기 위해 사용.
+
+        """
+        super().__init__(capacity)
+        if ttl <= 0:
+            raise ValueError("ttl은 0보다 커야 합니다.")
+        self.ttl = ttl
+        self._timer = timer
+        self.expirations = 0
+
+    def __repr__(self):
+        return repr([tuple(node.value[:2]) for node in self._dll])
+
+    def __contains__(self, key: Key) -> (bool):
+        node = self._table.findData(key)
+        return node is not None and node.value[2] > self._timer()
+
+    def get(self, key: Key, default: Value = None) -> (Value):
+        """키에 대응되는 값을 반환.
+        캐시에 없거나 만료된 경우 default를 반환하며, 만료된 데이터는 제거한다.
+        """
+        node = self._table.findData(key)
+        if node is not None and node.value[2] <= self._timer():
+            self._removeNode(node)
+            self.expirations += 1
+            node = None
+        if node is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._touch(node)
+        return node.value[1]
+
+    def put(self, key: Key, value: Value) -> (None):
+        """캐시에 키-값 데이터 저장. 이미 있는 키라면 값과 만료 시각을 새로 갱신한다.
+        용량이 가득 찼다면 먼저 리스트의 맨 뒤에서부터 만료된 데이터를 정리하고,
+        그래도 가득 차 있으면 가장 오래 전에 사용된 데이터를 제거한다.
+        """
+        expire_time = self._timer() + self.ttl
+        node = self._table.findData(key)
+        if node is not None:
+            node.value[1] = value
+            node.value[2] = expire_time
+            self._touch(node)
+            return
+        if self.getLength() >= self.capacity:
+            self._purgeExpiredTail()
+        if self.getLength() >= self.capacity:
+            self._evict()
+        node = DPNode([key, value, expire_time])
+        self._dll._addNodeFront(node)
+        self._table.addData((key, node))
+
+    def _purgeExpiredTail(self) -> (None):
+        """리스트의 맨 뒤에서부터 만료된 데이터를 제거하다가
+        만료되지 않은 데이터를 만나면 멈춘다.
+
+        모든 데이터의 ttl이 같고 저장 시 노드가 맨 앞으로 옮겨지므로,
+        맨 뒤쪽일수록 만료 시각이 이른 데이터가 모여 있다.
+        제거되는 노드마다 한 번씩만 확인하므로 put()의 분할 상환 시간은 O(1)이다.
+        (get()으로 앞으로 옮겨진 만료 데이터는 purgeExpired()나 get()에서 정리된다.)
+        """
+        now = self._timer()
+        dll = self._dll
+        while dll.tail_pointer is not None and dll.tail_pointer.value[2] <= now:
+            self._removeNode(dll.tail_pointer)
+            self.expirations += 1
+
+    def purgeExpired(self) -> (int):
+        """만료된 데이터를 모두 제거하고, 제거한 데이터 수를 반환. O(n)"""
+        now = self._timer()
+        expired_nodes = [node for node in self._dll if node.value[2] <= now]
+        for node in expired_nodes:
+            self._removeNode(node)
+        self.expirations += len(expired_nodes)
+        return len(expired_nodes)
+
+    def getStats(self) -> (dict):
+        """캐시 통계 반환. LRUCache의 통계에 만료 횟수(expirations)가 추가된다."""
+        stats = super().getStats()
+        stats['expirations'] = self.expirations
+        return stats
+
+    def resetStats(self) -> (None):
+        super().resetStats()
+        self.expirations = 0
+
+
+def memoize(cache: _Cache) -> (Callable):
+    """함수의 결과를 주어진 캐시에 저장하는 데코레이터.
+    같은 인자로 다시 호출되면 함수를 실행하지 않고 캐시에 저장된 결과를 반환한다.
+    인자들은 hashable 해야 한다. 데코레이트된 함수의 cache 속성으로 캐시에 접근할 수 있다.
+
+    ex)
+    >>> @memoize(LRUCache(128))
+    ... def shortest_path(graph, start, end): ...
+    >>> shortest_path.cache.getStats()['hits']
+    0
+    """
+    def decorator(func: Callable) -> (Callable):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = args
+            if kwargs:
+                key = args + (_KWD_MARK,) + tuple(sorted(kwargs.items()))
+            result = cache.get(key, _MISSING)
+            if result is _MISSING:
+                result = func(*args, **kwargs)
+                cache.put(key, result)
+            return result
+        wrapper.cache = cache
+        return wrapper
+    return decorator
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,639 @@
+from typing import Callable
+
+from sub_modules.linked_list_kv import LinkedList, NodeKV
+
+__all__ = [
+    'HashTable', 
+    'HashMethod',
+    'digit_folding_hash',
+    'builtin_hash',
+    'fnv1a_hash',
+    'multiplicative_hash',
+    'compare_hash_methods',
+]
+
+# type alias
+Key = object
+Value = object
+Item = tuple[Key, Value]
+HashFunc = Callable[[object], int]
+
+# FNV-1a (64bit) 상수
+_FNV_OFFSET_BASIS = 0xcbf29ce484222325
+_FNV_PRIME = 0x100000001b3
+_MASK_64 = 0xffffffffffffffff
+
+# 곱셈 해싱(multiplicative hashing)에 사용하는 상수. 
+# 2^64 / 황금비(golden ratio)에 가장 가까운 홀수. (Fibonacci hashing)
+_GOLDEN_RATIO_64 = 0x9e3779b97f4a7c15
+
+
+def digit_folding_hash(key: Key) -> (int):
+    """키를 문자열로 바꾼 뒤, 각 문자의 유니코드 값을 모두 더한 값을 반환.
+    HashTable의 기존 해시 함수. 애너그램이나 같은 숫자들로 이루어진 
+    키들은 모두 같은 해시값을 가진다.
+    """
+    if not isinstance(key, str):
+        key = str(key)
+    return sum(map(ord, key))
+
+
+def builtin_hash(key: Key) -> (int):
+    """파이썬 내장 hash() 함수의 결과를 반환. 
+    가장 빠르지만, 문자열 키의 해시값은 프로세스마다 달라질 수 있다. 
+    (PYTHONHASHSEED 참고)
+    """
+    return hash(key)
+
+
+def fnv1a_hash(key: Key) -> (int):
+    """64bit FNV-1a 해시값 반환. 
+    키가 문자열이 아니면 문자열로 형 변환 후 UTF-8 바이트열에 대해 계산한다.
+    프로세스가 달라도 항상 같은 값을 반환한다.
+    """
+    if not isinstance(key, (bytes, bytearray)):
+        if not isinstance(key, str):
+            key = str(key)
+        key = key.encode('utf-8')
+    hash_value = _FNV_OFFSET_BASIS
+    for byte in key:
+        hash_value = ((hash_value ^ byte) * _FNV_PRIME) & _MASK_64
+    return hash_value
+
+
+def multiplicative_hash(key: Key) -> (int):
+    """정수 키에 대한 곱셈 해싱(Fibonacci hashing) 결과 반환.
+    연속된 정수 키들이 테이블 전체에 고르게 퍼지도록 한다. 
+    정수가 아닌 키는 내장 hash() 값을 정수 키로 사용한다.
+    """
+    if not isinstance(key, int):
+        key = hash(key)
+    # 상위 비트일수록 골고루 섞이므로 상위 32bit만 사용한다.
+    return ((key * _GOLDEN_RATIO_64) & _MASK_64) >> 32
+
+
+class HashMethod():
+    """HashTable에서 사용 가능한 해시 함수 이름 상수 모음."""
+    DIGIT_FOLDING = "digit_folding"
+    BUILTIN = "builtin"
+    FNV1A = "fnv1a"
+    MULTIPLICATIVE = "multiplicative"
+
+    _functions = {
+        DIGIT_FOLDING: digit_folding_hash,
+        BUILTIN: builtin_hash,
+        FNV1A: fnv1a_hash,
+        MULTIPLICATIVE: multiplicative_hash,
+    }
+
+    @classmethod
+    def getFunction(cls, hash_method: str | HashFunc) -> (HashFunc):
+        """해시 함수 이름 또는 해시 함수 자체를 받아 해시 함수를 반환.
+
+        Raises
+        ------
+        ValueError
+            등록되지 않은 해시 함수 이름을 입력한 경우.
+
+        """
+        if callable(hash_method):
+            return hash_method
+        try:
+            return cls._functions[hash_method]
+        except KeyError as exc:
+            raise ValueError(
+                f"지원하지 않는 해시 함수입니다: {hash_method}"
+            ) from exc
+
+
+class HashTable():
+    """해시 함수: 선택한 해시 함수(기본값은 digit folding)와 division method 방식 사용.
+    해시 충돌 해결법: chaining 방식 사용.
+    """
+    def __init__(
+            self,
+            size: int,
+            hash_method: str | HashFunc = HashMethod.DIGIT_FOLDING
+        ) -> (None):
+        """
+        Parameters
+        ----------
+        size : int
+            해시테이블 크기. (총 버킷 수)
+        hash_method : str | callable, default HashMethod.DIGIT_FOLDING
+            키의 해시값을 계산할 해시 함수. HashMethod의 상수 중 하나 또는 
+            키를 받아 정수를 반환하는 함수를 대입한다. 
+
+        Attributes
+        ----------
+        self._length : int, default 0
+            현재 저장된 데이터의 수. 데이터 삽입, 삭제 시마다 갱신된다.
+        self.rehash_step : int, default 4
+            점진적 재해싱(incremental rehashing) 진행 중일 때, 
+            한 번의 연산마다 기존 테이블에서 새 테이블로 옮길 버킷의 최대 수.
+        self._old_buckets : list[LinkedList | None] | None, default None
+            재해싱 진행 중일 때의 기존 테이블. 재해싱 중이 아니면 None.
+        self._rehash_index : int, default 0
+            기존 테이블에서 다음으로 옮길 버킷의 인덱스.
+        
+        """
+        self.size = size
+        self.hash_method = hash_method
+        self._hash_func: HashFunc = HashMethod.getFunction(hash_method)
+        self.buckets: list[LinkedList] = []
+        self.load_factor = 0.75  # 부하율
+        self.threshold = self.size * self.load_factor
+        self._length = 0
+        self.rehash_step = 4
+        self._old_buckets: list[LinkedList | None] | None = None
+        self._rehash_index = 0
+        self.__createHashTable()
+
+    def getAllData(self) -> (list[tuple]):
+        """해시 테이블 내 모든 데이터 반환.
+
+        Returns
+        -------
+        list[(key, value)]
+
+        """
+        all_data = []
+        for ll in self.__iterBuckets():
+            all_data.extend(ll.items())
+        return all_data
+
+    def __createHashTable(self) -> (None):
+        """해시테이블 생성. 
+        각 버킷마다 빈 연결 리스트를 생성한다.
+        """
+        for _ in range(self.size):
+            self.buckets.append(LinkedList())
+
+    def __iterBuckets(self):
+        """데이터가 저장되어 있을 수 있는 모든 버킷을 차례로 반환. 
+        재해싱 진행 중이라면 아직 옮겨지지 않은 기존 테이블의 버킷도 포함한다.
+        """
+        if self._old_buckets is not None:
+            for ll in self._old_buckets[self._rehash_index:]:
+                yield ll
+        for ll in self.buckets:
+            yield ll
+
+    def hashKey(self, key) -> (int):
+        """키의 해싱값 (숫자) 반환. 
+        hash_method로 지정한 해시 함수의 결과를 현재 테이블 크기로 나눈 나머지이다.
+        """
+        return self._hashKeyWithSize(key, self.size)
+
+    def _hashKeyWithSize(self, key, size: int) -> (int):
+        """주어진 테이블 크기 size를 기준으로 키의 해싱값 반환. 
+        재해싱 도중 기존 테이블에서의 위치를 계산할 때에도 사용된다.
+        """
+        return self._hash_func(key) % size
+
+    def __findOldBucket(self, key: Key) -> (LinkedList | None):
+        """재해싱 진행 중일 때, 주어진 키가 머무르고 있을 수 있는 
+        기존 테이블의 버킷을 반환. 
+        재해싱 중이 아니거나 해당 버킷이 이미 옮겨졌다면 None 반환.
+        """
+        if self._old_buckets is None:
+            return None
+        old_index = self._hashKeyWithSize(key, len(self._old_buckets))
+        if old_index < self._rehash_index:
+            return None
+        return self._old_buckets[old_index]
+
+    def addData(self, new_data: tuple) -> (None):
+        """해시 테이블에 새 키-값 데이터 삽입.
+        만약 기존의 키에 연결된 값을 바꾸기 위해 
+        기존 키를 입력한 경우, 해당 버킷의 값만 바꾼다.
+
+        Parameters
+        ----------
+        new_data : (key, value)
+
+        """
+        self._rehashStep()
+        key, value = new_data
+
+        # 재해싱 도중이라면 기존 테이블에 남아 있는 같은 키를 먼저 치운다.
+        # 새 데이터는 항상 새 테이블에 삽입된다.
+        old_ll = self.__findOldBucket(key)
+        if old_ll is not None:
+            old_length = old_ll.getLength()
+            old_ll.deleteNodeByKey(key)
+            self._length -= old_length - old_ll.getLength()
+
+        index = self.hashKey(key)
+        target_linked_list = self.buckets[index]
+        # multipledispatch를 사용하는 addNodeBack() 대신 직접 키를 찾아 삽입한다.
+        # (dispatch 객체가 호출 대상 인스턴스를 공유하므로, 여러 스레드에서
+        # 서로 다른 연결 리스트의 addNodeBack()을 동시에 호출하면 엉뚱한
+        # 연결 리스트에 삽입될 수 있다.)
+        node = target_linked_list.findNodeByKey(key)[0]
+        if node is not None:
+            node.value = value
+        else:
+            target_linked_list._addNodeBack(NodeKV(key, value))
+            self._length += 1
+
+        # 해시 테이블 크기 자동 재조정
+        self.autoResize()
+
+    def addDataAll(self, new_dataset: list[Item]) -> (None):
+        """여러 데이터들을 한꺼번에 해시 테이블에 삽입한다.
+
+        데이터마다 addData()를 호출하지 않고, 데이터 수만큼 테이블 크기를 
+        미리 한 번에 늘린 뒤 모든 키를 한 번에 해싱하여 버킷별로 묶는다. 
+        각 버킷은 한 번씩만 순회한다. 
+        같은 배치 내에 같은 키가 여러 번 있으면 마지막 값이 저장된다.
+
+        Parameters
+        ----------
+        new_dataset : list[(key, value)]
+            삽입할 데이터 목록. 키는 hashable 해야 한다.
+
+        """
+        new_dataset = list(new_dataset)
+        self.__reserve(self._length + len(new_dataset))
+
+        hash_func, size = self._hash_func, self.size
+        groups: dict[int, list[Item]] = {}
+        for kv in new_dataset:
+            index = hash_func(kv[0]) % size
+            if index in groups:
+                groups[index].append(kv)
+            else:
+                groups[index] = [kv]
+
+        for index, items in groups.items():
+            target_ll = self.buckets[index]
+            nodes = {node.key: node for node in target_ll}
+            for key, value in items:
+                node = nodes.get(key)
+                if node is not None:
+                    node.value = value
+                    continue
+                node = NodeKV(key, value)
+                target_ll._addNodeBack(node)
+                nodes[key] = node
+                self._length += 1
+
+    def findDataMany(self, keys: list[Key]) -> (list[Value]):
+        """여러 키에 대응되는 값들을 한꺼번에 찾아 키의 순서대로 반환. 
+        존재하지 않는 키의 자리에는 None을 반환한다. 
+
+        재해싱은 처음에 한 번만 마무리하고, 키마다 findData()를 호출하는 
+        대신 한 번의 순회로 해싱과 버킷 탐색을 함께 처리한다. 
+        (버킷의 연결 리스트가 짧으므로 키를 버킷별로 묶는 비용이 
+        오히려 더 크다.)
+        """
+        self._finishRehash()
+        hash_func, size, buckets = self._hash_func, self.size, self.buckets
+        result: list[Value] = []
+        for key in keys:
+            node = buckets[hash_func(key) % size].head_pointer
+            while node is not None:
+                if node.key == key:
+                    break
+                node = node.pointer
+            result.append(None if node is None else node.value)
+        return result
+
+    def removeDataMany(self, target_keys: list[Key]) -> (None):
+        """여러 키와 일치하는 키-값 데이터들을 한꺼번에 삭제. 
+
+        모든 키를 한 번에 해싱하여 버킷별로 묶은 뒤, 
+        각 버킷은 한 번씩만 순회하면서 삭제할 노드들을 떼어낸다. 
+        키는 hashable 해야 한다.
+        """
+        target_keys = list(target_keys)
+        self._finishRehash()
+        for index, positions in self.__groupByBucket(target_keys).items():
+            keys_to_remove = {target_keys[pos] for pos in positions}
+            target_ll = self.buckets[index]
+            prev_node = None
+            node = target_ll.head_pointer
+            while node:
+                next_node = node.pointer
+                if node.key in keys_to_remove:
+                    if prev_node is None:
+                        target_ll.head_pointer = next_node
+                    else:
+                        prev_node.pointer = next_node
+                    node.pointer = None
+                    target_ll.length -= 1
+                    self._length -= 1
+                else:
+                    prev_node = node
+                node = next_node
+            target_ll.tail_pointer = prev_node
+
+    def __groupByBucket(self, keys: list[Key]) -> (dict[int, list[int]]):
+        """키 목록을 한 번에 해싱하여, 버킷 인덱스별 키의 위치 목록을 반환."""
+        hash_func, size = self._hash_func, self.size
+        groups: dict[int, list[int]] = {}
+        for pos, key in enumerate(keys):
+            index = hash_func(key) % size
+            if index in groups:
+                groups[index].append(pos)
+            else:
+                groups[index] = [pos]
+        return groups
+
+    def __reserve(self, expected_length: int) -> (None):
+        """expected_length개의 데이터를 저장해도 부하율을 넘지 않도록 
+        테이블 크기를 한 번에 늘린다. 
+        진행 중인 재해싱도 이 때 모두 끝낸다.
+        """
+        new_size = self.getHTSize()
+        while new_size * self.load_factor <= expected_length:
+            new_size = 2 * new_size + 1
+
+        if new_size != self.size:
+            self._finishRehash()
+            self._old_buckets = self.buckets
+            self._rehash_index = 0
+            self.size = new_size
+            self.buckets = [LinkedList() for _ in range(new_size)]
+            self.threshold = self.size * self.load_factor
+        self._finishRehash()
+
+    def removeData(self, target_key: Key) -> (None):
+        """지정된 키와 일치하는 키-값 데이터 삭제."""
+        self._rehashStep()
+        target_lls = [self.buckets[self.hashKey(target_key)]]
+        old_ll = self.__findOldBucket(target_key)
+        if old_ll is not None:
+            target_lls.append(old_ll)
+
+        for target_ll in target_lls:
+            prev_length = target_ll.getLength()
+            target_ll.deleteNodeByKey(target_key)
+            self._length -= prev_length - target_ll.getLength()
+
+    def findData(self, key: Key) -> (Value):
+        """주어진 key에 대응되는 값을 반환."""
+        self._rehashStep()
+        index = self.hashKey(key)
+        target_linked_list = self.buckets[index]
+        node = target_linked_list.findNodeByKey(key)[0]
+        if node is not None:
+            return node.value
+
+        old_ll = self.__findOldBucket(key)
+        if old_ll is None:
+            return None
+        return old_ll.getValueByKey(key)
+
+    def getLength(self) -> (int):
+        """현재 저장된 데이터 수 반환. 
+        해시테이블의 전체 크기를 반환하는 것이 아니라, 
+        빈 버킷은 제외하고 기존 데이터의 수만 계산하여 반환. 
+        삽입, 삭제 시마다 갱신되는 값을 반환하므로 O(1)이다.
+        """
+        return self._length
+
+    def getHTSize(self) -> (int):
+        """현재 해시테이블의 크기 반환."""
+        self.size = len(self.buckets)
+        return self.size
+
+    def isRehashing(self) -> (bool):
+        """현재 점진적 재해싱이 진행 중인지 확인."""
+        return self._old_buckets is not None
+
+    def printCurrentHT(self) -> (None):
+        """
+        현재 해시테이블에 저장된 데이터 구조 출력.
+        해시 충돌로 인해 한 버킷에 여러 노드가 연결되어 있는 상태도
+        보여줘야 함.
+        """
+        self._finishRehash()
+        for i, ll in enumerate(self.buckets):
+            print(f"index: {i}, in a bucket: {ll}")
+
+    def clear(self) -> (None):
+        """해시 테이블을 모두 비운다.
+        즉, 모든 데이터를 지운다.
+        """
+        for ll in self.__iterBuckets():
+            ll.clear()
+        self._old_buckets = None
+        self._rehash_index = 0
+        self._length = 0
+
+    def autoResize(self) -> (None):
+        """해시 테이블의 크기를 재조정함.
+
+        저장된 데이터의 수가 부하율을 넘으면 두 배 + 1 크기의 새 테이블을 만들고
+        점진적 재해싱을 시작한다. 기존 데이터를 한꺼번에 옮기지 않고, 
+        이후의 삽입, 삭제, 검색 연산마다 최대 `rehash_step`개의 버킷씩 
+        나누어 옮기므로 하나의 연산이 오래 멈추지 않는다.
+        """
+        if self.threshold > self._length:
+            # 저장된 데이터의 수가 해시 테이블의 전체 크기 대비
+            # 부하율을 넘지 않은 경우, 아무런 작업도 하지 않음.
+            return
+
+        # 이전 재해싱이 아직 끝나지 않았다면 마저 끝낸다.
+        self._finishRehash()
+
+        new_size = 2 * self.getHTSize() + 1
+        self._old_buckets = self.buckets
+        self._rehash_index = 0
+        self.size = new_size
+        self.buckets = [LinkedList() for _ in range(new_size)]
+        self.threshold = self.size * self.load_factor
+
+    def _rehashStep(self, n_buckets: int | None = None) -> (None):
+        """기존 테이블의 버킷을 최대 n_buckets개만큼 새 테이블로 옮긴다.
+        n_buckets를 지정하지 않으면 `rehash_step`개를 옮긴다. 
+        모든 버킷을 옮기면 재해싱을 종료한다.
+        """
+        if self._old_buckets is None:
+            return
+        if n_buckets is None:
+            n_buckets = self.rehash_step
+
+        end_index = min(self._rehash_index + n_buckets, len(self._old_buckets))
+        for i in range(self._rehash_index, end_index):
+            old_ll = self._old_buckets[i]
+            # 노드 객체를 새로 만들지 않고 그대로 새 버킷에 다시 연결한다.
+            # 키는 이미 고유하므로 중복 키 검사도 필요 없다.
+            node = old_ll.head_pointer
+            while node:
+                next_node = node.pointer
+                node.pointer = None
+                self.buckets[self.hashKey(node.key)]._addNodeBack(node)
+                node = next_node
+            old_ll.head_pointer = None
+            old_ll.tail_pointer = None
+            old_ll.length = 0
+            self._old_buckets[i] = None
+        self._rehash_index = end_index
+
+        if self._rehash_index >= len(self._old_buckets):
+            self._old_buckets = None
+            self._rehash_index = 0
+
+    def _finishRehash(self) -> (None):
+        """진행 중인 재해싱을 한 번에 끝낸다."""
+        if self._old_buckets is not None:
+            self._rehashStep(len(self._old_buckets))
+
+    def checkHashCollision(
+            self,
+            detail: bool = False
+        ) -> (tuple[bool, int, int] | dict):
+        """현재 해시 테이블에 해시 충돌이 일어났는지 확인. 
+        한 버킷의 연결리스트의 노드가 둘 이상일 경우 해시 충돌이 일어난 것임. 
+        현재 해시 테이블에서 한 버킷이 최대로 가지는 노드 수도 같이 반환.
+
+        Parameters
+        ----------
+        detail : bool, default False
+            True 시 해시 함수 간 비교를 위한 상세 충돌 통계를 dict로 반환.
+
+        Returns
+        -------
+        (bool, col_depth, no_buckets) 
+            (해시 충돌 여부, 버킷 당 최대 연결리스트 길이, 해시 충돌난 버킷의 수)
+        dict
+            detail=True 시 반환. 
+            is_collision, max_depth, collided_buckets : 위 튜플과 같음.
+            empty_buckets : 비어있는 버킷의 수.
+            colliding_items : 충돌난 버킷에 저장된 데이터의 수.
+            load_factor : 현재 저장된 데이터 수 / 해시테이블 크기.
+            avg_chain_length : 비어있지 않은 버킷들의 평균 연결리스트 길이.
+            hash_method : 사용 중인 해시 함수.
+        
+        """
+        self._finishRehash()
+        depth_of_buckets = []
+        is_collision = False
+        for ll in self.buckets:
+            ll_length = ll.getLength()
+            if ll_length > 1:
+                is_collision = True
+            depth_of_buckets.append(ll_length)
+        no_buckets = 0
+        no_buckets = sum(map(lambda x: 1 if x > 1 else 0, depth_of_buckets))
+        if not detail:
+            return (is_collision, max(depth_of_buckets), no_buckets)
+
+        used_buckets = len(depth_of_buckets) - depth_of_buckets.count(0)
+        return {
+            'is_collision': is_collision,
+            'max_depth': max(depth_of_buckets),
+            'collided_buckets': no_buckets,
+            'empty_buckets': depth_of_buckets.count(0),
+            'colliding_items': sum(x for x in depth_of_buckets if x > 1),
+            'load_factor': self._length / self.getHTSize(),
+            'avg_chain_length': self._length / used_buckets if used_buckets else 0,
+            'hash_method': self.hash_method,
+        }
+
+
+def compare_hash_methods(
+        keys: list[Key],
+        size: int,
+        hash_methods: list[str | HashFunc] | None = None
+    ) -> (dict):
+    """같은 키 집합을 여러 해시 함수로 해시 테이블에 삽입해보고, 
+    각 해시 함수의 상세 충돌 통계를 반환. 
+
+    Parameters
+    ----------
+    keys : list[Key]
+        비교에 사용할 키 목록.
+    size : int
+        비교에 사용할 해시 테이블의 초기 크기.
+    hash_methods : list[str | callable] | None, default None
+        비교할 해시 함수 목록. None이면 HashMethod의 모든 해시 함수를 비교한다.
+
+    Returns
+    -------
+    dict[hash_method, dict]
+        해시 함수별 checkHashCollision(detail=True)의 결과.
+
+    """
+    if hash_methods is None:
+        hash_methods = [
+            HashMethod.DIGIT_FOLDING, HashMethod.BUILTIN,
+            HashMethod.FNV1A, HashMethod.MULTIPLICATIVE,
+        ]
+    result = {}
+    for hash_method in hash_methods:
+        ht = HashTable(size, hash_method)
+        for key in keys:
+            ht.addData((key, None))
+        result[hash_method] = ht.checkHashCollision(detail=True)
+    return result
+
+
+# 출력 테스트 모음
+def print_borderline(func: callable):
+    def wrapper(*args, **kwargs):
+        print("=============================")
+        result = func(*args, **kwargs)
+        print("=============================")
+        return result
+    return wrapper
+
+@print_borderline
+def print_hashtable_test(dataset: list[tuple], size: int):
+    ht = HashTable(size)
+    ht.addDataAll(dataset)
+    ht.printCurrentHT()
+    print(ht.checkHashCollision())
+    print(ht.getHTSize())
+
+@print_borderline
+def print_hashtable_with_bigger_size_test(
+        old_dataset: list[tuple],
+        old_size: int,
+        new_dataset: list[tuple]
+        ):
+    ht = HashTable(old_size)
+    ht.addDataAll(old_dataset)
+    ht.printCurrentHT()
+    print(f"현재 해시테이블 크기: {ht.getHTSize()}")
+    print(f"현재 저장된 데이터 수: {ht.getLength()}")
+    print("===========")
+
+    ht.addDataAll(new_dataset)
+    ht.printCurrentHT()
+    print(f"현재 해시테이블 크기: {ht.getHTSize()}")
+    print(f"현재 저장된 데이터 수: {ht.getLength()}")
+
+
+if __name__ == '__main__':
+    data_set = [
+        ("사과", "apple"),
+        ("바나나", "banana"),
+        ("딸기", "strawberry"),
+        ("오렌지", "orange"),
+        ("포도", "grape"),
+        ("꽃", "flower"),
+        ("나무", "tree"),
+        ("바다", "sea"),
+        ("별", "star"),
+        ("햇님", "sun")
+    ]
+    # 원하는 테스트 코드의 주석만 해제하여 실행.
+    #print_hashtable_test(dataset, 10)
+    #print_hashtable_test(dataset, 23)
+    #print_hashtable_test(dataset, 47)
+    #print_hashtable_test(dataset, 64)
+    #print_hashtable_test(dataset, 100) # 해시 충돌 없음.
+
+    new_data_set = [
+        ("코딩", "coding"),
+        ("밤바다", "night sea"),
+        ("공기", "air"),
+        ("공깃밥", "rice"),
+        ("디버그", "debug"),
+        ("에너지", "energy"),
+    ]
+    print_hashtable_with_bigger_size_test(data_set, 2*len(data_set)+1, new_data_set)
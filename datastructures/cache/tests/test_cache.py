@@ -0,0 +1,228 @@
+import unittest
+import sys
+
+from dirimporttool import get_super_dir_directly
+for i in range(1, 3):
+    super_dir = get_super_dir_directly(__file__, i)
+    sys.path.append(super_dir)
+
+from cache.my_cache import LRUCache, LFUCache, TTLCache, memoize
+
+
+class FakeTimer():
+    """TTLCache 테스트용 가짜 시계."""
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLRUCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = LRUCache(3)
+
+    def testEmpty(self):
+        """
+        빈 캐시 테스트.
+        """
+        self.assertEqual(self.cache.getLength(), 0)
+        self.assertEqual(self.cache.get('a'), None)
+        self.assertEqual(self.cache.get('a', 0), 0)
+        self.assertEqual(self.cache.getStats()['misses'], 2)
+        with self.assertRaises(ValueError):
+            LRUCache(0)
+
+    def testEviction(self):
+        """
+        가장 오래 전에 사용된 데이터가 제거되는지 테스트.
+        """
+        for key in 'abc':
+            self.cache.put(key, key.upper())
+        self.assertEqual(self.cache.get('a'), 'A')  # 사용 순서: b, c, a
+
+        self.cache.put('d', 'D')  # b 제거
+        self.assertNotIn('b', self.cache)
+        self.assertEqual(self.cache.get('b'), None)
+        self.assertEqual(self.cache.__repr__(), str([('d', 'D'), ('a', 'A'), ('c', 'C')]))
+
+        self.cache.put('c', 'CC')  # 기존 키 수정 시에는 제거가 일어나지 않음.
+        self.cache.put('e', 'E')   # a 제거
+        self.assertEqual(self.cache.__repr__(), str([('e', 'E'), ('c', 'CC'), ('d', 'D')]))
+        self.assertEqual(self.cache.getLength(), 3)
+
+        stats = self.cache.getStats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['evictions'], 2)
+
+    def testRemoveAndClear(self):
+        """
+        데이터 제거 및 캐시 비우기 테스트.
+        """
+        self.cache.put('a', 1)
+        self.cache.remove('a')
+        self.cache.remove('없는 키')
+        self.assertEqual(self.cache.getLength(), 0)
+        self.cache.put('a', 1)
+        self.cache.put('b', 2)
+        self.cache.clear()
+        self.assertEqual(self.cache.getLength(), 0)
+        self.assertEqual(self.cache.get('a'), None)
+
+
+class TestLFUCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = LFUCache(3)
+
+    def testEviction(self):
+        """
+        사용 횟수가 가장 적은 데이터가 제거되는지 테스트.
+        사용 횟수가 같으면 가장 오래 전에 사용된 데이터가 제거된다.
+        """
+        for key in 'abc':
+            self.cache.put(key, key.upper())
+        self.cache.get('a')
+        self.cache.get('a')
+        self.cache.get('b')
+        # 사용 횟수: a=3, b=2, c=1
+        self.cache.put('d', 'D')  # c 제거
+        self.assertNotIn('c', self.cache)
+
+        self.cache.get('d')
+        # 사용 횟수: a=3, b=2, d=2 -> b가 d보다 오래 전에 사용됨.
+        self.cache.put('e', 'E')  # b 제거
+        self.assertNotIn('b', self.cache)
+        self.assertIn('d', self.cache)
+        self.assertEqual(self.cache.get('a'), 'A')
+        self.assertEqual(self.cache.getStats()['evictions'], 2)
+
+    def testRemove(self):
+        """
+        데이터 제거 후에도 올바른 데이터가 제거 대상이 되는지 테스트.
+        """
+        for key in 'abc':
+            self.cache.put(key, key.upper())
+        self.cache.get('b')
+        self.cache.get('c')
+        self.cache.remove('a')
+        # 사용 횟수: b=2, c=2
+        self.cache.get('c')
+        self.cache.put('d', 'D')
+        self.cache.put('e', 'E')  # d 제거 (사용 횟수 1)
+        self.assertEqual(self.cache.getLength(), 3)
+        self.assertNotIn('d', self.cache)
+        self.assertIn('b', self.cache)
+
+        self.cache.clear()
+        self.assertEqual(self.cache.getLength(), 0)
+        self.cache.put('a', 1)
+        self.assertEqual(self.cache.get('a'), 1)
+
+
+class TestTTLCache(unittest.TestCase):
+    def setUp(self):
+        self.timer = FakeTimer()
+        self.cache = TTLCache(3, ttl=10, timer=self.timer)
+
+    def testExpiration(self):
+        """
+        ttl이 지난 데이터가 만료되는지 테스트.
+        """
+        self.cache.put('a', 1)
+        self.timer.now = 5
+        self.cache.put('b', 2)
+        self.assertEqual(self.cache.get('a'), 1)
+
+        self.timer.now = 10
+        self.assertEqual(self.cache.get('a'), None)
+        self.assertNotIn('a', self.cache)
+        self.assertEqual(self.cache.get('b'), 2)
+
+        stats = self.cache.getStats()
+        self.assertEqual(stats['expirations'], 1)
+        self.assertEqual(stats['hits'], 2)
+        self.assertEqual(stats['misses'], 1)
+
+    def testPurgeExpired(self):
+        """
+        용량이 가득 찼을 때 만료된 데이터부터 정리하는지 테스트.
+        """
+        self.cache.put('a', 1)
+        self.cache.put('b', 2)
+        self.timer.now = 5
+        self.cache.put('c', 3)
+        self.timer.now = 12
+        self.cache.put('d', 4)  # a, b 만료
+        self.assertEqual(self.cache.getLength(), 2)
+        self.assertEqual(self.cache.get('c'), 3)
+        self.assertEqual(self.cache.getStats()['evictions'], 0)
+        self.assertEqual(self.cache.getStats()['expirations'], 2)
+
+
+    def testPutWhenFull(self):
+        """
+        용량을 넘겨 저장할 때 만료되지 않은 데이터는 LRU 순서로만 제거되는지 테스트.
+        """
+        cache = TTLCache(100, ttl=10, timer=self.timer)
+        for i in range(100):
+            cache.put(i, i)
+        cache.get(0)
+        self.timer.now = 5
+        for i in range(100, 150):
+            cache.put(i, i)
+        self.assertEqual(cache.getLength(), 100)
+        self.assertEqual(cache.get(0), 0)
+        self.assertNotIn(1, cache)
+        self.assertEqual([cache.get(i) for i in range(51, 150)], list(range(51, 150)))
+        stats = cache.getStats()
+        self.assertEqual(stats['evictions'], 50)
+        self.assertEqual(stats['expirations'], 0)
+
+        # 맨 뒤쪽의 만료된 데이터(0, 51~99)만 정리하고, 만료되지 않은 데이터는 유지.
+        self.timer.now = 12
+        cache.put('new', 1)
+        self.assertEqual(cache.getLength(), 51)
+        self.assertEqual(cache.getStats()['evictions'], 50)
+        self.assertEqual(cache.getStats()['expirations'], 50)
+        self.assertEqual([cache.get(i) for i in range(100, 150)], list(range(100, 150)))
+
+class TestMemoize(unittest.TestCase):
+    def testMemoize(self):
+        """
+        같은 인자로 호출 시 함수를 다시 실행하지 않는지 테스트.
+        """
+        calls = []
+
+        @memoize(LRUCache(2))
+        def add(a, b=0):
+            calls.append((a, b))
+            return a + b
+
+        self.assertEqual(add(1, b=2), 3)
+        self.assertEqual(add(1, b=2), 3)
+        self.assertEqual(add(1), 1)
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(add.cache.getStats()['hits'], 1)
+
+        add(2)  # (1, b=2) 제거
+        add(1, b=2)
+        self.assertEqual(len(calls), 4)
+
+
+    def testMemoizeKeywordCollision(self):
+        """
+        위치 인자만으로 키워드 인자 호출과 같은 키를 만들 수 없는지 테스트.
+        """
+        @memoize(LRUCache(4))
+        def args_of(*args, **kwargs):
+            return (args, kwargs)
+
+        self.assertEqual(args_of(1, 2, x=3), ((1, 2), {'x': 3}))
+        self.assertEqual(
+            args_of((1, 2), (('x', 3),)), (((1, 2), (('x', 3),)), {})
+        )
+        self.assertEqual(args_of.cache.getStats()['hits'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,245 @@
+"""해시 테이블의 데이터를 바이너리 파일로 저장하고,
+저장된 파일을 mmap으로 열어 재구성 없이 바로 검색하는 기능 구현.
+
+파일 구조 (모든 정수는 little-endian)
+------------------------------------
+header : magic(8 bytes) | n_slots(u64) | n_items(u64)
+slots  : n_slots개의 (key_hash(u64), record_offset(u64))
+         개방 주소법(선형 탐사)으로 배치한 색인. record_offset이 0이면 빈 칸.
+records: (key_len(u32), value_len(u32), key_bytes, value_bytes)의 나열.
+         키와 값은 pickle로 직렬화한다.
+
+키의 해시값은 직렬화된 키 바이트열의 blake2b 해시이므로,
+저장한 프로세스와 여는 프로세스가 달라도 항상 같은 값이 나온다.
+키는 직렬화한 바이트열이 같아야 같은 키로 취급된다. frozenset 키(및 frozenset을
+포함한 키)는 원소 순서를 정렬하여 직렬화하므로 문제없지만, 1과 1.0, True처럼
+값은 같아도 타입이 다른 키나, 직렬화 결과가 해시 시드에 따라 달라지는
+사용자 정의 객체 키는 서로 다른 키로 취급되거나 검색되지 않을 수 있다.
+"""
+import io
+import mmap
+import pickle
+import struct
+import sys
+from array import array
+from hashlib import blake2b
+
+__all__ = [
+    'save_snapshot',
+    'MappedHashTable',
+]
+
+# type alias
+Key = object
+Value = object
+Item = tuple[Key, Value]
+
+_MAGIC = b'HTSNAP01'
+_HEADER = struct.Struct('<8sQQ')
+_SLOT = struct.Struct('<QQ')
+_RECORD_HEADER = struct.Struct('<II')
+# 선형 탐사의 탐사 길이를 짧게 유지하기 위해 색인의 부하율을 낮게 잡는다.
+_SLOT_LOAD_FACTOR = 0.5
+
+
+# 직렬화 결과가 항상 같은 타입. 이 타입의 키는 빠른 C 구현의 pickle을 그대로 쓴다.
+_ATOMIC_KEY_TYPES = frozenset([type(None), bool, int, float, complex, str, bytes])
+
+
+class _KeyPickler(pickle._Pickler):
+    """키를 항상 같은 바이트열로 직렬화하는 Pickler.
+
+    frozenset은 원소의 순회 순서가 PYTHONHASHSEED와 삽입 순서에 따라 달라지므로,
+    원소들을 각자의 직렬화 결과 순으로 정렬한 튜플로 바꾸어 직렬화한다.
+    (중첩된 frozenset에도 재귀적으로 적용된다.)
+    또한 memo를 사용하지 않도록 하여, 같은 객체가 여러 번 등장하는지 여부에 따라
+    직렬화 결과가 달라지지 않게 한다.
+    C 구현의 Pickler는 frozenset에 대해 reducer_override()를 호출하지 않으므로
+    파이썬 구현을 상속한다.
+    """
+    def __init__(self, file) -> (None):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.fast = True
+
+    def reducer_override(self, obj):
+        if type(obj) is frozenset:
+            return (frozenset, (tuple(sorted(obj, key=_dumpKey)),))
+        return NotImplemented
+
+
+def _dumpKey(key: Key) -> (bytes):
+    if type(key) in _ATOMIC_KEY_TYPES:
+        return pickle.dumps(key, protocol=pickle.HIGHEST_PROTOCOL)
+    buffer = io.BytesIO()
+    _KeyPickler(buffer).dump(key)
+    return buffer.getvalue()
+
+
+def _hashKeyBytes(key_bytes: bytes) -> (int):
+    return int.from_bytes(blake2b(key_bytes, digest_size=8).digest(), 'little')
+
+
+def save_snapshot(table, path: str) -> (None):
+    """해시 테이블에 저장된 모든 데이터를 path 경로의 바이너리 파일로 저장.
+
+    Parameters
+    ----------
+    table : HashTable | OpenAddressingHashTable
+        getAllData() 메서드를 가진 해시 테이블 객체.
+    path : str
+        저장할 파일 경로. 이미 존재하면 덮어쓴다.
+
+    See Also
+    --------
+    MappedHashTable : 저장된 파일을 mmap으로 열어 검색하는 클래스.
+
+    """
+    all_data = table.getAllData()
+    n_items = len(all_data)
+    n_slots = int(n_items / _SLOT_LOAD_FACTOR) + 1
+    # 색인: 칸마다 (key_hash, record_offset)를 나란히 저장.
+    slots = array('Q', bytes(2 * 8 * n_slots))
+    records_start = _HEADER.size + _SLOT.size * n_slots
+
+    with open(path, 'wb') as f:
+        f.write(_HEADER.pack(_MAGIC, n_slots, n_items))
+        f.seek(records_start)
+        offset = records_start
+        for key, value in all_data:
+            key_bytes = _dumpKey(key)
+            value_bytes = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            key_hash = _hashKeyBytes(key_bytes)
+
+            index = key_hash % n_slots
+            while slots[2 * index + 1] != 0:
+                index = (index + 1) % n_slots
+            slots[2 * index] = key_hash
+            slots[2 * index + 1] = offset
+
+            f.write(_RECORD_HEADER.pack(len(key_bytes), len(value_bytes)))
+            f.write(key_bytes)
+            f.write(value_bytes)
+            offset += _RECORD_HEADER.size + len(key_bytes) + len(value_bytes)
+
+        if sys.byteorder == 'big':
+            slots.byteswap()
+        f.seek(_HEADER.size)
+        f.write(slots.tobytes())
+
+
+class MappedHashTable():
+    """save_snapshot()으로 저장한 파일을 mmap으로 열어 읽기 전용으로 검색하는 클래스.
+
+    파일을 열 때 데이터를 다시 삽입하거나 해싱하지 않으며,
+    검색 시 필요한 부분만 운영체제가 페이지 단위로 읽어온다.
+    pickle을 사용하므로 신뢰할 수 있는 파일만 열어야 한다.
+    """
+    def __init__(self, path: str) -> (None):
+        """
+        Parameters
+        ----------
+        path : str
+            save_snapshot()으로 저장한 파일 경로.
+
+        Raises
+        ------
+        ValueError
+            해당 파일이 스냅샷 파일 형식이 아닌 경우.
+
+        """
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # 빈 파일은 mmap으로 열 수 없다.
+            self._file.close()
+            raise ValueError(f"스냅샷 파일이 아닙니다: {path}")
+
+        if len(self._mm) < _HEADER.size:
+            self.close()
+            raise ValueError(f"스냅샷 파일이 아닙니다: {path}")
+        magic, self._n_slots, self._n_items = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC:
+            self.close()
+            raise ValueError(f"스냅샷 파일이 아닙니다: {path}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> (None):
+        """mmap과 파일을 닫는다."""
+        if not self._mm.closed:
+            self._mm.close()
+        self._file.close()
+
+    def __readRecord(self, offset: int) -> (tuple[bytes, int, int]):
+        """offset 위치의 레코드에서 (키 바이트열, 값의 시작 위치, 값의 길이) 반환."""
+        key_len, value_len = _RECORD_HEADER.unpack_from(self._mm, offset)
+        key_start = offset + _RECORD_HEADER.size
+        value_start = key_start + key_len
+        return (self._mm[key_start:value_start], value_start, value_len)
+
+    def __findRecord(self, key: Key) -> (tuple[int, int] | None):
+        """주어진 키의 값이 저장된 (시작 위치, 길이)를 반환. 없으면 None."""
+        if self._n_slots == 0:
+            return None
+        key_bytes = _dumpKey(key)
+        key_hash = _hashKeyBytes(key_bytes)
+        index = key_hash % self._n_slots
+        while True:
+            slot_hash, offset = _SLOT.unpack_from(
+                self._mm, _HEADER.size + _SLOT.size * index
+            )
+            if offset == 0:
+                return None
+            if slot_hash == key_hash:
+                stored_key, value_start, value_len = self.__readRecord(offset)
+                if stored_key == key_bytes:
+                    return (value_start, value_len)
+            index = (index + 1) % self._n_slots
+
+    def findData(self, key: Key) -> (Value):
+        """주어진 key에 대응되는 값을 반환. 없으면 None 반환.
+
+        키는 pickle로 직렬화한 결과가 같아야 같은 키로 취급된다.
+        frozenset은 원소를 정렬하여 직렬화하므로 다른 프로세스에서도 검색되지만,
+        1과 1.0, True처럼 같다고 비교되더라도 타입이 다른 키는 서로 다른 키이다.
+        set 등을 상태로 가지는 사용자 정의 객체는 __reduce__()의 결과가
+        프로세스마다 같음이 보장되는 경우에만 키로 사용할 수 있다.
+        """
+        location = self.__findRecord(key)
+        if location is None:
+            return None
+        value_start, value_len = location
+        return pickle.loads(self._mm[value_start:value_start + value_len])
+
+    def findDataMany(self, keys: list[Key]) -> (list[Value]):
+        """여러 키에 대응되는 값들을 키의 순서대로 반환.
+        존재하지 않는 키의 자리에는 None을 반환한다.
+        """
+        return [self.findData(key) for key in keys]
+
+    def getAllData(self) -> (list[Item]):
+        """파일에 저장된 모든 데이터를 저장된 순서대로 반환."""
+        all_data = []
+        offset = _HEADER.size + _SLOT.size * self._n_slots
+        for _ in range(self._n_items):
+            key_bytes, value_start, value_len = self.__readRecord(offset)
+            all_data.append((
+                pickle.loads(key_bytes),
+                pickle.loads(self._mm[value_start:value_start + value_len])
+            ))
+            offset = value_start + value_len
+        return all_data
+
+    def getLength(self) -> (int):
+        """저장된 데이터 수 반환."""
+        return self._n_items
+
+    def getHTSize(self) -> (int):
+        """색인의 크기(총 칸 수) 반환."""
+        return self._n_slots
@@ -0,0 +1,331 @@
+"""개방 주소법(open addressing)을 이용한 해시 테이블 구현.
+
+HashTable이 버킷마다 연결 리스트와 노드 객체를 두는 것과 달리,
+키, 값, 해시값을 각각 하나의 평평한(flat) 배열에 나란히 저장한다.
+해시 충돌은 선형 탐사(linear probing)로 해결하며,
+삭제된 칸은 묘비(tombstone)로 표시한다.
+"""
+from array import array
+
+try:
+    from my_hash_table import HashMethod, HashFunc
+except ModuleNotFoundError:
+    from hash_table.my_hash_table import HashMethod, HashFunc
+
+__all__ = [
+    'OpenAddressingHashTable',
+]
+
+# type alias
+Key = object
+Value = object
+Item = tuple[Key, Value]
+
+_MASK_64 = 0xffffffffffffffff
+
+
+class _Slot():
+    """빈 칸, 삭제된 칸을 나타내는 표식 객체."""
+
+    def __init__(self, name: str) -> (None):
+        self.name = name
+
+    def __repr__(self):
+        return self.name
+
+
+_EMPTY = _Slot("<empty>")
+_DELETED = _Slot("<deleted>")
+
+
+class OpenAddressingHashTable():
+    """해시 함수: 선택한 해시 함수(기본값은 digit folding)와 division method 방식 사용.
+    해시 충돌 해결법: 선형 탐사(linear probing) 방식 사용.
+
+    HashTable과 같은 공개 메서드를 제공한다.
+    """
+    def __init__(
+            self,
+            size: int,
+            hash_method: str | HashFunc = HashMethod.DIGIT_FOLDING
+        ) -> (None):
+        """
+        Parameters
+        ----------
+        size : int
+            해시테이블 크기. (총 칸 수)
+        hash_method : str | callable, default HashMethod.DIGIT_FOLDING
+            키의 해시값을 계산할 해시 함수. HashMethod의 상수 중 하나 또는
+            키를 받아 정수를 반환하는 함수를 대입한다.
+
+        Attributes
+        ----------
+        self._keys : list
+            각 칸의 키. 빈 칸은 _EMPTY, 삭제된 칸은 _DELETED로 표시한다.
+        self._values : list
+            각 칸의 값.
+        self._hashes : array('Q')
+            각 칸에 저장된 키의 64bit 해시값.
+            탐사 시 키 비교 전에 먼저 비교하며, 재해싱 시 해시 함수를
+            다시 호출하지 않기 위해 사용한다.
+        self._length : int, default 0
+            현재 저장된 데이터의 수.
+        self._n_deleted : int, default 0
+            현재 묘비(tombstone)로 표시된 칸의 수.
+
+        """
+        self.size = size
+        self.hash_method = hash_method
+        self._hash_func: HashFunc = HashMethod.getFunction(hash_method)
+        # 선형 탐사는 부하율이 높아질수록 탐사 길이가 급격히 늘어나므로
+        # 체이닝 방식보다 낮은 부하율을 사용한다.
+        self.load_factor = 0.6
+        self.threshold = self.size * self.load_factor
+        self._length = 0
+        self._n_deleted = 0
+        self.__createHashTable(self.size)
+
+    def __createHashTable(self, size: int) -> (None):
+        """size 크기의 빈 배열들을 생성."""
+        self._keys: list = [_EMPTY] * size
+        self._values: list = [None] * size
+        self._hashes = array('Q', bytes(8 * size))
+
+    def hashKey(self, key: Key) -> (int):
+        """키의 해싱값 (숫자) 반환.
+        즉, 해당 키의 탐사를 시작할 칸의 인덱스이다.
+        """
+        return (self._hash_func(key) & _MASK_64) % self.size
+
+    def __probe(self, key: Key, hash_value: int) -> (tuple[int, int]):
+        """주어진 키를 탐사하여 (키가 있는 칸, 키를 새로 넣을 칸)을 반환.
+
+        Returns
+        -------
+        (found_index, insert_index)
+            found_index : 키가 저장된 칸의 인덱스. 없으면 -1.
+            insert_index : 키가 없을 때 새로 삽입할 칸의 인덱스.
+                탐사 도중 만난 첫 번째 묘비 또는 빈 칸이다.
+
+        """
+        keys = self._keys
+        hashes = self._hashes
+        size = self.size
+        index = hash_value % size
+        first_deleted = -1
+        while True:
+            slot_key = keys[index]
+            if slot_key is _EMPTY:
+                if first_deleted != -1:
+                    return (-1, first_deleted)
+                return (-1, index)
+            if slot_key is _DELETED:
+                if first_deleted == -1:
+                    first_deleted = index
+            elif hashes[index] == hash_value and \
+                (slot_key is key or slot_key == key):
+                return (index, -1)
+            index += 1
+            if index == size:
+                index = 0
+
+    def getAllData(self) -> (list[tuple]):
+        """해시 테이블 내 모든 데이터 반환.
+
+        Returns
+        -------
+        list[(key, value)]
+
+        """
+        return [
+            (key, value) for key, value in zip(self._keys, self._values)
+            if key is not _EMPTY and key is not _DELETED
+        ]
+
+    def addData(self, new_data: tuple) -> (None):
+        """해시 테이블에 새 키-값 데이터 삽입.
+        만약 기존의 키에 연결된 값을 바꾸기 위해
+        기존 키를 입력한 경우, 해당 칸의 값만 바꾼다.
+
+        Parameters
+        ----------
+        new_data : (key, value)
+
+        """
+        key, value = new_data
+        hash_value = self._hash_func(key) & _MASK_64
+        found_index, insert_index = self.__probe(key, hash_value)
+        if found_index != -1:
+            self._values[found_index] = value
+            return
+
+        if self._keys[insert_index] is _DELETED:
+            self._n_deleted -= 1
+        self._keys[insert_index] = key
+        self._values[insert_index] = value
+        self._hashes[insert_index] = hash_value
+        self._length += 1
+
+        # 해시 테이블 크기 자동 재조정
+        self.autoResize()
+
+    def addDataAll(self, new_dataset: list[Item]) -> (None):
+        """여러 데이터들을 한꺼번에 해시 테이블에 삽입한다.
+        데이터 수만큼 테이블 크기를 미리 한 번에 늘려
+        삽입 도중에는 재해싱이 일어나지 않도록 한다.
+        """
+        new_dataset = list(new_dataset)
+        expected_length = self._length + len(new_dataset)
+        new_size = self.size
+        while new_size * self.load_factor <= expected_length + self._n_deleted:
+            new_size = 2 * new_size + 1
+        if new_size != self.size:
+            self.__rehash(new_size)
+        for kv in new_dataset:
+            self.addData(kv)
+
+    def findDataMany(self, keys: list[Key]) -> (list[Value]):
+        """여러 키에 대응되는 값들을 한꺼번에 찾아 키의 순서대로 반환.
+        존재하지 않는 키의 자리에는 None을 반환한다.
+        """
+        hash_func, values = self._hash_func, self._values
+        result: list[Value] = []
+        for key in keys:
+            found_index = self.__probe(key, hash_func(key) & _MASK_64)[0]
+            result.append(None if found_index == -1 else values[found_index])
+        return result
+
+    def removeDataMany(self, target_keys: list[Key]) -> (None):
+        """여러 키와 일치하는 키-값 데이터들을 한꺼번에 삭제."""
+        for key in target_keys:
+            self.removeData(key)
+
+    def removeData(self, target_key: Key) -> (None):
+        """지정된 키와 일치하는 키-값 데이터 삭제.
+        해당 칸은 탐사가 끊기지 않도록 묘비(tombstone)로 표시한다.
+        """
+        hash_value = self._hash_func(target_key) & _MASK_64
+        found_index = self.__probe(target_key, hash_value)[0]
+        if found_index == -1:
+            return
+        self._keys[found_index] = _DELETED
+        self._values[found_index] = None
+        self._length -= 1
+        self._n_deleted += 1
+
+    def findData(self, key: Key) -> (Value):
+        """주어진 key에 대응되는 값을 반환. 없으면 None 반환."""
+        hash_value = self._hash_func(key) & _MASK_64
+        found_index = self.__probe(key, hash_value)[0]
+        if found_index == -1:
+            return None
+        return self._values[found_index]
+
+    def getLength(self) -> (int):
+        """현재 저장된 데이터 수 반환."""
+        return self._length
+
+    def getHTSize(self) -> (int):
+        """현재 해시테이블의 크기 반환."""
+        return self.size
+
+    def printCurrentHT(self) -> (None):
+        """현재 해시테이블의 각 칸에 저장된 데이터 출력."""
+        for i, (key, value) in enumerate(zip(self._keys, self._values)):
+            if key is _EMPTY or key is _DELETED:
+                print(f"index: {i}, in a slot: {key}")
+            else:
+                print(f"index: {i}, in a slot: {(key, value)}")
+
+    def clear(self) -> (None):
+        """해시 테이블을 모두 비운다.
+        즉, 모든 데이터를 지운다.
+        """
+        self.__createHashTable(self.size)
+        self._length = 0
+        self._n_deleted = 0
+
+    def autoResize(self) -> (None):
+        """해시 테이블의 크기를 재조정함.
+
+        데이터와 묘비가 차지하는 칸의 수가 부하율을 넘으면 재해싱한다.
+        묘비를 제외한 실제 데이터만으로도 부하율의 절반을 넘는 경우에만
+        테이블 크기를 두 배 + 1로 늘리고,
+        그렇지 않으면 같은 크기로 재해싱하여 묘비만 정리한다.
+        """
+        if self.threshold > self._length + self._n_deleted:
+            return
+
+        if self._length * 2 >= self.threshold:
+            new_size = 2 * self.size + 1
+        else:
+            new_size = self.size
+        self.__rehash(new_size)
+
+    def __rehash(self, new_size: int) -> (None):
+        """저장된 해시값을 이용해 모든 데이터를 new_size 크기의 새 배열로 옮긴다."""
+        old_keys, old_values, old_hashes = self._keys, self._values, self._hashes
+        self.size = new_size
+        self.threshold = self.size * self.load_factor
+        self.__createHashTable(new_size)
+        keys, values, hashes = self._keys, self._values, self._hashes
+
+        for key, value, hash_value in zip(old_keys, old_values, old_hashes):
+            if key is _EMPTY or key is _DELETED:
+                continue
+            # 새 배열에는 중복 키와 묘비가 없으므로 빈 칸만 찾으면 된다.
+            index = hash_value % new_size
+            while keys[index] is not _EMPTY:
+                index += 1
+                if index == new_size:
+                    index = 0
+            keys[index] = key
+            values[index] = value
+            hashes[index] = hash_value
+        self._n_deleted = 0
+
+    def checkHashCollision(self) -> (tuple[bool, int, int]):
+        """현재 해시 테이블에 해시 충돌이 일어났는지 확인.
+        데이터가 원래 해시값의 칸이 아닌 다른 칸에 저장되어 있으면
+        해시 충돌이 일어난 것임.
+
+        Returns
+        -------
+        (bool, max_probe, no_displaced)
+            (해시 충돌 여부, 데이터 당 최대 탐사 길이, 원래 칸에서 밀려난 데이터의 수)
+
+        """
+        max_probe = 0
+        no_displaced = 0
+        for index, (key, hash_value) in enumerate(zip(self._keys, self._hashes)):
+            if key is _EMPTY or key is _DELETED:
+                continue
+            probe_length = (index - hash_value % self.size) % self.size + 1
+            if probe_length > 1:
+                no_displaced += 1
+            max_probe = max(max_probe, probe_length)
+        return (no_displaced > 0, max_probe, no_displaced)
+
+
+if __name__ == '__main__':
+    import sys
+    from my_hash_table import HashTable
+
+    n = 100000
+    dataset = [(f"key{i}", i) for i in range(n)]
+
+    ht = HashTable(10, HashMethod.BUILTIN)
+    ht.addDataAll(dataset)
+    oa_ht = OpenAddressingHashTable(10, HashMethod.BUILTIN)
+    oa_ht.addDataAll(dataset)
+
+    # 버킷(연결 리스트)과 노드 객체가 차지하는 메모리를 대략적으로 비교.
+    chained_bytes = sys.getsizeof(ht.buckets)
+    for ll in ht.buckets:
+        chained_bytes += sys.getsizeof(ll) + sys.getsizeof(ll.__dict__)
+        for node in ll:
+            chained_bytes += sys.getsizeof(node)
+    oa_bytes = sys.getsizeof(oa_ht._keys) + sys.getsizeof(oa_ht._values) \
+        + sys.getsizeof(oa_ht._hashes)
+    print(f"HashTable: {chained_bytes / n:.1f} bytes/item")
+    print(f"OpenAddressingHashTable: {oa_bytes / n:.1f} bytes/item")
@@ -0,0 +1,132 @@
+"""키의 순서를 유지하는 해시 테이블 구현.
+
+HashTable로 키에 대응되는 값을 O(1)만에 찾고,
+AVLTree에 키를 함께 저장하여 키의 정렬 순서를 유지한다.
+최소, 최대, floor, ceiling 키 검색과 범위 검색을 O(log n)만에 할 수 있다.
+"""
+from typing import Generator
+
+from sub_modules.binarytree import AVLTree
+
+try:
+    from my_hash_table import HashTable, HashMethod, HashFunc
+except ModuleNotFoundError:
+    from hash_table.my_hash_table import HashTable, HashMethod, HashFunc
+
+__all__ = [
+    'OrderedHashTable',
+]
+
+# type alias
+Key = object
+Value = object
+Item = tuple[Key, Value]
+
+
+class OrderedHashTable(HashTable):
+    """키의 정렬 순서를 유지하는 HashTable.
+
+    HashTable의 모든 메서드를 그대로 사용할 수 있으며,
+    keys(), values(), items() 및 순회는 키의 오름차순으로 이루어진다.
+    키들은 서로 크기 비교가 가능해야 한다.
+    """
+    def __init__(
+            self,
+            size: int,
+            hash_method: str | HashFunc = HashMethod.DIGIT_FOLDING
+        ) -> (None):
+        """
+        Parameters
+        ----------
+        size : int
+            해시테이블 크기. (총 버킷 수)
+        hash_method : str | callable, default HashMethod.DIGIT_FOLDING
+            키의 해시값을 계산할 해시 함수. HashTable의 hash_method와 같다.
+
+        Attributes
+        ----------
+        self._tree : AVLTree
+            저장된 모든 키를 정렬된 상태로 보관하는 AVL 트리.
+
+        """
+        super().__init__(size, hash_method)
+        self._tree = AVLTree()
+
+    def addData(self, new_data: tuple) -> (None):
+        """해시 테이블에 새 키-값 데이터 삽입.
+        기존 키를 입력한 경우 해당 키의 값만 바꾼다.
+        """
+        key = new_data[0]
+        if self._getNode(key) is None:
+            # 키의 크기 비교가 불가능하면 여기서 예외가 발생하므로
+            # 해시 테이블에는 아무것도 삽입되지 않는다.
+            self._tree.insert(key)
+        super().addData(new_data)
+
+    def addDataAll(self, new_dataset: list[Item]) -> (None):
+        """여러 데이터들을 한꺼번에 해시 테이블에 삽입한다."""
+        new_dataset = list(new_dataset)
+        new_keys = dict.fromkeys(
+            key for key, _ in new_dataset if self._getNode(key) is None
+        )
+        for key in new_keys:
+            self._tree.insert(key)
+        super().addDataAll(new_dataset)
+
+    def removeData(self, target_key: Key) -> (None):
+        """지정된 키와 일치하는 키-값 데이터 삭제."""
+        if self._getNode(target_key) is not None:
+            self._tree.remove(target_key)
+        super().removeData(target_key)
+
+    def removeDataMany(self, target_keys: list[Key]) -> (None):
+        """여러 키와 일치하는 키-값 데이터들을 한꺼번에 삭제."""
+        target_keys = list(target_keys)
+        for key in dict.fromkeys(target_keys):
+            if self._getNode(key) is not None:
+                self._tree.remove(key)
+        super().removeDataMany(target_keys)
+
+    def clear(self) -> (None):
+        """해시 테이블을 모두 비운다."""
+        super().clear()
+        self._tree.clear()
+
+    def keys(self) -> (Generator[Key, None, None]):
+        """모든 키를 오름차순으로 하나씩 반환하는 제너레이터."""
+        for key in self._tree:
+            yield key
+
+    def values(self) -> (Generator[Value, None, None]):
+        """모든 값을 키의 오름차순으로 하나씩 반환하는 제너레이터."""
+        for key in self._tree:
+            yield self._getNode(key).value
+
+    def items(self) -> (Generator[Item, None, None]):
+        """모든 (key, value)를 키의 오름차순으로 하나씩 반환하는 제너레이터."""
+        for key in self._tree:
+            yield self._getNode(key).item
+
+    def range(self, low: Key, high: Key) -> (Generator[Item, None, None]):
+        """low 이상 high 미만인 키의 (key, value)들을
+        키의 오름차순으로 하나씩 반환하는 제너레이터.
+        반환하는 데이터의 수가 k일 때 O(log n + k)이다.
+        """
+        for key in self._tree.range(low, high):
+            yield self._getNode(key).item
+
+    def floor(self, key: Key) -> (Key | None):
+        """key 이하인 키들 중 가장 큰 키 반환. 없으면 None 반환."""
+        return self._tree.floor(key)
+
+    def ceiling(self, key: Key) -> (Key | None):
+        """key 이상인 키들 중 가장 작은 키 반환. 없으면 None 반환."""
+        return self._tree.ceiling(key)
+
+    def min(self) -> (Key | None):
+        """가장 작은 키 반환. 빈 해시 테이블이면 None 반환."""
+        return self._tree.getMin()
+
+    def max(self) -> (Key | None):
+        """가장 큰 키 반환. 빈 해시 테이블이면 None 반환."""
+        return self._tree.getMax()
@@ -0,0 +1,176 @@
+"""여러 스레드에서 동시에 사용할 수 있는 샤딩(sharding) 해시 테이블 구현.
+
+키 공간을 N개의 독립적인 HashTable(샤드)로 나누고, 샤드마다 별도의 락을 둔다.
+서로 다른 샤드에 대한 읽기, 쓰기 및 크기 재조정은 서로를 막지 않는다.
+"""
+import threading
+
+try:
+    from my_hash_table import HashTable, HashMethod, HashFunc, multiplicative_hash
+except ModuleNotFoundError:
+    from hash_table.my_hash_table import (
+        HashTable, HashMethod, HashFunc, multiplicative_hash
+    )
+
+__all__ = [
+    'ShardedHashTable',
+]
+
+# type alias
+Key = object
+Value = object
+Item = tuple[Key, Value]
+
+
+class ShardedHashTable():
+    """N개의 HashTable 샤드로 이루어진 스레드 안전(thread-safe) 해시 테이블.
+
+    각 샤드는 자신의 락과 자신의 autoResize()를 가진다.
+    여러 샤드에 걸친 메서드(getAllData, getLength 등)는 샤드를 하나씩 잠그며
+    진행하므로, 전체 테이블에 대한 한 시점의 스냅샷을 보장하지는 않는다.
+    """
+    def __init__(
+            self,
+            size: int,
+            n_shards: int = 16,
+            hash_method: str | HashFunc = HashMethod.DIGIT_FOLDING
+        ) -> (None):
+        """
+        Parameters
+        ----------
+        size : int
+            전체 해시테이블의 초기 크기. 각 샤드는 size // n_shards 크기로 시작한다.
+        n_shards : int, default 16
+            샤드의 수.
+        hash_method : str | callable, default HashMethod.DIGIT_FOLDING
+            각 샤드에서 사용할 해시 함수. HashTable의 hash_method와 같다.
+
+        Raises
+        ------
+        ValueError
+            n_shards가 1보다 작은 경우.
+
+        """
+        if n_shards < 1:
+            raise ValueError("샤드의 수는 1 이상이어야 합니다.")
+        self.n_shards = n_shards
+        self.hash_method = hash_method
+        self._hash_func: HashFunc = HashMethod.getFunction(hash_method)
+        shard_size = max(1, size // n_shards)
+        self._shards = [HashTable(shard_size, hash_method) for _ in range(n_shards)]
+        self._locks = [threading.Lock() for _ in range(n_shards)]
+
+    def getShardIndex(self, key: Key) -> (int):
+        """주어진 키가 저장될 샤드의 인덱스 반환.
+
+        샤드 내부의 버킷 인덱스도 같은 해시값으로 계산하므로,
+        해시값을 곱셈 해싱으로 한 번 더 섞어 두 인덱스가 서로 연관되지 않게 한다.
+        """
+        return multiplicative_hash(self._hash_func(key)) % self.n_shards
+
+    def __groupByShard(self, items: list, get_key) -> (dict[int, list]):
+        """items를 샤드 인덱스별로 묶어 반환."""
+        groups: dict[int, list] = {}
+        for item in items:
+            shard_index = self.getShardIndex(get_key(item))
+            if shard_index in groups:
+                groups[shard_index].append(item)
+            else:
+                groups[shard_index] = [item]
+        return groups
+
+    def addData(self, new_data: tuple) -> (None):
+        """해시 테이블에 새 키-값 데이터 삽입.
+        기존 키를 입력한 경우 해당 키의 값만 바꾼다.
+
+        Parameters
+        ----------
+        new_data : (key, value)
+
+        """
+        shard_index = self.getShardIndex(new_data[0])
+        with self._locks[shard_index]:
+            self._shards[shard_index].addData(new_data)
+
+    def addDataAll(self, new_dataset: list[Item]) -> (None):
+        """여러 데이터들을 샤드별로 묶어, 샤드마다 한 번씩만 잠그고 삽입한다."""
+        groups = self.__groupByShard(list(new_dataset), lambda kv: kv[0])
+        for shard_index, items in groups.items():
+            with self._locks[shard_index]:
+                self._shards[shard_index].addDataAll(items)
+
+    def removeData(self, target_key: Key) -> (None):
+        """지정된 키와 일치하는 키-값 데이터 삭제."""
+        shard_index = self.getShardIndex(target_key)
+        with self._locks[shard_index]:
+            self._shards[shard_index].removeData(target_key)
+
+    def removeDataMany(self, target_keys: list[Key]) -> (None):
+        """여러 키와 일치하는 데이터들을 샤드별로 묶어 한꺼번에 삭제."""
+        groups = self.__groupByShard(list(target_keys), lambda key: key)
+        for shard_index, keys in groups.items():
+            with self._locks[shard_index]:
+                self._shards[shard_index].removeDataMany(keys)
+
+    def findData(self, key: Key) -> (Value):
+        """주어진 key에 대응되는 값을 반환. 없으면 None 반환."""
+        shard_index = self.getShardIndex(key)
+        with self._locks[shard_index]:
+            return self._shards[shard_index].findData(key)
+
+    def findDataMany(self, keys: list[Key]) -> (list[Value]):
+        """여러 키에 대응되는 값들을 키의 순서대로 반환.
+        존재하지 않는 키의 자리에는 None을 반환한다.
+        """
+        keys = list(keys)
+        result: list[Value] = [None] * len(keys)
+        groups = self.__groupByShard(range(len(keys)), lambda pos: keys[pos])
+        for shard_index, positions in groups.items():
+            with self._locks[shard_index]:
+                values = self._shards[shard_index].findDataMany(
+                    [keys[pos] for pos in positions]
+                )
+            for pos, value in zip(positions, values):
+                result[pos] = value
+        return result
+
+    def getAllData(self) -> (list[Item]):
+        """해시 테이블 내 모든 데이터 반환.
+        샤드를 하나씩 잠그며 모으므로 다른 스레드의 동시 수정이
+        일부 샤드에만 반영되어 있을 수 있다.
+        """
+        all_data = []
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                all_data.extend(shard.getAllData())
+        return all_data
+
+    def getLength(self) -> (int):
+        """현재 저장된 데이터 수 반환."""
+        total = 0
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                total += shard.getLength()
+        return total
+
+    def getHTSize(self) -> (int):
+        """모든 샤드의 크기의 합 반환."""
+        total = 0
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                total += shard.getHTSize()
+        return total
+
+    def getShardLengths(self) -> (list[int]):
+        """샤드별 저장된 데이터 수를 반환. 샤드 간 쏠림 확인용."""
+        lengths = []
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                lengths.append(shard.getLength())
+        return lengths
+
+    def clear(self) -> (None):
+        """해시 테이블을 모두 비운다."""
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                shard.clear()
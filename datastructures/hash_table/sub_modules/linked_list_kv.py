@@ -21,8 +21,18 @@ class NodeAttr():
     ITEM = "ITEM"
 
 
+def set_debug_mode(enabled: bool = True) -> (None):
+    """NodeKV 객체 수 세기(디버그 모드)를 켜거나 끈다. 
+    my_linked_list의 Node, DPNode의 디버그 모드도 함께 바꾼다.
+    """
+    mll.set_debug_mode(enabled)
+    mll._setNodeCounting(NodeKV, 'node_counter', enabled)
+
+
 class NodeKV():
-    node_counter = 0
+    __slots__ = ('key', 'value', 'pointer')
+    node_counter = 0  # 디버그 모드에서만 갱신된다. (set_debug_mode 참고)
+    _debug = False
 
     def __init__(
             self, 
@@ -40,32 +50,14 @@ class NodeKV():
         포인터에는 다음 노드의 메모리 주소값을 저장하므로 \
         해당 매개변수는 다음 Node 객체를 대입받아야 한다. \n
         """
-        self._key: Key = key
-        self._value: Value = value
-        self._item: Item = (self._key, self._value)
+        self.key: Key = key
+        self.value: Value = value
         self.pointer: NodeKV = pointer
-        NodeKV.node_counter += 1
-
-    def __del__(self): NodeKV.node_counter -= 1
-
-    @property
-    def key(self) -> (Key): return self._key
-
-    @key.setter
-    def key(self, new_key: Key) -> (None): 
-        self._key = new_key
-        self._item = (self._key, self._value)
-
-    @property
-    def value(self) -> (Value): return self._value
-
-    @value.setter
-    def value(self, new_value: Value) -> (None): 
-        self._value = new_value
-        self._item = (self._key, self._value)
+        if NodeKV._debug:
+            NodeKV.node_counter += 1
 
     @property
-    def item(self) -> (Item): return self._item
+    def item(self) -> (Item): return (self.key, self.value)
 
 
 class LinkedList(mll.LinkedList):
@@ -3,8 +3,38 @@ Node_ = object
 DPNode_ = object
 Value = object
 
+def set_debug_mode(enabled: bool = True) -> (None):
+    """노드 객체 수 세기(디버그 모드)를 켜거나 끈다. 
+    디버그 모드에서만 Node, DPNode의 node_counter, dpnode_counter를 갱신한다.
+    """
+    for node_class, counter_name in ((Node, 'node_counter'),
+                                     (DPNode, 'dpnode_counter')):
+        _setNodeCounting(node_class, counter_name, enabled)
+
+
+def _setNodeCounting(
+        node_class: type,
+        counter_name: str,
+        enabled: bool
+    ) -> (None):
+    """node_class의 객체 수 세기를 켜거나 끈다. 
+    켜져 있는 동안에만 node_class에 소멸자(__del__)를 둔다.
+    """
+    node_class._debug = enabled
+    setattr(node_class, counter_name, 0)
+    if enabled:
+        def __del__(self):
+            setattr(node_class, counter_name,
+                    getattr(node_class, counter_name) - 1)
+        node_class.__del__ = __del__
+    elif '__del__' in node_class.__dict__:
+        del node_class.__del__
+
+
 class Node():
-    node_counter = 0
+    __slots__ = ('value', 'pointer')
+    node_counter = 0  # 디버그 모드에서만 갱신된다. (set_debug_mode 참고)
+    _debug = False
 
     def __init__(
             self, 
@@ -22,10 +52,8 @@ class Node():
         """
         self.value: Value = value
         self.pointer: Node | None = pointer
-        Node.node_counter += 1
-    
-    def __del__(self):
-        Node.node_counter -= 1
+        if Node._debug:
+            Node.node_counter += 1
 
 
 class DPNode():
@@ -33,7 +61,9 @@ class DPNode():
     Double pointer node. 
     각각 다음 노드와 이전 노드를 가리키는 포인터 두 개를 가지는 노드 객체. 
     """
-    dpnode_counter = 0
+    __slots__ = ('value', 'next_pointer', 'prev_pointer')
+    dpnode_counter = 0  # 디버그 모드에서만 갱신된다. (set_debug_mode 참고)
+    _debug = False
 
     def __init__(
             self, 
@@ -44,10 +74,8 @@ class DPNode():
         self.value = value
         self.next_pointer: DPNode | None = next_pointer
         self.prev_pointer: DPNode | None = prev_pointer
-        DPNode.dpnode_counter += 1
-
-    def __del__(self):
-        DPNode.dpnode_counter -= 1
+        if DPNode._debug:
+            DPNode.dpnode_counter += 1
 
 
 class LinkedList():
@@ -222,6 +250,9 @@ class LinkedList():
         if prev_pointer is None:
             # 삭제하고자 하는 노드의 인덱스 위치가 0임.
             self.head_pointer = target_node.pointer
+            if self.head_pointer is None:
+                # 유일한 노드를 삭제한 경우.
+                self.tail_pointer = None
         elif target_node.pointer is None:
             # 삭제하고자 하는 요소가 연결 리스트의 맨 뒤에 존재하는 경우.
             self.tail_pointer = prev_pointer
@@ -515,7 +546,11 @@ class DoublyLinkedList(LinkedList):
         self.length += 1
 
     def __deleteNode(self, target_node: DPNode):
-        if target_node.prev_pointer is None:
+        if target_node.prev_pointer is None and target_node.next_pointer is None:
+            # 유일한 노드를 삭제하는 경우.
+            self.head_pointer = None
+            self.tail_pointer = None
+        elif target_node.prev_pointer is None:
             # 삭제하고자 하는 인덱스 위치가 0임.
             self.head_pointer = target_node.next_pointer
             self.head_pointer.prev_pointer = None
@@ -536,6 +571,13 @@ class DoublyLinkedList(LinkedList):
         target_node = self.findNodeByIndex(index)[0]
         self.__deleteNode(target_node)
 
+    def deleteNode(self, target_node: DPNode) -> (None):
+        """
+        연결 리스트 내에 있는 노드 객체를 직접 삭제. O(1).
+        target_node는 반드시 현재 연결 리스트에 속한 노드여야 한다.
+        """
+        self.__deleteNode(target_node)
+
     def deleteNodeByValue(self, target_value: Value) -> (None):
         try:
             search_result = self.findNodeByValue(target_value)
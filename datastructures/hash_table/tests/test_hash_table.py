@@ -6,7 +6,7 @@ for i in range(1, 3):
     super_dir = get_super_dir_directly(__file__, i)
     sys.path.append(super_dir)
 
-from hash_table.my_hash_table import HashTable
+from hash_table.my_hash_table import HashTable, HashMethod, fnv1a_hash
 
 dataset = [
     ("사과", "apple"),
@@ -162,6 +162,236 @@ class TestHashTable(unittest.TestCase):
         self.assertNotIn(all_data, target_data)
 
 
+    def test_length_tracking(self):
+        """
+        need_dataset\n
+        데이터 삽입, 수정, 삭제 시 저장된 데이터 수가 
+        올바르게 갱신되는지 테스트.
+        """
+        self.assertEqual(self.ht.getLength(), len(self.dataset))
+
+        # 기존 키의 값만 바꾸는 경우 데이터 수는 변하지 않는다.
+        self.ht.addData(("꽃", "FLOWER"))
+        self.assertEqual(self.ht.getLength(), len(self.dataset))
+
+        self.ht.removeData("꽃")
+        self.assertEqual(self.ht.getLength(), len(self.dataset) - 1)
+
+        # 존재하지 않는 키 삭제 시 데이터 수는 변하지 않는다.
+        self.ht.removeData("불")
+        self.assertEqual(self.ht.getLength(), len(self.dataset) - 1)
+        self.assertEqual(self.ht.getLength(), len(self.ht.getAllData()))
+
+    def test_incremental_resize(self):
+        """
+        점진적 재해싱 도중에도 삽입, 검색, 삭제가 올바르게 
+        동작하는지 테스트.
+        """
+        ht = HashTable(10)
+        ht.rehash_step = 1
+        for i in range(8):
+            ht.addData((f"key{i}", i))
+
+        # 8번째 삽입에서 부하율을 넘어 재해싱이 시작된다.
+        self.assertTrue(ht.isRehashing())
+        self.assertEqual(ht.getHTSize(), 21)
+        for i in range(8):
+            self.assertEqual(ht.findData(f"key{i}"), i)
+
+        ht.addData(("key0", "updated"))
+        ht.removeData("key1")
+        self.assertEqual(ht.findData("key0"), "updated")
+        self.assertEqual(ht.findData("key1"), None)
+        self.assertEqual(ht.getLength(), 7)
+        self.assertEqual(len(ht.getAllData()), 7)
+
+        # 연산이 충분히 이어지면 재해싱이 끝난다.
+        for i in range(10):
+            ht.findData("key0")
+        self.assertFalse(ht.isRehashing())
+        expected = [(f"key{i}", i) for i in range(2, 8)]
+        expected.append(("key0", "updated"))
+        self.assertEqual(sorted(ht.getAllData()), sorted(expected))
+
+
+    def test_hash_methods(self):
+        """
+        해시 함수 종류와 상관없이 데이터 삽입, 검색, 삭제가 
+        올바르게 동작하는지 테스트.
+        """
+        hash_methods = [
+            HashMethod.DIGIT_FOLDING, HashMethod.BUILTIN,
+            HashMethod.FNV1A, HashMethod.MULTIPLICATIVE,
+            lambda key: len(str(key)),
+        ]
+        for hash_method in hash_methods:
+            ht = HashTable(10, hash_method)
+            ht.addDataAll(self.dataset)
+            self.assertEqual(sorted(ht.getAllData()), sorted(self.dataset))
+            self.assertEqual(ht.findData("꽃"), "flower")
+            ht.removeData("꽃")
+            self.assertEqual(ht.findData("꽃"), None)
+            self.assertEqual(ht.getLength(), len(self.dataset) - 1)
+
+        with self.assertRaises(ValueError):
+            HashTable(10, "no_such_hash")
+
+    def test_anagram_keys(self):
+        """
+        digit folding 방식에서는 애너그램 키들이 모두 같은 버킷에 들어가지만, 
+        FNV-1a 방식에서는 그렇지 않은지 테스트.
+        """
+        anagrams = ["abc", "acb", "bac", "bca", "cab", "cba"]
+        ht = HashTable(101, HashMethod.DIGIT_FOLDING)
+        self.assertEqual(len(set(map(ht.hashKey, anagrams))), 1)
+
+        ht = HashTable(101, HashMethod.FNV1A)
+        self.assertGreater(len(set(map(ht.hashKey, anagrams))), 1)
+
+        # FNV-1a 64bit 표준 테스트 벡터.
+        self.assertEqual(fnv1a_hash(""), 0xcbf29ce484222325)
+        self.assertEqual(fnv1a_hash("a"), 0xaf63dc4c8601ec8c)
+
+    def test_collision_detail(self):
+        """
+        need_dataset\n
+        checkHashCollision(detail=True)의 상세 충돌 통계 테스트.
+        """
+        is_col, max_depth, num_buckets = self.ht.checkHashCollision()
+        stats = self.ht.checkHashCollision(detail=True)
+        self.assertEqual(stats['is_collision'], is_col)
+        self.assertEqual(stats['max_depth'], max_depth)
+        self.assertEqual(stats['collided_buckets'], num_buckets)
+        self.assertEqual(stats['hash_method'], HashMethod.DIGIT_FOLDING)
+        self.assertEqual(
+            stats['empty_buckets'],
+            sum(1 for ll in self.ht.buckets if ll.getLength() == 0)
+            )
+        self.assertAlmostEqual(
+            stats['load_factor'],
+            len(self.dataset) / self.ht.getHTSize()
+            )
+
+
+    def test_batch_api(self):
+        """
+        need_dataset\n
+        addDataAll(), findDataMany(), removeDataMany() 배치 메서드 테스트.
+        """
+        # 배치 내 중복 키와 기존 키 수정.
+        self.ht.addDataAll(new_dataset + [("꽃", "FLOWER"), ("코딩", "CODING")])
+        expected = dict(self.dataset + new_dataset)
+        expected["꽃"] = "FLOWER"
+        expected["코딩"] = "CODING"
+        self.assertEqual(self.ht.getLength(), len(expected))
+        self.assertEqual(sorted(self.ht.getAllData()), sorted(expected.items()))
+        self.assertTrue(self.ht.threshold > self.ht.getLength())
+
+        keys = ["꽃", "불", "코딩", "사과"]
+        self.assertEqual(
+            self.ht.findDataMany(keys),
+            ["FLOWER", None, "CODING", "apple"]
+            )
+
+        self.ht.removeDataMany(["꽃", "불", "사과", "사과"])
+        self.assertEqual(self.ht.findDataMany(keys), [None, None, "CODING", None])
+        self.assertEqual(self.ht.getLength(), len(expected) - 2)
+        self.assertEqual(self.ht.getLength(), len(self.ht.getAllData()))
+
+        # 버킷 전체를 비운 뒤에도 다시 삽입할 수 있어야 한다.
+        all_keys = [key for key, _ in self.ht.getAllData()]
+        self.ht.removeDataMany(all_keys)
+        self.assertEqual(self.ht.getAllData(), [])
+        self.ht.addDataAll(self.dataset)
+        self.assertEqual(sorted(self.ht.getAllData()), sorted(self.dataset))
+
+    def test_iteration(self):
+        """
+        need_dataset\n
+        __iter__(), keys(), values(), items(), __len__(), __contains__() 테스트.
+        """
+        expected = dict(self.dataset)
+        self.assertEqual(len(self.ht), len(expected))
+        self.assertEqual(sorted(self.ht), sorted(expected))
+        self.assertEqual(sorted(self.ht.keys()), sorted(expected.keys()))
+        self.assertEqual(sorted(self.ht.values()), sorted(expected.values()))
+        self.assertEqual(sorted(self.ht.items()), sorted(expected.items()))
+        self.assertIn("꽃", self.ht)
+        self.assertNotIn("불", self.ht)
+
+        # 값이 None인 데이터도 저장된 것으로 판단해야 한다.
+        self.ht.addData(("불", None))
+        self.assertIn("불", self.ht)
+
+        # 재해싱 도중에도 기존 테이블에 남은 데이터까지 모두 순회해야 한다.
+        ht = HashTable(3)
+        ht.rehash_step = 1
+        for i in range(20):
+            ht.addData((i, str(i)))
+            self.assertIn(i, ht)
+        self.assertTrue(ht.isRehashing())
+        self.assertEqual(sorted(ht.items()), [(i, str(i)) for i in range(20)])
+        self.assertEqual(len(ht), 20)
+
+        # 순회 도중 현재 데이터를 삭제해도 순회가 끊기지 않아야 한다.
+        for key in ht:
+            ht.removeData(key)
+        self.assertEqual(len(ht), 0)
+        self.assertEqual(list(ht.items()), [])
+
+    def test_stats(self):
+        """
+        enableStats(), getStats()의 연산 통계 및 훅 테스트.
+        """
+        self.assertIsNone(self.ht.getStats())
+
+        clock = [0.0]
+        def fake_timer():
+            clock[0] += 1.0
+            return clock[0]
+        events = []
+        ht = HashTable(3, HashMethod.BUILTIN)
+        ht.rehash_step = 1
+        ht.enableStats(
+            hooks=[lambda event, data: events.append(event)],
+            sample_every=5, timer=fake_timer
+            )
+        for i in range(10):
+            ht.addData((i, i))
+        for i in range(12):
+            ht.findData(i)
+        ht.removeData(0)
+        ht.removeData(100)
+
+        stats = ht.getStats()
+        self.assertEqual(stats['operations']['add']['count'], 10)
+        self.assertEqual(stats['operations']['find']['count'], 12)
+        self.assertEqual(stats['operations']['remove']['count'], 2)
+        self.assertEqual(sum(stats['chain_length_histogram'].values()), 24)
+        self.assertGreater(stats['resize_count'], 0)
+        self.assertEqual(stats['resizes'][0]['old_size'], 3)
+        self.assertEqual(stats['resizes'][0]['new_size'], 7)
+        self.assertIsNotNone(stats['resizes'][0]['end_time'])
+        self.assertGreater(stats['resizes'][0]['n_steps'], 1)
+        self.assertEqual(len(stats['load_factor_samples']), 24 // 5)
+        self.assertEqual(stats['length'], 9)
+        self.assertAlmostEqual(stats['load_factor'], 9 / ht.getHTSize())
+
+        self.assertEqual(events.count('operation'), 24)
+        self.assertEqual(events.count('resize_start'), stats['resize_count'])
+        self.assertIn('resize_end', events)
+        self.assertIn('load_factor', events)
+
+        # 반환된 통계는 이후의 기록에 영향을 받지 않아야 한다.
+        ht.findData(1)
+        self.assertEqual(stats['operations']['find']['count'], 12)
+
+        ht.disableStats()
+        self.assertIsNone(ht.getStats())
+        ht.findData(1)
+        self.assertEqual(events.count('operation'), 25)
+
+
 if __name__ == '__main__':
     unittest.main()
     
\ No newline at end of file
@@ -0,0 +1,160 @@
+import unittest
+import sys
+import os
+import subprocess
+import tempfile
+
+from dirimporttool import get_super_dir_directly
+for i in range(1, 3):
+    super_dir = get_super_dir_directly(__file__, i)
+    sys.path.append(super_dir)
+
+from hash_table.my_hash_table import HashTable
+from hash_table.open_addressing_hash_table import OpenAddressingHashTable
+from hash_table.hash_table_snapshot import save_snapshot, MappedHashTable
+
+dataset = [
+    ("사과", "apple"),
+    ("바나나", "banana"),
+    ("딸기", "strawberry"),
+    ("오렌지", "orange"),
+    ("포도", "grape"),
+    ("꽃", "flower"),
+    ("나무", "tree"),
+    ("바다", "sea"),
+    ("별", "star"),
+    ("햇님", "sun"),
+    (1, [1, 2, 3]),
+    ((2, 3), {"x": 2, "y": 3}),
+]
+
+
+class TestHashTableSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "snapshot.bin")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_save_and_open(self):
+        """
+        저장한 스냅샷 파일을 열어 모든 데이터를 검색할 수 있는지 테스트.
+        """
+        ht = HashTable(10)
+        ht.addDataAll(dataset)
+        save_snapshot(ht, self.path)
+
+        with MappedHashTable(self.path) as mapped:
+            self.assertEqual(mapped.getLength(), len(dataset))
+            for key, value in dataset:
+                self.assertEqual(mapped.findData(key), value)
+            self.assertEqual(mapped.findData("불"), None)
+            self.assertEqual(
+                mapped.findDataMany(["꽃", "불", (2, 3)]),
+                ["flower", None, {"x": 2, "y": 3}]
+                )
+            self.assertEqual(
+                sorted(mapped.getAllData(), key=repr),
+                sorted(dataset, key=repr)
+                )
+
+    def test_open_addressing_table(self):
+        """
+        OpenAddressingHashTable도 같은 형식으로 저장되는지 테스트.
+        """
+        ht = OpenAddressingHashTable(10)
+        ht.addDataAll(dataset)
+        ht.removeData("꽃")
+        save_snapshot(ht, self.path)
+
+        with MappedHashTable(self.path) as mapped:
+            self.assertEqual(mapped.getLength(), len(dataset) - 1)
+            self.assertEqual(mapped.findData("꽃"), None)
+            self.assertEqual(mapped.findData("별"), "star")
+
+    def test_frozenset_key(self):
+        """
+        원소 순회 순서가 다른 frozenset 키도 같은 키로 검색되는지 테스트.
+        """
+        # 1과 9는 같은 칸에 해싱되므로 삽입 순서에 따라 순회 순서가 달라진다.
+        key = frozenset([1, 9])
+        other = frozenset([9, 1])
+        nested = (frozenset([key, frozenset(["a", "b"])]), "c" * 3)
+        ht = HashTable(10)
+        ht.addDataAll([(key, "set"), (nested, "nested"), (("ab", "ab"), "pair")])
+        save_snapshot(ht, self.path)
+
+        with MappedHashTable(self.path) as mapped:
+            self.assertEqual(mapped.findData(other), "set")
+            self.assertEqual(
+                mapped.findData(
+                    (frozenset([frozenset(["b", "a"]), other]), "ccc")
+                ),
+                "nested"
+            )
+            # 같은 객체가 두 번 쓰였는지 여부와 관계없이 같은 키로 취급.
+            ab = "".join(["a", "b"])
+            self.assertEqual(mapped.findData((ab, "ab")), "pair")
+            self.assertEqual(
+                sorted(mapped.getAllData(), key=repr),
+                sorted(ht.getAllData(), key=repr)
+            )
+
+    def test_frozenset_key_other_process(self):
+        """
+        해시 시드가 다른 프로세스에서도 frozenset 키가 검색되는지 테스트.
+        """
+        ht = HashTable(10)
+        ht.addData((frozenset(dataset[i][0] for i in range(10)), "fruits"))
+        save_snapshot(ht, self.path)
+
+        code = (
+            "import sys; sys.path.append(sys.argv[1]);"
+            "from hash_table.hash_table_snapshot import MappedHashTable;"
+            "from hash_table.tests.test_hash_table_snapshot import dataset;"
+            "m = MappedHashTable(sys.argv[2]);"
+            "print(m.findData(frozenset(dataset[i][0] for i in range(10))))"
+        )
+        super_dir = get_super_dir_directly(__file__, 2)
+        for seed in ["0", "1", "12345"]:
+            result = subprocess.run(
+                [sys.executable, "-c", code, super_dir, self.path],
+                env=dict(os.environ, PYTHONHASHSEED=seed),
+                cwd=os.path.dirname(os.path.abspath(__file__)),
+                capture_output=True, text=True, check=True
+            )
+            self.assertEqual(result.stdout.strip(), "fruits")
+
+    def test_empty_table(self):
+        """
+        빈 해시 테이블 저장 및 검색 테스트.
+        """
+        save_snapshot(HashTable(10), self.path)
+        with MappedHashTable(self.path) as mapped:
+            self.assertEqual(mapped.getLength(), 0)
+            self.assertEqual(mapped.getAllData(), [])
+            self.assertEqual(mapped.findData("꽃"), None)
+
+    def test_invalid_file(self):
+        """
+        스냅샷 형식이 아닌 파일을 열 때 ValueError가 발생하는지 테스트.
+        """
+        with open(self.path, 'wb') as f:
+            f.write(b"not a snapshot file at all")
+        with self.assertRaises(ValueError):
+            MappedHashTable(self.path)
+
+        with open(self.path, 'wb') as f:
+            f.write(b"short")
+        with self.assertRaises(ValueError):
+            MappedHashTable(self.path)
+
+        with open(self.path, 'wb') as f:
+            pass
+        with self.assertRaises(ValueError):
+            MappedHashTable(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+import unittest
+import sys
+
+from dirimporttool import get_super_dir_directly
+for i in range(1, 3):
+    super_dir = get_super_dir_directly(__file__, i)
+    sys.path.append(super_dir)
+
+from hash_table.open_addressing_hash_table import OpenAddressingHashTable
+from hash_table.my_hash_table import HashMethod
+
+dataset = [
+    ("사과", "apple"),
+    ("바나나", "banana"),
+    ("딸기", "strawberry"),
+    ("오렌지", "orange"),
+    ("포도", "grape"),
+    ("꽃", "flower"),
+    ("나무", "tree"),
+    ("바다", "sea"),
+    ("별", "star"),
+    ("햇님", "sun")
+]
+
+
+class TestOpenAddressingHashTable(unittest.TestCase):
+    def setUp(self):
+        self.ht = OpenAddressingHashTable(10)
+        self.dataset = dataset
+        self.desc = self.shortDescription()
+
+        if self.desc == "need_dataset":
+            self.ht.addDataAll(self.dataset)
+
+    def test_empty_data(self):
+        """
+        빈 해시 테이블 출력 테스트.
+        """
+        self.assertEqual(self.ht.getAllData(), [])
+        self.assertEqual(self.ht.getLength(), 0)
+        self.assertEqual(self.ht.getHTSize(), 10)
+        self.assertEqual(self.ht.findData("꽃"), None)
+
+    def test_add_data(self):
+        """
+        (key, value) 데이터 삽입 및 기존 키의 값 수정 테스트.
+        """
+        self.ht.addData(('우와', 'wow'))
+        self.ht.addData(('방', 'room'))
+        self.assertEqual(
+            sorted(self.ht.getAllData()),
+            sorted([('우와', 'wow'), ('방', 'room')])
+            )
+        self.assertEqual(self.ht.getLength(), 2)
+
+        self.ht.addData(('우와', 'WOW'))
+        self.assertEqual(
+            sorted(self.ht.getAllData()),
+            sorted([('우와', 'WOW'), ('방', 'room')])
+            )
+        self.assertEqual(self.ht.getLength(), 2)
+
+    def test_add_data_all(self):
+        """
+        need_dataset\n
+        데이터셋을 잘 삽입하고, 부하율을 넘으면 크기가 늘어나는지 테스트.
+        """
+        self.assertEqual(sorted(self.ht.getAllData()), sorted(self.dataset))
+        self.assertEqual(self.ht.getLength(), len(self.dataset))
+        self.assertEqual(self.ht.getHTSize(), 21)
+        for key, value in self.dataset:
+            self.assertEqual(self.ht.findData(key), value)
+
+    def test_remove_data(self):
+        """
+        need_dataset\n
+        삭제 후에도 같은 탐사 경로 상의 다른 데이터를 찾을 수 있는지 테스트.
+        """
+        self.ht.removeData("포도")
+        self.ht.removeData("불")
+        self.assertEqual(self.ht.findData("포도"), None)
+        self.assertEqual(self.ht.getLength(), len(self.dataset) - 1)
+        for key, value in self.dataset:
+            if key != "포도":
+                self.assertEqual(self.ht.findData(key), value)
+
+        # 묘비 자리에 다시 삽입.
+        self.ht.addData(("포도", "GRAPE"))
+        self.assertEqual(self.ht.findData("포도"), "GRAPE")
+        self.assertEqual(self.ht.getLength(), len(self.dataset))
+
+    def test_tombstone_cleanup(self):
+        """
+        삽입과 삭제를 반복해도 묘비가 쌓여 크기가 계속 늘어나지 않는지 테스트.
+        """
+        ht = OpenAddressingHashTable(10, HashMethod.BUILTIN)
+        for i in range(1000):
+            ht.addData((i, i))
+            ht.removeData(i)
+        self.assertEqual(ht.getLength(), 0)
+        self.assertEqual(ht.getHTSize(), 10)
+
+    def test_clear(self):
+        """
+        need_dataset\n
+        해시 테이블 내 모든 데이터를 삭제하는 지 테스트.
+        """
+        self.ht.clear()
+        self.assertEqual(self.ht.getAllData(), [])
+        self.assertEqual(self.ht.getLength(), 0)
+        self.assertEqual(self.ht.getHTSize(), 21)
+
+    def test_check_hash_collision(self):
+        """
+        해시 충돌 여부 확인 테스트.
+        """
+        ht = OpenAddressingHashTable(100)
+        ht.addDataAll(self.dataset)
+        self.assertEqual(ht.checkHashCollision(), (False, 1, 0))
+
+        ht = OpenAddressingHashTable(10)
+        ht.addData(("abc", 1))
+        ht.addData(("cba", 2))
+        self.assertEqual(ht.checkHashCollision(), (True, 2, 1))
+
+
+    def test_batch_api(self):
+        """
+        need_dataset\n
+        addDataAll(), findDataMany(), removeDataMany() 배치 메서드 테스트.
+        """
+        keys = ["꽃", "불", "사과"]
+        self.assertEqual(self.ht.findDataMany(keys), ["flower", None, "apple"])
+        self.ht.removeDataMany(["꽃", "불"])
+        self.assertEqual(self.ht.findDataMany(keys), [None, None, "apple"])
+
+        ht = OpenAddressingHashTable(10, HashMethod.BUILTIN)
+        ht.addDataAll((i, i) for i in range(100))
+        self.assertEqual(ht.getLength(), 100)
+        self.assertTrue(ht.threshold > ht.getLength())
+        self.assertEqual(ht.findDataMany(range(100)), list(range(100)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+import unittest
+import sys
+import random
+
+from dirimporttool import get_super_dir_directly
+for i in range(1, 3):
+    super_dir = get_super_dir_directly(__file__, i)
+    sys.path.append(super_dir)
+
+from hash_table.ordered_hash_table import OrderedHashTable
+from hash_table.my_hash_table import HashMethod
+
+
+class TestOrderedHashTable(unittest.TestCase):
+    def setUp(self):
+        self.ht = OrderedHashTable(10, HashMethod.BUILTIN)
+        self.desc = self.shortDescription()
+
+        if self.desc == "need_dataset":
+            # 10, 20, ..., 100을 키로 가지는 데이터.
+            self.keys = list(range(10, 101, 10))
+            shuffled_keys = self.keys[:]
+            random.Random(0).shuffle(shuffled_keys)
+            self.ht.addDataAll([(key, str(key)) for key in shuffled_keys])
+
+    def test_empty_data(self):
+        """
+        빈 해시 테이블 테스트.
+        """
+        self.assertEqual(self.ht.getAllData(), [])
+        self.assertIsNone(self.ht.min())
+        self.assertIsNone(self.ht.max())
+        self.assertIsNone(self.ht.floor(10))
+        self.assertIsNone(self.ht.ceiling(10))
+        self.assertEqual(list(self.ht.range(0, 100)), [])
+
+    def test_sorted_iteration(self):
+        """
+        need_dataset\n
+        키의 오름차순 순회 테스트.
+        """
+        self.assertEqual(list(self.ht), self.keys)
+        self.assertEqual(list(self.ht.values()), [str(k) for k in self.keys])
+        self.assertEqual(
+            self.ht.getAllData(),
+            [(k, str(k)) for k in self.keys]
+            )
+        self.assertEqual(len(self.ht), len(self.keys))
+
+    def test_min_max_floor_ceiling(self):
+        """
+        need_dataset\n
+        min(), max(), floor(), ceiling() 테스트.
+        """
+        self.assertEqual(self.ht.min(), 10)
+        self.assertEqual(self.ht.max(), 100)
+        self.assertEqual(self.ht.floor(55), 50)
+        self.assertEqual(self.ht.floor(50), 50)
+        self.assertIsNone(self.ht.floor(9))
+        self.assertEqual(self.ht.ceiling(55), 60)
+        self.assertEqual(self.ht.ceiling(60), 60)
+        self.assertIsNone(self.ht.ceiling(101))
+
+    def test_range(self):
+        """
+        need_dataset\n
+        range() 범위 검색 테스트. (low 이상 high 미만)
+        """
+        self.assertEqual(
+            list(self.ht.range(25, 60)),
+            [(30, "30"), (40, "40"), (50, "50")]
+            )
+        self.assertEqual(list(self.ht.range(60, 60)), [])
+        self.assertEqual(list(self.ht.range(0, 15)), [(10, "10")])
+        self.assertEqual(len(list(self.ht.range(0, 1000))), len(self.keys))
+
+    def test_update_and_remove(self):
+        """
+        need_dataset\n
+        값 수정과 삭제 시 키 순서 유지 테스트.
+        """
+        self.ht.addData((50, "fifty"))
+        self.assertEqual(self.ht.findData(50), "fifty")
+        self.assertEqual(list(self.ht), self.keys)
+
+        self.ht.removeData(10)
+        self.ht.removeData(1000)
+        self.ht.removeDataMany([100, 50, 50])
+        expected = [k for k in self.keys if k not in (10, 50, 100)]
+        self.assertEqual(list(self.ht), expected)
+        self.assertEqual(self.ht.min(), 20)
+        self.assertEqual(self.ht.max(), 90)
+        self.assertEqual(self.ht.floor(55), 40)
+        self.assertEqual(self.ht.getLength(), len(expected))
+
+        self.ht.clear()
+        self.assertEqual(list(self.ht), [])
+        self.assertIsNone(self.ht.min())
+
+    def test_many_keys(self):
+        """
+        무작위 삽입, 삭제 후 정렬 순서와 범위 검색 결과 확인.
+        """
+        rng = random.Random(1)
+        keys = rng.sample(range(100000), 3000)
+        for key in keys:
+            self.ht.addData((key, -key))
+        for key in keys[::3]:
+            self.ht.removeData(key)
+
+        remaining = sorted(set(keys) - set(keys[::3]))
+        self.assertEqual(list(self.ht), remaining)
+        self.assertEqual(
+            [key for key, _ in self.ht.range(20000, 40000)],
+            [key for key in remaining if 20000 <= key < 40000]
+            )
+
+    def test_uncomparable_key(self):
+        """
+        크기 비교가 불가능한 키 삽입 시 해시 테이블에도 삽입되지 않아야 한다.
+        """
+        self.ht.addData((1, "one"))
+        with self.assertRaises(TypeError):
+            self.ht.addData(("one", 1))
+        self.assertNotIn("one", self.ht)
+        self.assertEqual(self.ht.getLength(), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import unittest
+import sys
+import threading
+
+from dirimporttool import get_super_dir_directly
+for i in range(1, 3):
+    super_dir = get_super_dir_directly(__file__, i)
+    sys.path.append(super_dir)
+
+from hash_table.sharded_hash_table import ShardedHashTable
+from hash_table.my_hash_table import HashMethod
+
+dataset = [
+    ("사과", "apple"),
+    ("바나나", "banana"),
+    ("딸기", "strawberry"),
+    ("오렌지", "orange"),
+    ("포도", "grape"),
+    ("꽃", "flower"),
+    ("나무", "tree"),
+    ("바다", "sea"),
+    ("별", "star"),
+    ("햇님", "sun")
+]
+
+
+class TestShardedHashTable(unittest.TestCase):
+    def setUp(self):
+        self.ht = ShardedHashTable(16, n_shards=4)
+        self.dataset = dataset
+        self.desc = self.shortDescription()
+
+        if self.desc == "need_dataset":
+            self.ht.addDataAll(self.dataset)
+
+    def test_empty_data(self):
+        """
+        빈 해시 테이블 출력 테스트.
+        """
+        self.assertEqual(self.ht.getAllData(), [])
+        self.assertEqual(self.ht.getLength(), 0)
+        self.assertEqual(self.ht.getHTSize(), 16)
+        self.assertEqual(self.ht.findData("꽃"), None)
+
+        with self.assertRaises(ValueError):
+            ShardedHashTable(16, n_shards=0)
+
+    def test_add_find_remove(self):
+        """
+        need_dataset\n
+        데이터 삽입, 검색, 삭제 테스트.
+        """
+        self.assertEqual(sorted(self.ht.getAllData()), sorted(self.dataset))
+        self.assertEqual(self.ht.getLength(), len(self.dataset))
+        self.assertEqual(sum(self.ht.getShardLengths()), len(self.dataset))
+
+        self.ht.addData(("꽃", "FLOWER"))
+        self.assertEqual(self.ht.findData("꽃"), "FLOWER")
+        self.assertEqual(self.ht.getLength(), len(self.dataset))
+
+        self.ht.removeData("꽃")
+        self.assertEqual(self.ht.findData("꽃"), None)
+        self.assertEqual(
+            self.ht.findDataMany(["사과", "꽃", "별"]),
+            ["apple", None, "star"]
+            )
+
+        self.ht.removeDataMany(["사과", "별"])
+        self.assertEqual(self.ht.getLength(), len(self.dataset) - 3)
+
+        self.ht.clear()
+        self.assertEqual(self.ht.getAllData(), [])
+
+    def test_concurrent_access(self):
+        """
+        여러 스레드가 동시에 삽입, 검색, 삭제해도 데이터가 
+        손상되지 않는지 테스트.
+        """
+        ht = ShardedHashTable(16, n_shards=8, hash_method=HashMethod.BUILTIN)
+        n_threads, n_items = 8, 500
+        errors = []
+
+        def worker(thread_id: int):
+            try:
+                for i in range(n_items):
+                    key = (thread_id, i)
+                    ht.addData((key, i))
+                    if ht.findData(key) != i:
+                        errors.append(key)
+                    if i % 2:
+                        ht.removeData(key)
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [
+            threading.Thread(target=worker, args=(t, )) for t in range(n_threads)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        expected = [
+            ((t, i), i) for t in range(n_threads) for i in range(0, n_items, 2)
+        ]
+        self.assertEqual(ht.getLength(), len(expected))
+        self.assertEqual(sorted(ht.getAllData()), sorted(expected))
+
+
+if __name__ == '__main__':
+    unittest.main()
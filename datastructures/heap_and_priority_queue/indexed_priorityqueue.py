@@ -0,0 +1,294 @@
+"""값(value)으로 데이터의 위치를 찾을 수 있는 인덱스 우선순위 큐(Indexed Priority Queue) 구현.
+
+이진 힙 배열과 함께 각 값이 힙 배열의 어느 인덱스에 있는지를 기록하는 딕셔너리를
+관리하여, 값의 존재 여부 확인을 O(1)만에, 특정 값의 우선순위 변경 및 삭제를
+O(log n)만에 할 수 있다.
+따라서 Dijkstra, Prim 알고리즘처럼 큐에 있는 데이터의 우선순위를 바꿔야 하는 경우
+같은 값을 중복해서 넣지 않아도 된다.
+큐 내의 값들은 서로 중복될 수 없으며, 해시 가능(hashable)해야 한다.
+
+"""
+
+import operator
+from typing import Iterable
+
+try:
+    from priorityqueue import Data
+except ModuleNotFoundError:
+    from heap_and_priority_queue.priorityqueue import Data
+
+__all__ = [
+    'IndexedPriorityQueue',
+]
+
+# type alias
+Value = object
+Priority = int | float
+Index = int
+
+
+class IndexedPriorityQueue():
+    def __init__(self, max_mode: bool = True) -> (None):
+        """값으로 데이터를 찾아 우선순위를 바꾸거나 삭제할 수 있는 우선순위 큐.
+
+        Parameters
+        ----------
+        max_mode : bool, default True
+            PriorityQueue의 max_mode와 같다.
+            True이면 priority 값이 가장 큰 데이터부터,
+            False이면 priority 값이 가장 작은 데이터부터 추출된다.
+
+        Attributes
+        ----------
+        self._values, self._priorities : list
+            힙 배열. 값과 우선순위를 같은 인덱스에 나누어 저장한다.
+            인덱스 계산 편의상 인덱스 0은 비워둔다.
+        self._location : dict[Value, Index]
+            각 값이 힙 배열의 어느 인덱스에 있는지를 기록한다.
+
+        """
+        self._values: list[Value] = [None]
+        self._priorities: list[Priority] = [None]
+        self._location: dict[Value, Index] = {}
+        self.max_mode: bool = max_mode
+
+        # a가 b보다 먼저 추출되어야 하면 True를 반환하는 비교 함수.
+        self._before = operator.gt if max_mode else operator.lt
+
+    @classmethod
+    def fromItems(
+            cls,
+            items: Iterable[tuple[Value, Priority]],
+            max_mode: bool = True
+        ) -> (object):
+        """(value, priority) 쌍들로 우선순위 큐를 만들어 반환.
+
+        데이터를 하나씩 enqueue하지 않고, 힙 배열을 한 번에 채운 뒤
+        아래층부터 힙 구조를 맞추는 heapify 방식을 사용하므로 O(n)이다.
+
+        Raises
+        ------
+        ValueError
+            items 내에 중복된 값이 있는 경우.
+
+        """
+        ipq = cls(max_mode)
+        location = ipq._location
+        for value, priority in items:
+            if value in location:
+                raise ValueError(f"값 {value}이(가) 중복됩니다.")
+            location[value] = len(ipq._values)
+            ipq._values.append(value)
+            ipq._priorities.append(priority)
+        for index in range(ipq.getCurrentSize() // 2, 0, -1):
+            ipq._siftDown(index)
+        return ipq
+
+    def __contains__(self, value: Value) -> (bool):
+        """value가 우선순위 큐에 있는지 O(1)만에 확인."""
+        return value in self._location
+
+    def __len__(self) -> (int):
+        return len(self._values) - 1
+
+    def __repr__(self):
+        if not self.isEmpty():
+            return str(self.showAll())
+        return "None"
+
+    def clear(self) -> (None):
+        """우선순위 큐 내부를 모두 비운다."""
+        self._values = [None]
+        self._priorities = [None]
+        self._location.clear()
+
+    def showAll(self) -> (list[tuple[Value, Priority]]):
+        """우선순위 큐 내 모든 데이터를 힙 배열 순서대로 반환."""
+        return list(zip(self._values[1:], self._priorities[1:]))
+
+    def isEmpty(self) -> (bool):
+        """현재 우선순위 큐가 비어있는지 확인.
+        비어있으면 True 반환.
+        """
+        return len(self._values) == 1
+
+    def getCurrentSize(self) -> (int):
+        """현재 힙 내에 저장된 데이터의 수 반환."""
+        return len(self._values) - 1
+
+    def peek(self) -> (Data | None):
+        """최우선순위 데이터를 반환.
+        검색만 하고 실제로 큐에서 제거하진 않는다.
+        비어있으면 None을 반환한다.
+        """
+        if self.isEmpty():
+            return None
+        return Data(self._values[1], self._priorities[1])
+
+    def getPriority(self, value: Value) -> (Priority):
+        """value의 현재 우선순위 반환.
+
+        Raises
+        ------
+        KeyError
+            value가 우선순위 큐에 없는 경우.
+
+        """
+        return self._priorities[self._location[value]]
+
+    def _move(self, value: Value, priority: Priority, index: Index) -> (None):
+        """값과 우선순위를 힙 배열의 index 위치에 두고 그 위치를 기록."""
+        self._values[index] = value
+        self._priorities[index] = priority
+        self._location[value] = index
+
+    def _siftUp(self, index: Index) -> (None):
+        """index 위치의 데이터를 우선순위에 맞게 힙 구조의 위층으로 올린다.
+
+        매 단계마다 두 데이터를 맞바꾸지 않고, 부모 데이터를 아래로 내려 빈 자리를
+        위로 옮긴 뒤 마지막에 한 번만 대상 데이터를 기록한다.
+        """
+        values, priorities, before = self._values, self._priorities, self._before
+        value, priority = values[index], priorities[index]
+        while index > 1:
+            parent = index // 2
+            if not before(priority, priorities[parent]):
+                break
+            self._move(values[parent], priorities[parent], index)
+            index = parent
+        self._move(value, priority, index)
+
+    def _siftDown(self, index: Index) -> (None):
+        """index 위치의 데이터를 우선순위에 맞게 힙 구조의 아래층으로 내린다.
+        두 자식 중 먼저 추출되어야 하는 자식과 비교한다.
+        """
+        values, priorities, before = self._values, self._priorities, self._before
+        value, priority = values[index], priorities[index]
+        size = len(values) - 1
+        child = index * 2
+        while child <= size:
+            if child < size and before(priorities[child+1], priorities[child]):
+                child += 1
+            if not before(priorities[child], priority):
+                break
+            self._move(values[child], priorities[child], index)
+            index = child
+            child = index * 2
+        self._move(value, priority, index)
+
+    def enqueue(self, value: Value, priority: Priority) -> (None):
+        """새 데이터 입력.
+
+        Parameters
+        ----------
+        value : Value
+            값. 해시 가능(hashable)해야 한다.
+        priority : Priority
+            우선순위 값.
+
+        Raises
+        ------
+        ValueError
+            value가 이미 우선순위 큐에 있는 경우.
+            이 때는 changeKey(), decreaseKey(), increaseKey()를 사용한다.
+
+        """
+        if value in self._location:
+            raise ValueError(f"값 {value}이(가) 이미 우선순위 큐에 있습니다.")
+        self._values.append(value)
+        self._priorities.append(priority)
+        self._location[value] = len(self._values) - 1
+        self._siftUp(len(self._values) - 1)
+
+    def dequeue(self) -> (Data | None):
+        """최우선순위 데이터 반환 후 우선순위 큐 내에서 삭제.
+
+        Returns
+        -------
+        Data
+            Data 객체
+        None
+            큐 내에 데이터가 하나도 없을 때 반환됨.
+
+        """
+        if self.isEmpty():
+            return None
+        return self._removeAt(1)
+
+    def _removeAt(self, index: Index) -> (Data):
+        """힙 배열의 index 위치에 있는 데이터를 삭제하고 반환.
+        맨 마지막 데이터를 빈 자리로 옮긴 뒤 힙 구조를 다시 맞춘다.
+        """
+        values, priorities = self._values, self._priorities
+        removed = Data(values[index], priorities[index])
+        del self._location[removed.value]
+        last_value, last_priority = values.pop(), priorities.pop()
+        if index < len(values):
+            self._move(last_value, last_priority, index)
+            if index > 1 and self._before(last_priority, priorities[index//2]):
+                self._siftUp(index)
+            else:
+                self._siftDown(index)
+        return removed
+
+    def remove(self, value: Value) -> (Data):
+        """value에 해당하는 데이터를 우선순위와 관계없이 삭제하고 반환. O(log n)
+
+        Raises
+        ------
+        KeyError
+            value가 우선순위 큐에 없는 경우.
+
+        """
+        return self._removeAt(self._location[value])
+
+    def changeKey(self, value: Value, priority: Priority) -> (None):
+        """value의 우선순위를 priority로 바꾼다. O(log n)
+        value가 우선순위 큐에 없으면 새로 입력한다.
+        """
+        index = self._location.get(value)
+        if index is None:
+            self.enqueue(value, priority)
+            return
+        old_priority = self._priorities[index]
+        self._priorities[index] = priority
+        if self._before(priority, old_priority):
+            self._siftUp(index)
+        else:
+            self._siftDown(index)
+
+    def decreaseKey(self, value: Value, priority: Priority) -> (None):
+        """value의 우선순위 값을 더 작은 값인 priority로 낮춘다. O(log n)
+        최소 힙(max_mode=False)에서는 해당 데이터가 더 먼저 추출되게 된다.
+
+        Raises
+        ------
+        KeyError
+            value가 우선순위 큐에 없는 경우.
+        ValueError
+            priority가 현재 우선순위 값보다 큰 경우.
+
+        """
+        if priority > self.getPriority(value):
+            raise ValueError(
+                f"새 우선순위 {priority}이(가) 현재 우선순위보다 큽니다."
+            )
+        self.changeKey(value, priority)
+
+    def increaseKey(self, value: Value, priority: Priority) -> (None):
+        """value의 우선순위 값을 더 큰 값인 priority로 높인다. O(log n)
+        최대 힙(max_mode=True)에서는 해당 데이터가 더 먼저 추출되게 된다.
+
+        Raises
+        ------
+        KeyError
+            value가 우선순위 큐에 없는 경우.
+        ValueError
+            priority가 현재 우선순위 값보다 작은 경우.
+
+        """
+        if priority < self.getPriority(value):
+            raise ValueError(
+                f"새 우선순위 {priority}이(가) 현재 우선순위보다 작습니다."
+            )
+        self.changeKey(value, priority)
@@ -0,0 +1,423 @@
+"""페어링 힙(Pairing Heap)을 이용한 인덱스 우선순위 큐 구현.
+
+페어링 힙은 각 노드가 자식 노드들을 연결리스트로 가지는 다진 트리 형태의 힙으로,
+두 트리를 합칠 때 우선순위가 높은 루트 아래에 다른 루트를 맨 앞 자식으로 붙이기만 한다.
+따라서 삽입, 두 힙의 병합(meld), 우선순위를 높이는 decrease-key가 (분할 상환) O(1)이며,
+최우선순위 데이터 추출은 분할 상환 O(log n)이다.
+IndexedPriorityQueue와 같은 메서드를 제공하므로 Dijkstra 알고리즘처럼
+decrease-key가 많은 곳에서 IndexedPriorityQueue 대신 사용할 수 있다.
+
+참고자료) https://en.wikipedia.org/wiki/Pairing_heap
+
+"""
+
+import operator
+import random
+import time
+from typing import Iterable
+
+try:
+    from priorityqueue import Data
+except ModuleNotFoundError:
+    from heap_and_priority_queue.priorityqueue import Data
+
+__all__ = [
+    'PairingNode',
+    'PairingHeap',
+    'compare_decrease_key',
+]
+
+# type alias
+Value = object
+Priority = int | float
+
+
+class PairingNode():
+    """페어링 힙의 노드.
+
+    child는 맨 앞 자식 노드, sibling은 바로 다음 형제 노드를 가리킨다.
+    prev는 맨 앞 자식 노드이면 부모 노드를, 그렇지 않으면 바로 앞 형제 노드를 가리킨다.
+    """
+    __slots__ = ('value', 'priority', 'child', 'sibling', 'prev')
+
+    def __init__(self, value: Value, priority: Priority) -> (None):
+        self.value: Value = value
+        self.priority: Priority = priority
+        self.child: PairingNode | None = None
+        self.sibling: PairingNode | None = None
+        self.prev: PairingNode | None = None
+
+
+class PairingHeap():
+    def __init__(self, max_mode: bool = True) -> (None):
+        """값으로 데이터를 찾아 우선순위를 바꾸거나 삭제할 수 있는 페어링 힙.
+
+        Parameters
+        ----------
+        max_mode : bool, default True
+            PriorityQueue의 max_mode와 같다.
+            True이면 priority 값이 가장 큰 데이터부터,
+            False이면 priority 값이 가장 작은 데이터부터 추출된다.
+
+        Attributes
+        ----------
+        self._root : PairingNode | None
+            힙의 루트 노드. 최우선순위 데이터를 가진다.
+        self._nodes : dict[Value, PairingNode]
+            각 값을 가진 노드를 기록한다.
+
+        """
+        self._root: PairingNode | None = None
+        self._nodes: dict[Value, PairingNode] = {}
+        self.max_mode: bool = max_mode
+
+        # a가 b보다 먼저 추출되어야 하면 True를 반환하는 비교 함수.
+        self._before = operator.gt if max_mode else operator.lt
+
+    @classmethod
+    def fromItems(
+            cls,
+            items: Iterable[tuple[Value, Priority]],
+            max_mode: bool = True
+        ) -> (object):
+        """(value, priority) 쌍들로 페어링 힙을 만들어 반환. O(n)
+
+        Raises
+        ------
+        ValueError
+            items 내에 중복된 값이 있는 경우.
+
+        """
+        heap = cls(max_mode)
+        for value, priority in items:
+            heap.enqueue(value, priority)
+        return heap
+
+    def __contains__(self, value: Value) -> (bool):
+        """value가 힙에 있는지 O(1)만에 확인."""
+        return value in self._nodes
+
+    def __len__(self) -> (int):
+        return len(self._nodes)
+
+    def __repr__(self):
+        if not self.isEmpty():
+            return str(self.showAll())
+        return "None"
+
+    def clear(self) -> (None):
+        """힙 내부를 모두 비운다."""
+        self._root = None
+        self._nodes.clear()
+
+    def showAll(self) -> (list[tuple[Value, Priority]]):
+        """힙 내 모든 데이터를 루트 노드부터 전위 순회 순서대로 반환."""
+        result = []
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            node = stack.pop()
+            result.append((node.value, node.priority))
+            if node.sibling is not None:
+                stack.append(node.sibling)
+            if node.child is not None:
+                stack.append(node.child)
+        return result
+
+    def isEmpty(self) -> (bool):
+        """현재 힙이 비어있는지 확인. 비어있으면 True 반환."""
+        return self._root is None
+
+    def getCurrentSize(self) -> (int):
+        """현재 힙 내에 저장된 데이터의 수 반환."""
+        return len(self._nodes)
+
+    def peek(self) -> (Data | None):
+        """최우선순위 데이터를 반환.
+        검색만 하고 실제로 힙에서 제거하진 않는다.
+        비어있으면 None을 반환한다.
+        """
+        if self._root is None:
+            return None
+        return Data(self._root.value, self._root.priority)
+
+    def getPriority(self, value: Value) -> (Priority):
+        """value의 현재 우선순위 반환.
+
+        Raises
+        ------
+        KeyError
+            value가 힙에 없는 경우.
+
+        """
+        return self._nodes[value].priority
+
+    def _link(
+            self,
+            a: PairingNode | None,
+            b: PairingNode | None
+        ) -> (PairingNode | None):
+        """두 트리의 루트 노드 a, b 중 먼저 추출되어야 할 노드 아래에
+        다른 노드를 맨 앞 자식으로 붙이고, 합쳐진 트리의 루트 노드를 반환. O(1)
+        """
+        if a is None:
+            return b
+        if b is None:
+            return a
+        if self._before(b.priority, a.priority):
+            a, b = b, a
+        b.prev = a
+        b.sibling = a.child
+        if a.child is not None:
+            a.child.prev = b
+        a.child = b
+        a.sibling = a.prev = None
+        return a
+
+    def _mergePairs(self, first: PairingNode | None) -> (PairingNode | None):
+        """first부터 이어진 형제 트리들을 하나의 트리로 합친 뒤 루트 노드를 반환.
+
+        왼쪽부터 두 개씩 짝지어 합친 뒤(1차), 합쳐진 트리들을 오른쪽부터
+        차례로 합친다(2차). (two-pass pairing)
+        """
+        pairs = []
+        while first is not None:
+            second = first.sibling
+            if second is None:
+                first.prev = None
+                pairs.append(first)
+                break
+            next_first = second.sibling
+            first.sibling = second.sibling = None
+            pairs.append(self._link(first, second))
+            first = next_first
+        root = None
+        while pairs:
+            root = self._link(pairs.pop(), root)
+        return root
+
+    def _cut(self, node: PairingNode) -> (None):
+        """루트 노드가 아닌 node를 그 자식 노드들과 함께 트리에서 떼어낸다. O(1)"""
+        if node.prev.child is node:
+            node.prev.child = node.sibling
+        else:
+            node.prev.sibling = node.sibling
+        if node.sibling is not None:
+            node.sibling.prev = node.prev
+        node.sibling = node.prev = None
+
+    def enqueue(self, value: Value, priority: Priority) -> (None):
+        """새 데이터 입력. O(1)
+
+        Parameters
+        ----------
+        value : Value
+            값. 해시 가능(hashable)해야 한다.
+        priority : Priority
+            우선순위 값.
+
+        Raises
+        ------
+        ValueError
+            value가 이미 힙에 있는 경우.
+            이 때는 changeKey(), decreaseKey(), increaseKey()를 사용한다.
+
+        """
+        if value in self._nodes:
+            raise ValueError(f"값 {value}이(가) 이미 힙에 있습니다.")
+        node = PairingNode(value, priority)
+        self._nodes[value] = node
+        self._root = self._link(self._root, node)
+
+    def dequeue(self) -> (Data | None):
+        """최우선순위 데이터 반환 후 힙 내에서 삭제. 분할 상환 O(log n)
+
+        Returns
+        -------
+        Data
+            Data 객체
+        None
+            힙 내에 데이터가 하나도 없을 때 반환됨.
+
+        """
+        root = self._root
+        if root is None:
+            return None
+        del self._nodes[root.value]
+        self._root = self._mergePairs(root.child)
+        root.child = None
+        return Data(root.value, root.priority)
+
+    def remove(self, value: Value) -> (Data):
+        """value에 해당하는 데이터를 우선순위와 관계없이 삭제하고 반환.
+        분할 상환 O(log n)
+
+        Raises
+        ------
+        KeyError
+            value가 힙에 없는 경우.
+
+        """
+        node = self._nodes[value]
+        if node is self._root:
+            return self.dequeue()
+        del self._nodes[value]
+        self._cut(node)
+        self._root = self._link(self._root, self._mergePairs(node.child))
+        node.child = None
+        return Data(node.value, node.priority)
+
+    def changeKey(self, value: Value, priority: Priority) -> (None):
+        """value의 우선순위를 priority로 바꾼다.
+        value가 힙에 없으면 새로 입력한다.
+
+        우선순위가 높아지는 경우(최소 힙의 decrease-key)에는 해당 노드를 떼어내어
+        루트 노드와 합치기만 하므로 분할 상환 O(1)이고,
+        낮아지는 경우에는 삭제 후 다시 삽입하므로 분할 상환 O(log n)이다.
+        """
+        node = self._nodes.get(value)
+        if node is None:
+            self.enqueue(value, priority)
+            return
+        if self._before(priority, node.priority) or priority == node.priority:
+            self._raiseNode(node, priority)
+            return
+        self.remove(value)
+        self.enqueue(value, priority)
+
+    def _raiseNode(self, node: PairingNode, priority: Priority) -> (None):
+        """node의 우선순위를 더 먼저 추출되어야 할 값인 priority로 바꾼다. O(1)
+        node를 그 자식 노드들과 함께 떼어내어 루트 노드와 합치기만 하면 된다.
+        """
+        node.priority = priority
+        if node is not self._root:
+            self._cut(node)
+            self._root = self._link(self._root, node)
+
+    def decreaseKey(self, value: Value, priority: Priority) -> (None):
+        """value의 우선순위 값을 더 작은 값인 priority로 낮춘다.
+        최소 힙(max_mode=False)에서는 분할 상환 O(1)이다.
+
+        Raises
+        ------
+        KeyError
+            value가 힙에 없는 경우.
+        ValueError
+            priority가 현재 우선순위 값보다 큰 경우.
+
+        """
+        node = self._nodes[value]
+        if priority > node.priority:
+            raise ValueError(
+                f"새 우선순위 {priority}이(가) 현재 우선순위보다 큽니다."
+            )
+        if self.max_mode:
+            self.changeKey(value, priority)
+            return
+        self._raiseNode(node, priority)
+
+    def increaseKey(self, value: Value, priority: Priority) -> (None):
+        """value의 우선순위 값을 더 큰 값인 priority로 높인다.
+        최대 힙(max_mode=True)에서는 분할 상환 O(1)이다.
+
+        Raises
+        ------
+        KeyError
+            value가 힙에 없는 경우.
+        ValueError
+            priority가 현재 우선순위 값보다 작은 경우.
+
+        """
+        node = self._nodes[value]
+        if priority < node.priority:
+            raise ValueError(
+                f"새 우선순위 {priority}이(가) 현재 우선순위보다 작습니다."
+            )
+        if not self.max_mode:
+            self.changeKey(value, priority)
+            return
+        self._raiseNode(node, priority)
+
+    def meld(self, other: 'PairingHeap') -> (None):
+        """other의 모든 데이터를 현재 힙에 합치고 other는 비운다.
+
+        두 루트 노드를 합치는 것은 O(1)이고, 값과 노드를 잇는 딕셔너리를
+        합치는 데 O(m)이 걸린다. (m: other의 데이터 수)
+
+        Raises
+        ------
+        TypeError
+            other가 PairingHeap이 아니거나 max_mode가 다른 경우.
+        ValueError
+            두 힙에 같은 값이 있는 경우.
+
+        """
+        if not isinstance(other, PairingHeap) or other.max_mode != self.max_mode:
+            raise TypeError("max_mode가 같은 PairingHeap끼리만 합칠 수 있습니다.")
+        if other is self:
+            return
+        if not self._nodes.keys().isdisjoint(other._nodes):
+            raise ValueError("두 힙에 같은 값이 있어 합칠 수 없습니다.")
+        self._nodes.update(other._nodes)
+        self._root = self._link(self._root, other._root)
+        other._root = None
+        other._nodes = {}
+
+
+def compare_decrease_key(
+        n: int = 1000,
+        density: float = 0.5,
+        seed: int | None = 0
+    ) -> (dict[str, tuple[float, int]]):
+    """무작위 가중치를 가지는 조밀한(dense) 방향 그래프에서 Dijkstra 알고리즘을
+    IndexedPriorityQueue와 PairingHeap으로 각각 실행하여 걸린 시간을 비교한다.
+
+    Parameters
+    ----------
+    n : int, default 1000
+        노드 수.
+    density : float, default 0.5
+        두 노드 사이에 edge가 있을 확률. 1이면 완전 그래프이다.
+    seed : int | None, default 0
+        그래프를 만드는 난수 생성기의 시드.
+
+    Returns
+    -------
+    dict[str, tuple[float, int]]
+        우선순위 큐별 (총 소요 시간(초), decreaseKey 호출 수).
+
+    """
+    try:
+        from indexed_priorityqueue import IndexedPriorityQueue
+    except ModuleNotFoundError:
+        from heap_and_priority_queue.indexed_priorityqueue import (
+            IndexedPriorityQueue
+        )
+
+    rng = random.Random(seed)
+    graph = [
+        [(v, rng.randrange(1, n * 10)) for v in range(n)
+         if v != u and rng.random() < density]
+        for u in range(n)
+    ]
+
+    result = {}
+    for pq_class in [IndexedPriorityQueue, PairingHeap]:
+        start = time.perf_counter()
+        dist_to = [float('inf')] * n
+        dist_to[0] = 0
+        pq = pq_class.fromItems(enumerate(dist_to), max_mode=False)
+        n_decrease = 0
+        while not pq.isEmpty():
+            u = pq.dequeue().value
+            for v, weight in graph[u]:
+                if dist_to[u] + weight < dist_to[v]:
+                    dist_to[v] = dist_to[u] + weight
+                    pq.decreaseKey(v, dist_to[v])
+                    n_decrease += 1
+        result[pq_class.__name__] = (time.perf_counter() - start, n_decrease)
+    return result
+
+
+if __name__ == '__main__':
+    for name, (elapsed, n_decrease) in compare_decrease_key().items():
+        print(f"{name}: {elapsed:.3f}s (decreaseKey {n_decrease}회)")
@@ -1,12 +1,21 @@
 """최대 이진 힙(Max Binary Heap)을 이용하여 우선순위 큐를 구현.
+arity를 지정하여 d-ary 힙으로도 사용할 수 있다. (compare_arity() 참고)
+asyncio에서 사용할 수 있는 우선순위 큐(AsyncPriorityQueue)도 함께 구현.
 
 """
 
-from multipledispatch import dispatch
+import asyncio
+import heapq
+import operator
+import random
+import time
+from typing import AsyncGenerator, Iterable, Iterator
 
 __all__ = [
     'Data',
-    'PriorityQueue'
+    'PriorityQueue',
+    'AsyncPriorityQueue',
+    'compare_arity',
 ]
 
 # type alias
@@ -32,29 +41,184 @@ class Data():
 
 
 class PriorityQueue():
-    def __init__(self, max_mode: bool = True) -> (None):
+    def __init__(self, max_mode: bool = True, arity: int = 2) -> (None):
         """우선순위 큐의 최대 크기를 고정시키지 않고, 
         데이터가 들어오는 대로 저장하는 동적 방식 사용. 
 
         Parameters
         ----------
         max_mode : bool, default True
-            max binary heap으로 할 지에 대한 변수. 
-            True시 max binary heap, 즉 priority의 값이 큰 데이터가 힙 구조의
+            max heap으로 할 지에 대한 변수. 
+            True시 max heap, 즉 priority의 값이 큰 데이터가 힙 구조의
             상위 계층에 위치하도록 함. (dequeue시 priority의 값이 가장 큰 데이터가 추출된다)
-            False 시 min binary heap, 즉, priority 값이 작은 데이터가 
+            False 시 min heap, 즉, priority 값이 작은 데이터가 
             힙 구조의 상위 계층에 위치하도록 함. (dequeue시 priority의 값이 가장 작은 데이터가 추출된다)
+        arity : int, default 2
+            힙의 각 노드가 가질 수 있는 자식 노드의 최대 수. (d-ary heap)
+            2이면 이진 힙이다. 값이 클수록 힙의 높이가 낮아져 enqueue가 빨라지고, 
+            dequeue 시 비교해야 할 자식 노드 수는 늘어난다. 
+
+        Raises
+        ------
+        ValueError
+            arity가 2보다 작은 경우.
 
         Attributes
         ----------
-        self.heap_array : list[Data], default [None]
-            인덱스 계산 편의상 배열 내 데이터의 저장 위치는 
-            1부터 시작함. 즉, 인덱스 0은 비워둠. 
+        self._values, self._priorities : list
+            힙 배열. Data 객체 대신 값과 우선순위를 같은 인덱스에 나누어 저장한다.
+            인덱스 i의 자식 노드들은 인덱스 arity*i + 1 ~ arity*i + arity에, 
+            부모 노드는 인덱스 (i-1) // arity에 위치한다.
         
         """
-        self.heap_array: list[Data] = [None]
-        self.N = len(self.heap_array) - 1
-        self.max_mode = max_mode
+        if arity < 2:
+            raise ValueError("arity는 2 이상이어야 합니다.")
+        self._values: list[Value] = []
+        self._priorities: list[Priority] = []
+        self.max_mode: bool = max_mode
+        self.arity: int = arity
+
+        # a가 b보다 먼저 추출되어야 하면 True를 반환하는 비교 함수와 
+        # 여러 자식 노드 중 가장 먼저 추출되어야 할 노드를 고르는 함수.
+        self._before = operator.gt if max_mode else operator.lt
+        self._best = max if max_mode else min
+
+    @classmethod
+    def fromItems(
+            cls,
+            items: Iterable[tuple[Value, Priority]],
+            max_mode: bool = True,
+            arity: int = 2
+        ) -> (object):
+        """(value, priority) 쌍들로 우선순위 큐를 만들어 반환.
+
+        데이터를 하나씩 enqueue하지 않고(O(n log n)), 힙 배열을 한 번에 채운 뒤
+        마지막 부모 노드부터 거꾸로 힙 구조를 맞추는 heapify 방식을 사용하므로 O(n)이다.
+
+        Parameters
+        ----------
+        items : Iterable[tuple[Value, Priority]]
+            (value, priority) 쌍들.
+        max_mode, arity
+            PriorityQueue의 max_mode, arity와 같다.
+
+        """
+        pq = cls(max_mode, arity)
+        items = list(items)
+        pq._values = list(map(operator.itemgetter(0), items))
+        pq._priorities = list(map(operator.itemgetter(1), items))
+        pq.__heapify()
+        return pq
+
+    def __heapify(self) -> (None):
+        """힙 배열 전체의 힙 구조를 아래층의 부모 노드부터 차례로 맞춘다. O(n)
+
+        heapify 시 대부분의 노드는 맨 아래층 근처에 있어 금방 자리를 찾으므로, 
+        __siftDown()과 달리 매 층마다 비교하여 자리를 찾는 즉시 멈춘다.
+        """
+        values, priorities = self._values, self._priorities
+        before, best, arity = self._before, self._best, self.arity
+        size = len(values)
+        for start in range((size - 2) // arity, -1, -1):
+            value, priority = values[start], priorities[start]
+            index = start
+            child = index * arity + 1
+            while child < size:
+                if arity == 2:
+                    if child + 1 < size and before(priorities[child+1], priorities[child]):
+                        child += 1
+                else:
+                    siblings = priorities[child:child+arity]
+                    child += siblings.index(best(siblings))
+                if not before(priorities[child], priority):
+                    break
+                values[index] = values[child]
+                priorities[index] = priorities[child]
+                index = child
+                child = index * arity + 1
+            values[index] = value
+            priorities[index] = priority
+
+    def merge(self, other: 'PriorityQueue') -> (None):
+        """other의 모든 데이터를 현재 우선순위 큐에 합친다. other는 바뀌지 않는다.
+
+        합칠 데이터가 적으면 하나씩 위로 올리고(O(m log (n+m))), 
+        그렇지 않으면 두 힙 배열을 이어 붙인 뒤 heapify한다. (O(n+m))
+
+        Raises
+        ------
+        TypeError
+            other가 PriorityQueue가 아닌 경우.
+
+        """
+        if not isinstance(other, PriorityQueue):
+            raise TypeError("PriorityQueue 객체끼리만 합칠 수 있습니다.")
+        other_values, other_priorities = other._values[:], other._priorities[:]
+        total = len(self._values) + len(other_values)
+        if len(other_values) * total.bit_length() < total:
+            for item in zip(other_values, other_priorities):
+                self.enqueue(item)
+            return
+        self._values.extend(other_values)
+        self._priorities.extend(other_priorities)
+        self.__heapify()
+
+    def nlargest(self, k: int) -> (list[tuple[Value, Priority]]):
+        """priority 값이 가장 큰 데이터 k개를 큰 순서대로 반환. 
+        우선순위 큐는 바뀌지 않는다.
+        """
+        return self.__nBest(k, True)
+
+    def nsmallest(self, k: int) -> (list[tuple[Value, Priority]]):
+        """priority 값이 가장 작은 데이터 k개를 작은 순서대로 반환. 
+        우선순위 큐는 바뀌지 않는다.
+        """
+        return self.__nBest(k, False)
+
+    def __nBest(self, k: int, largest: bool) -> (list[tuple[Value, Priority]]):
+        """nlargest(), nsmallest()의 구현부.
+
+        찾으려는 방향이 힙의 방향(max_mode)과 같으면, 루트 노드에서 시작하여 
+        지금까지 꺼낸 노드들의 자식 노드만을 후보로 두는 작은 우선순위 큐를 이용해
+        O(k log k)만에 찾는다. 
+        방향이 반대이면 힙 구조를 이용할 수 없으므로 heapq로 전체를 훑는다. (O(n log k))
+        """
+        values, priorities, arity = self._values, self._priorities, self.arity
+        k = min(k, len(values))
+        if k <= 0:
+            return []
+        if largest != self.max_mode:
+            select = heapq.nlargest if largest else heapq.nsmallest
+            return select(
+                k, zip(values, priorities), key=operator.itemgetter(1)
+            )
+
+        result = []
+        # 후보 노드들의 (힙 배열 인덱스, 우선순위)를 저장하는 우선순위 큐.
+        candidates = PriorityQueue(self.max_mode)
+        candidates.enqueue(0, priorities[0])
+        while len(result) < k:
+            index = candidates.dequeue().value
+            result.append((values[index], priorities[index]))
+            first_child = index * arity + 1
+            for child in range(first_child, min(first_child + arity, len(values))):
+                candidates.enqueue(child, priorities[child])
+        return result
+
+    @property
+    def heap_array(self) -> (list[Data | None]):
+        """이전 버전과의 호환을 위한 속성. 
+        인덱스 0을 비워둔 Data 객체 리스트 형태로 힙 배열을 새로 만들어 반환한다.
+        """
+        return [None] + [
+            Data(value, priority) 
+            for value, priority in zip(self._values, self._priorities)
+        ]
+
+    @property
+    def N(self) -> (int):
+        """이전 버전과의 호환을 위한 속성. 현재 힙 내에 저장된 데이터의 수."""
+        return len(self._values)
 
     def __contains__(self, search: Value | Priority) -> (bool):
         """search가 우선순위 큐에 있는지 검사한 후, 존재하면 True, 
@@ -63,103 +227,55 @@ class PriorityQueue():
         # 매개변수 search의 자료형이 int가 아니라면 해당 변수는
         # Value에 해당된다고 가정.
         if not isinstance(search, int):
-            for data in self.heap_array[1:]:
-                if search == data.value: return True
-            return False
-        else:
-            for data in self.heap_array[1:]:
-                if search == data.priority: return True
-            return False
+            return search in self._values
+        return search in self._priorities
+
+    def __iter__(self) -> (Iterator[tuple[Value, Priority]]):
+        """우선순위 큐 내 모든 데이터를 showAll()과 같은 순서로 순회한다."""
+        return zip(self._values, self._priorities)
 
     def __repr__(self):
         if not self.isEmpty():
-            return_data = []
-            for data_obj in self.heap_array[1:]:
-                return_data.append((data_obj.value, data_obj.priority))
-            return str(return_data)
+            return str(self.showAll())
         return "None"
 
     def clear(self) -> (None):
         """우선순위 큐 내부를 모두 비운다."""
-        del self.heap_array
-        self.heap_array: list[Data] = [None]
+        self._values = []
+        self._priorities = []
 
     def showAll(self) -> (list[tuple[Value, Priority]]):
         """우선순위 큐 내 모든 데이터 반환."""
-        all_data = []
-        for data in self.heap_array[1:]:
-            all_data.append((data.value, data.priority))
-        return all_data
+        return list(zip(self._values, self._priorities))
 
     def isEmpty(self) -> (bool):
         """현재 우선순위 큐가 비어있는지 확인. 
         비어있으면 True 반환.
         """
-        return self.getCurrentSize() == 0
+        return not self._values
 
     def getCurrentSize(self) -> (int):
-        """현재 힙 내에 저장된 데이터의 수 업데이트 및 반환."""
-        self.N = len(self.heap_array) - 1
-        return self.N
+        """현재 힙 내에 저장된 데이터의 수 반환."""
+        return len(self._values)
+
+    def getArity(self) -> (int): return self.arity
 
     def peek(self) -> (Data | None):
         """최우선순위 데이터를 반환. 
         검색만 하고 실제로 큐에서 제거하진 않는다. 
         """
-        return self.heap_array[1] if not self.isEmpty() else None
-
-    def __isLess(self, a: Data | None, b: Data | None) -> (bool | None):
-        """a < b ?
-
-        힙 내에 존재하는 두 데이터 간 우선순위의 대소를 비교 후, 
-        a가 작으면 True, b가 작으면 False 반환. 
-        만약 a, b 중 하나라도 None이면 None을 반환. 
-        """
-        if (a is None) or (b is None): return None
-        return a.priority < b.priority
-
-    def __switchData(self, a_index: int | None, b_index: int | None) -> (None):
-        """
-        힙 내에 두 데이터의 위치를 바꾼다. 
-        바꾸고자 하는 두 데이터의 인덱스를 입력한다. 
-        a, b 인덱스 매개변수 중 하나라도 None이면 아무런 작업을 수행하지 않음. 
-        """
-        if a_index is None or b_index is None: return
-        self.heap_array[a_index], self.heap_array[b_index] = \
-        self.heap_array[b_index], self.heap_array[a_index]
-
-    def __getParent(self, child_index: int) -> (tuple[Data, int] | None):
-        """
-        힙 내의 특정 데이터의 부모 데이터 및 부모 데이터의 인덱스를 반환.
-        부모 데이터가 존재하지 않으면 None을 반환.
-        """
-        parent_index = child_index // 2
-        if parent_index >= 1:
-            return (self.heap_array[parent_index], parent_index)
-        return None
+        if not self._values:
+            return None
+        return Data(self._values[0], self._priorities[0])
 
-    def __getChild(self, parent_index: int) \
-        -> (tuple[tuple[Data, int] | tuple[None, None], tuple[Data, int] | tuple[None, None]]):
-        """
-        힙 내의 특정 데이터의 두 자식 데이터를 반환. 
-        자식 데이터가 존재하지 않으면 None을 반환. 
-        """
-        lchild_index = parent_index * 2
-        rchild_index = parent_index * 2 + 1
-        #if lchild_index <= self.N:
-        if lchild_index <= self.getCurrentSize():
-            lchild = (self.heap_array[lchild_index], lchild_index)
-        else: lchild = (None, None)
-        #if rchild_index <= self.N:
-        if rchild_index <= self.getCurrentSize():
-            rchild = (self.heap_array[rchild_index], rchild_index)
-        else: rchild = (None, None)
-        return (lchild, rchild)
-
-    @dispatch(object, int)
-    def enqueue(self, value: any, priority: int) -> (None):
+    def enqueue(self, *args) -> (None):
         """새 데이터 입력. 
 
+        enqueue(value, priority) 또는 enqueue((value, priority)) 형태로 호출한다.
+        새 데이터를 힙 배열 맨 끝에 넣은 뒤 부모 노드들과 비교하며 위로 올리는데, 
+        매 단계마다 두 데이터를 맞바꾸지 않고, 부모 데이터를 아래로 내려 빈 자리를
+        위로 옮긴 뒤 마지막에 한 번만 새 데이터를 기록한다.
+
         Parameters
         ----------
         value : Any
@@ -168,55 +284,33 @@ class PriorityQueue():
             우선순위 값.
 
         """
-        self.__enqueue(Data(value, priority))
-
-    @dispatch(tuple)
-    def enqueue(self, value_priority: tuple[any, int]) -> (None):
-        """새 데이터 입력.
-
-        Parameters
-        ----------
-        value_priority : (value, priority)
-
-        """
-        self.__enqueue(Data(value_priority[0], value_priority[1]))
-
-    def __enqueue(self, new_data: Data) -> (None):
-        """새 데이터 입력. 
-        
-        Parameters
-        ----------
-        new_data
-            Data(value, priority) 형태로 작성.
-            반드시 Data 객체를 사용하여 값과 우선순위를 전달해야 함.
-        
-        """
-        self.heap_array.append(new_data)
-
-        # 힙 구조 재구성
-        target_index = self.getCurrentSize()
-        target_data = self.heap_array[target_index]
-        parent = self.__getParent(target_index)
-        while parent:
-            parent_data, parent_index = parent
-            if self.max_mode:
-                condition = self.__isLess(parent_data, target_data)
-            else:
-                condition = self.__isLess(target_data, parent_data)
-            if condition:
-                self.__switchData(parent_index, target_index)
-                target_index = parent_index
-                target_data = self.heap_array[target_index]
-                parent = self.__getParent(target_index)
-            else: break  # 이미 경로 내 정렬이 모두 끝났으므로 작업 종료.
+        # multipledispatch를 이용한 오버로딩은 호출마다 인자 타입을 검사하는 비용이 
+        # 힙 연산 자체보다 커서, 인자 개수로 두 호출 형태를 구분한다.
+        if len(args) == 2:
+            value, priority = args
+        else:
+            (value, priority), = args
+        values, priorities = self._values, self._priorities
+        before, arity = self._before, self.arity
+        values.append(value)
+        priorities.append(priority)
+        index = len(values) - 1
+        while index > 0:
+            parent = (index - 1) // arity
+            if not before(priority, priorities[parent]):
+                break  # 이미 경로 내 정렬이 모두 끝났으므로 작업 종료.
+            values[index] = values[parent]
+            priorities[index] = priorities[parent]
+            index = parent
+        values[index] = value
+        priorities[index] = priority
 
     def dequeue(self) -> (Data | None):
         """최우선순위 데이터 반환 후 우선순위 큐 내에서 삭제. 
 
-        최대 이진 힙의 경우, 힙 구조 변경 시 두 자식 노드들 중 더 큰 
-        우선순위 값을 가지는 자식 노드와 부모 노드의 위치를 바꾼다. 
-        최소 이진 힙의 경우, 힙 구조 변경 시 두 자식 노드들 중 더 작은 
-        우선순위 값을 가지는 자식 노드와 부모 노드의 위치를 바꾼다. 
+        힙 배열의 맨 마지막 데이터를 맨 앞으로 옮긴 뒤, 최대 힙의 경우 자식 노드들 중 
+        가장 큰 우선순위 값을, 최소 힙의 경우 가장 작은 우선순위 값을 가지는 
+        자식 노드와 비교하며 아래로 내린다. 
 
         Returns
         -------
@@ -226,66 +320,186 @@ class PriorityQueue():
             큐 내에 데이터가 하나도 없을 때 반환됨. 
         
         """
-        try:
-            return_data = self.heap_array[1]
-        except IndexError:
+        values, priorities = self._values, self._priorities
+        if not values:
             print("우선순위 큐가 비어있어 추출할 데이터가 없습니다.")
             return None
 
-        if self.getCurrentSize() <= 1:
-            # 힙 구조에 딱 하나의 값만 존재하는 경우 (그리고 해당 값을 삭제하려는 경우),
-            # 힙 구조를 재구성할 필요가 없다.
-            del self.heap_array[-1]
-            return return_data
-
-        # 힙 구조 재구성
-        self.__switchData(1, self.getCurrentSize())
-        del self.heap_array[-1]
-        target_index = 1
-        target_data = self.heap_array[target_index]
-        lchild, rchild = self.__getChild(target_index)
-        while (lchild or rchild) != (None, None):
-            lchild_data, lchild_index = lchild
-            rchild_data, rchild_index = rchild
-            if self.max_mode:
-                condition1 = self.__isLess(target_data, lchild_data) or \
-                self.__isLess(target_data, rchild_data)
-            else:
-                condition1 = self.__isLess(lchild_data, target_data) or \
-                self.__isLess(rchild_data, target_data)
-            condition2 = self.__isLess(lchild_data, rchild_data)
-
-            if condition1:
-                if condition2 is True:
-                    if self.max_mode:
-                        self.__switchData(target_index, rchild_index)
-                        target_index = rchild_index
-                    else:
-                        self.__switchData(target_index, lchild_index)
-                        target_index = lchild_index
-                    target_data = self.heap_array[target_index]
-                elif condition2 is False:
-                    if self.max_mode:
-                        self.__switchData(target_index, lchild_index)
-                        target_index = lchild_index
-                    else:
-                        self.__switchData(target_index, rchild_index)
-                        target_index = rchild_index
-                    target_data = self.heap_array[target_index]
-                else:
-                    # if condition2 is None
-                    if self.max_mode:
-                        if rchild_data is None and self.__isLess(target_data, lchild_data):
-                            self.__switchData(target_index, lchild_index)
-                    else:
-                        if rchild_data is None and self.__isLess(lchild_data, target_data):
-                            self.__switchData(target_index, lchild_index)
-                    target_index = lchild_index
-                    target_data = self.heap_array[target_index]
-                lchild, rchild = self.__getChild(target_index)
-            else: break  # 이미 경로 내 정렬이 모두 끝났으므로 작업 종료.
+        return_data = Data(values[0], priorities[0])
+        value, priority = values.pop(), priorities.pop()
+        if values:
+            self.__siftDown(0, value, priority)
         return return_data
 
+    def __siftDown(self, index: int, value: Value, priority: Priority) -> (None):
+        """index 위치를 빈 자리로 보고 (value, priority)가 들어갈 자리를 찾는다.
+
+        dequeue 시 맨 앞으로 옮겨지는 맨 마지막 데이터는 대개 우선순위가 낮아
+        힙 구조의 맨 아래층 근처까지 내려가야 한다. 따라서 매 층마다 (value, priority)와
+        비교하지 않고, 가장 먼저 추출되어야 할 자식 데이터를 위로 올리며 빈 자리를
+        맨 아래층까지 내린 뒤, 그 자리에서 (value, priority)를 필요한 만큼만 다시 올린다.
+        """
+        values, priorities = self._values, self._priorities
+        before, best, arity = self._before, self._best, self.arity
+        size = len(values)
+        start = index
+        child = index * arity + 1
+        while child < size:
+            if arity == 2:
+                if child + 1 < size and before(priorities[child+1], priorities[child]):
+                    child += 1
+            else:
+                # 자식 노드들의 우선순위를 잘라내어 내장 함수 max(), min()과 
+                # list.index()로 가장 먼저 추출되어야 할 자식 노드를 찾는다.
+                siblings = priorities[child:child+arity]
+                child += siblings.index(best(siblings))
+            values[index] = values[child]
+            priorities[index] = priorities[child]
+            index = child
+            child = index * arity + 1
+        while index > start:
+            parent = (index - 1) // arity
+            if not before(priority, priorities[parent]):
+                break
+            values[index] = values[parent]
+            priorities[index] = priorities[parent]
+            index = parent
+        values[index] = value
+        priorities[index] = priority
+
+
+class AsyncPriorityQueue(asyncio.Queue):
+    """asyncio에서 await할 수 있는 우선순위 큐. 
+
+    asyncio.Queue의 항목 저장 방식(_init, _put, _get)만 PriorityQueue로 바꾼 것으로, 
+    항목을 꺼내는 순서는 PriorityQueue와 같다. 
+    항목은 (value, priority) 튜플로 넣으며, 꺼낼 때는 PriorityQueue.dequeue()와 같이 
+    Data 객체를 반환한다. 
+    await put(), await get()과 최대 크기(maxsize), 대기 중 취소(cancel) 처리 등은 
+    asyncio.Queue를 그대로 따른다. 
+    큐가 비었거나 가득 찼을 때는 이벤트 루프에 제어를 넘기고 기다리므로, 
+    큐를 반복해서 확인하는(polling) 방식과 달리 기다리는 동안 CPU를 사용하지 않는다.
+
+    ex) 
+    pq = AsyncPriorityQueue(maxsize=100, max_mode=False)
+    await pq.put(('작업', 3))
+    data = await pq.get()  # data.value, data.priority
+    """
+    def __init__(self, maxsize: int = 0, max_mode: bool = True) -> (None):
+        """
+        Parameters
+        ----------
+        maxsize : int, default 0
+            큐에 저장할 수 있는 최대 항목 수. 0 이하이면 크기 제한이 없다.
+        max_mode : bool, default True
+            PriorityQueue의 max_mode와 같다. 
+            True이면 priority 값이 가장 큰 데이터부터, 
+            False이면 priority 값이 가장 작은 데이터부터 꺼낸다.
+
+        """
+        self._max_mode = max_mode
+        super().__init__(maxsize)
+
+    def _init(self, maxsize: int) -> (None):
+        self._queue = PriorityQueue(self._max_mode)
+
+    def _put(self, item: tuple[Value, Priority]) -> (None):
+        self._queue.enqueue(tuple(item))
+
+    def _get(self) -> (Data):
+        return self._queue.dequeue()
+
+    def qsize(self) -> (int):
+        """현재 힙 내에 저장된 데이터의 수 반환."""
+        return self._queue.getCurrentSize()
+
+    def empty(self) -> (bool):
+        return self._queue.isEmpty()
+
+    async def drain(
+            self,
+            timeout: float | None = 0
+        ) -> (AsyncGenerator[Data, None]):
+        """큐의 항목들을 차례로 꺼내어 반환하는 비동기 제너레이터. (async for)
+
+        큐가 비면 timeout초 동안 새 항목이 들어오기를 기다리고, 
+        그래도 들어오지 않으면 끝난다. 
+
+        Parameters
+        ----------
+        timeout : float | None, default 0
+            0이면 기다리지 않고 바로 끝나며, None이면 새 항목을 끝없이 기다린다.
+
+        """
+        while True:
+            if not self.empty():
+                yield self.get_nowait()
+                continue
+            if timeout == 0:
+                return
+            try:
+                item = await asyncio.wait_for(self.get(), timeout)
+            except asyncio.TimeoutError:
+                return
+            yield item
+
+    def __aiter__(self) -> (AsyncGenerator[Data, None]):
+        """async for로 큐가 빌 때까지 항목들을 꺼낸다. (drain() 참고)"""
+        return self.drain()
+
+
+def compare_arity(
+        n: int = 100000,
+        arities: Iterable[int] = (2, 4, 8),
+        seed: int | None = 0
+    ) -> (dict[tuple[str, int], float]):
+    """arity별 PriorityQueue의 처리 시간(초)을 두 가지 작업 비율에 대해 비교한다.
+
+    - 'enqueue-heavy': n개의 데이터를 넣은 뒤, 하나를 꺼낼 때마다 3개를 넣는 작업을 
+      n // 4번 반복한다.
+    - 'dequeue-heavy': n개의 데이터를 넣은 뒤, 모두 꺼낸다.
+
+    Parameters
+    ----------
+    n : int, default 100000
+        처음 넣을 데이터 수.
+    arities : Iterable[int], default (2, 4, 8)
+        비교할 arity 값들.
+    seed : int | None, default 0
+        우선순위 값을 정하는 난수 생성기의 시드.
+
+    Returns
+    -------
+    dict[tuple[str, int], float]
+        (작업 비율, arity)별 총 소요 시간(초).
+
+    """
+    rng = random.Random(seed)
+    priorities = [rng.randrange(n * 10) for _ in range(n)]
+    extra = [rng.randrange(n * 10) for _ in range(n // 4 * 3)]
+
+    result = {}
+    for arity in arities:
+        pq = PriorityQueue(arity=arity)
+        start = time.perf_counter()
+        for i, priority in enumerate(priorities):
+            pq.enqueue(i, priority)
+        for i in range(0, len(extra), 3):
+            pq.dequeue()
+            pq.enqueue(i, extra[i])
+            pq.enqueue(i + 1, extra[i+1])
+            pq.enqueue(i + 2, extra[i+2])
+        result[('enqueue-heavy', arity)] = time.perf_counter() - start
+
+        pq = PriorityQueue(arity=arity)
+        for i, priority in enumerate(priorities):
+            pq.enqueue(i, priority)
+        start = time.perf_counter()
+        while not pq.isEmpty():
+            pq.dequeue()
+        result[('dequeue-heavy', arity)] = time.perf_counter() - start
+    return result
+
 
 def test_pq1():
     test_dataset = [
@@ -0,0 +1,136 @@
+import unittest
+import sys
+import random
+
+from dirimporttool import get_super_dir_directly
+super_dir = get_super_dir_directly(__file__, 2)
+sys.path.append(super_dir)
+
+from heap_and_priority_queue.indexed_priorityqueue import IndexedPriorityQueue
+
+
+class TestIndexedPQ(unittest.TestCase):
+    def setUp(self):
+        self.test_data = [
+            ('고양이', 15), ('개', 13), ('고슴도치', 14), ('호랑이', 9),
+            ('사자', 11), ('바다사자', 12), ('족제비', 3), ('수달', 8),
+            ('뱀', 2), ('소', 1), ('펭귄', 10), ('북극곰', 7),
+        ]
+
+    def drain(self, ipq: IndexedPriorityQueue) -> (list[tuple]):
+        result = []
+        while not ipq.isEmpty():
+            data = ipq.dequeue()
+            result.append((data.value, data.priority))
+        return result
+
+    def testEmptyPQ(self):
+        """
+        빈 우선순위 큐 테스트.
+        """
+        ipq = IndexedPriorityQueue()
+        self.assertEqual(ipq.isEmpty(), True)
+        self.assertEqual(len(ipq), 0)
+        self.assertEqual(ipq.__repr__(), "None")
+        self.assertEqual(ipq.peek(), None)
+        self.assertEqual(ipq.dequeue(), None)
+        self.assertEqual('곰' in ipq, False)
+        self.assertRaises(KeyError, ipq.remove, '곰')
+        self.assertRaises(KeyError, ipq.decreaseKey, '곰', 1)
+
+    def testEnqueueAndDequeue(self):
+        """
+        최대, 최소 모드에서 우선순위 순서대로 추출되는지 테스트.
+        """
+        max_pq = IndexedPriorityQueue()
+        min_pq = IndexedPriorityQueue(max_mode=False)
+        for value, priority in self.test_data:
+            max_pq.enqueue(value, priority)
+            min_pq.enqueue(value, priority)
+        self.assertEqual(max_pq.getCurrentSize(), len(self.test_data))
+        self.assertEqual(max_pq.peek().value, '고양이')
+        self.assertEqual(min_pq.peek().value, '소')
+        self.assertEqual('펭귄' in max_pq, True)
+        self.assertEqual(max_pq.getPriority('펭귄'), 10)
+        self.assertRaises(ValueError, max_pq.enqueue, '펭귄', 5)
+
+        expected = sorted(self.test_data, key=lambda data: data[1])
+        self.assertEqual(self.drain(min_pq), expected)
+        self.assertEqual(self.drain(max_pq), expected[::-1])
+        self.assertEqual('펭귄' in max_pq, False)
+
+    def testChangeKey(self):
+        """
+        decreaseKey(), increaseKey(), changeKey() 테스트.
+        """
+        ipq = IndexedPriorityQueue.fromItems(self.test_data, max_mode=False)
+        ipq.decreaseKey('고양이', 0)
+        self.assertEqual(ipq.peek().value, '고양이')
+        ipq.increaseKey('고양이', 20)
+        ipq.increaseKey('소', 16)
+        self.assertEqual(ipq.peek().value, '뱀')
+        self.assertRaises(ValueError, ipq.decreaseKey, '뱀', 5)
+        self.assertRaises(ValueError, ipq.increaseKey, '뱀', 1)
+        ipq.changeKey('개', -1)
+        ipq.changeKey('곰', 100)
+        self.assertEqual(ipq.getCurrentSize(), len(self.test_data) + 1)
+
+        result = self.drain(ipq)
+        self.assertEqual(result[0], ('개', -1))
+        self.assertEqual(result[-3:], [('소', 16), ('고양이', 20), ('곰', 100)])
+
+    def testRemove(self):
+        """
+        특정 값의 데이터 삭제 테스트.
+        """
+        ipq = IndexedPriorityQueue.fromItems(self.test_data)
+        removed = ipq.remove('사자')
+        self.assertEqual((removed.value, removed.priority), ('사자', 11))
+        self.assertEqual('사자' in ipq, False)
+        ipq.remove('고양이')
+        ipq.remove(ipq.showAll()[-1][0])
+        self.assertEqual(ipq.peek().value, '고슴도치')
+        result = self.drain(ipq)
+        self.assertEqual(result, sorted(result, key=lambda data: -data[1]))
+        self.assertEqual(len(result), len(self.test_data) - 3)
+
+    def testFromItems(self):
+        """
+        heapify 방식의 fromItems() 테스트.
+        """
+        ipq = IndexedPriorityQueue.fromItems(self.test_data)
+        self.assertEqual(sorted(ipq.showAll()), sorted(self.test_data))
+        self.assertEqual(
+            self.drain(ipq), sorted(self.test_data, key=lambda data: -data[1])
+        )
+        self.assertRaises(
+            ValueError, IndexedPriorityQueue.fromItems, [('a', 1), ('a', 2)]
+        )
+
+    def testRandomOperations(self):
+        """
+        무작위 삽입, 삭제, 우선순위 변경 결과가 딕셔너리로 계산한 결과와 같은지 확인.
+        """
+        rng = random.Random(0)
+        ipq = IndexedPriorityQueue(max_mode=False)
+        expected = {}
+        for _ in range(3000):
+            value = rng.randrange(300)
+            op = rng.random()
+            if op < 0.4:
+                priority = rng.randrange(1000)
+                ipq.changeKey(value, priority)
+                expected[value] = priority
+            elif op < 0.6 and value in expected:
+                ipq.remove(value)
+                del expected[value]
+            elif op < 0.8 and not ipq.isEmpty():
+                data = ipq.dequeue()
+                self.assertEqual(data.priority, min(expected.values()))
+                self.assertEqual(expected.pop(data.value), data.priority)
+            self.assertEqual(len(ipq), len(expected))
+        self.assertEqual(sorted(ipq.showAll()), sorted(expected.items()))
+
+
+if __name__ == '__main__':
+    unittest.main()
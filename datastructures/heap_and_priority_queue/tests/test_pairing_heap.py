@@ -0,0 +1,139 @@
+import unittest
+import sys
+import random
+
+from dirimporttool import get_super_dir_directly
+super_dir = get_super_dir_directly(__file__, 2)
+sys.path.append(super_dir)
+
+from heap_and_priority_queue.pairing_heap import (
+    PairingHeap, compare_decrease_key
+)
+
+
+class TestPairingHeap(unittest.TestCase):
+    def setUp(self):
+        self.test_data = [
+            ('고양이', 15), ('개', 13), ('고슴도치', 14), ('호랑이', 9),
+            ('사자', 11), ('바다사자', 12), ('족제비', 3), ('수달', 8),
+            ('뱀', 2), ('소', 1), ('펭귄', 10), ('북극곰', 7),
+        ]
+
+    def drain(self, heap: PairingHeap) -> (list[tuple]):
+        result = []
+        while not heap.isEmpty():
+            data = heap.dequeue()
+            result.append((data.value, data.priority))
+        return result
+
+    def testEmptyHeap(self):
+        """
+        빈 페어링 힙 테스트.
+        """
+        heap = PairingHeap()
+        self.assertEqual(heap.isEmpty(), True)
+        self.assertEqual(len(heap), 0)
+        self.assertEqual(heap.__repr__(), "None")
+        self.assertEqual(heap.peek(), None)
+        self.assertEqual(heap.dequeue(), None)
+        self.assertEqual('곰' in heap, False)
+        self.assertRaises(KeyError, heap.remove, '곰')
+        self.assertRaises(KeyError, heap.decreaseKey, '곰', 1)
+
+    def testEnqueueAndDequeue(self):
+        """
+        최대, 최소 모드에서 우선순위 순서대로 추출되는지 테스트.
+        """
+        max_heap = PairingHeap()
+        min_heap = PairingHeap.fromItems(self.test_data, max_mode=False)
+        for value, priority in self.test_data:
+            max_heap.enqueue(value, priority)
+        self.assertEqual(max_heap.getCurrentSize(), len(self.test_data))
+        self.assertEqual(max_heap.peek().value, '고양이')
+        self.assertEqual(min_heap.peek().value, '소')
+        self.assertEqual(sorted(min_heap.showAll()), sorted(self.test_data))
+        self.assertEqual(max_heap.getPriority('펭귄'), 10)
+        self.assertRaises(ValueError, max_heap.enqueue, '펭귄', 5)
+
+        expected = sorted(self.test_data, key=lambda data: data[1])
+        self.assertEqual(self.drain(min_heap), expected)
+        self.assertEqual(self.drain(max_heap), expected[::-1])
+        self.assertEqual('펭귄' in max_heap, False)
+
+    def testChangeKeyAndRemove(self):
+        """
+        decreaseKey(), increaseKey(), changeKey(), remove() 테스트.
+        """
+        heap = PairingHeap.fromItems(self.test_data, max_mode=False)
+        heap.dequeue()
+        heap.decreaseKey('고양이', 0)
+        self.assertEqual(heap.peek().value, '고양이')
+        heap.increaseKey('고양이', 20)
+        self.assertEqual(heap.peek().value, '뱀')
+        self.assertRaises(ValueError, heap.decreaseKey, '뱀', 5)
+        self.assertRaises(ValueError, heap.increaseKey, '뱀', 1)
+        heap.changeKey('개', -1)
+        heap.changeKey('곰', 100)
+        removed = heap.remove('사자')
+        self.assertEqual((removed.value, removed.priority), ('사자', 11))
+        heap.remove('개')
+
+        result = self.drain(heap)
+        self.assertEqual(result[0], ('뱀', 2))
+        self.assertEqual(result[-2:], [('고양이', 20), ('곰', 100)])
+        self.assertEqual(len(result), len(self.test_data) - 2)
+
+    def testMeld(self):
+        """
+        두 페어링 힙을 합치는 meld() 테스트.
+        """
+        heap = PairingHeap.fromItems(self.test_data[:6])
+        other = PairingHeap.fromItems(self.test_data[6:])
+        heap.meld(other)
+        self.assertEqual(other.isEmpty(), True)
+        self.assertEqual('소' in heap, True)
+        self.assertEqual(
+            self.drain(heap), sorted(self.test_data, key=lambda data: -data[1])
+        )
+        self.assertRaises(TypeError, heap.meld, PairingHeap(max_mode=False))
+        heap.enqueue('곰', 1)
+        other.enqueue('곰', 2)
+        self.assertRaises(ValueError, heap.meld, other)
+
+    def testRandomOperations(self):
+        """
+        무작위 삽입, 삭제, 우선순위 변경 결과가 딕셔너리로 계산한 결과와 같은지 확인.
+        """
+        rng = random.Random(0)
+        for max_mode in [True, False]:
+            heap = PairingHeap(max_mode)
+            best = max if max_mode else min
+            expected = {}
+            for _ in range(3000):
+                value = rng.randrange(300)
+                op = rng.random()
+                if op < 0.4:
+                    priority = rng.randrange(1000)
+                    heap.changeKey(value, priority)
+                    expected[value] = priority
+                elif op < 0.6 and value in expected:
+                    heap.remove(value)
+                    del expected[value]
+                elif op < 0.8 and not heap.isEmpty():
+                    data = heap.dequeue()
+                    self.assertEqual(data.priority, best(expected.values()))
+                    self.assertEqual(expected.pop(data.value), data.priority)
+                self.assertEqual(len(heap), len(expected))
+            self.assertEqual(sorted(heap.showAll()), sorted(expected.items()))
+
+    def testCompareDecreaseKey(self):
+        """
+        두 우선순위 큐로 구한 Dijkstra 결과의 decreaseKey 호출 수가 기록되는지 확인.
+        """
+        result = compare_decrease_key(n=50, density=0.5)
+        self.assertEqual(set(result), {'IndexedPriorityQueue', 'PairingHeap'})
+        self.assertTrue(all(n_decrease > 0 for _, n_decrease in result.values()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,11 +1,15 @@
 import unittest
 import sys
+import asyncio
+import random
 
 from dirimporttool import get_super_dir_directly
 super_dir = get_super_dir_directly(__file__, 2)
 sys.path.append(super_dir)
 
-from heap_and_priority_queue.priorityqueue import PriorityQueue
+from heap_and_priority_queue.priorityqueue import (
+    PriorityQueue, AsyncPriorityQueue, compare_arity
+)
 
 
 class TestPQ(unittest.TestCase):
@@ -87,6 +91,135 @@ class TestPQ(unittest.TestCase):
         get_result = pq.dequeue()
         self.assertEqual(get_result, None)
 
+    def testArity(self):
+        """
+        d-ary 힙에서도 우선순위 순서대로 추출되는지 테스트.
+        """
+        self.assertRaises(ValueError, PriorityQueue, True, 1)
+        rng = random.Random(0)
+        for arity in [2, 3, 4, 8]:
+            for max_mode in [True, False]:
+                pq = PriorityQueue(max_mode, arity=arity)
+                self.assertEqual(pq.getArity(), arity)
+                expected = []
+                for i in range(500):
+                    if expected and rng.random() < 0.3:
+                        data = pq.dequeue()
+                        best = max(expected) if max_mode else min(expected)
+                        self.assertEqual(data.priority, best)
+                        expected.remove(best)
+                    else:
+                        priority = rng.randrange(100)
+                        pq.enqueue(i, priority)
+                        expected.append(priority)
+                result = []
+                while not pq.isEmpty():
+                    result.append(pq.dequeue().priority)
+                self.assertEqual(result, sorted(expected, reverse=max_mode))
+
+    def testFromItemsAndMerge(self):
+        """
+        heapify 방식의 fromItems()와 merge() 테스트.
+        """
+        for arity in [2, 3]:
+            pq = PriorityQueue.fromItems(self.test_data, arity=arity)
+            self.assertEqual(sorted(pq.showAll()), sorted(self.test_data))
+            self.assertEqual(pq.peek().priority, 15)
+
+            small = PriorityQueue.fromItems([('하마', 20)], arity=arity)
+            large = PriorityQueue.fromItems(self.test_data, False, arity)
+            pq.merge(small)
+            pq.merge(large)
+            self.assertEqual(small.getCurrentSize(), 1)
+            self.assertEqual(large.peek().priority, 1)
+            self.assertEqual(pq.getCurrentSize(), len(self.test_data) * 2 + 1)
+            result = []
+            while not pq.isEmpty():
+                result.append(pq.dequeue().priority)
+            expected = [p for _, p in self.test_data] * 2 + [20]
+            self.assertEqual(result, sorted(expected, reverse=True))
+
+        self.assertEqual(PriorityQueue.fromItems([]).isEmpty(), True)
+        self.assertRaises(TypeError, PriorityQueue().merge, [('하마', 1)])
+
+    def testNLargestAndNSmallest(self):
+        """
+        nlargest(), nsmallest()가 힙을 바꾸지 않고 결과를 반환하는지 테스트.
+        """
+        priorities = sorted(p for _, p in self.test_data)
+        for max_mode in [True, False]:
+            pq = PriorityQueue.fromItems(self.test_data, max_mode, 4)
+            before = pq.showAll()
+            largest = pq.nlargest(5)
+            self.assertEqual([p for _, p in largest], priorities[::-1][:5])
+            self.assertEqual(largest[0], ('고양이', 15))
+            smallest = pq.nsmallest(3)
+            self.assertEqual(smallest, [('소', 1), ('뱀', 2), ('고릴라', 4)])
+            self.assertEqual(len(pq.nsmallest(100)), len(self.test_data))
+            self.assertEqual(pq.nlargest(0), [])
+            self.assertEqual(pq.showAll(), before)
+        self.assertEqual(PriorityQueue().nlargest(3), [])
+
+    def testCompareArity(self):
+        """
+        arity 비교 결과에 모든 (작업 비율, arity) 조합이 포함되는지 확인.
+        """
+        result = compare_arity(n=200, arities=(2, 4))
+        self.assertEqual(len(result), 4)
+        self.assertTrue(all(elapsed >= 0 for elapsed in result.values()))
+
+
+class TestAsyncPQ(unittest.IsolatedAsyncioTestCase):
+    async def test_repr(self):
+        """
+        항목이 있는 우선순위 큐의 repr() 테스트.
+        """
+        pq = AsyncPriorityQueue()
+        await pq.put(('a', 3))
+        self.assertIn("_queue=[('a', 3)]", repr(pq))
+        self.assertEqual(list(pq._queue), pq._queue.showAll())
+        self.assertIn("maxsize=0", str(pq))
+
+    async def test_order_and_drain(self):
+        """
+        우선순위 순서와 async for를 이용한 drain 테스트.
+        """
+        dataset = [('a', 3), ('b', 1), ('c', 5), ('d', 2)]
+        max_pq = AsyncPriorityQueue()
+        min_pq = AsyncPriorityQueue(max_mode=False)
+        for data in dataset:
+            await max_pq.put(data)
+            await min_pq.put(data)
+        self.assertEqual(max_pq.qsize(), 4)
+        self.assertEqual((await max_pq.get()).value, 'c')
+        self.assertEqual(
+            [data.priority async for data in max_pq], [3, 2, 1]
+        )
+        self.assertEqual(
+            [data.value async for data in min_pq], ['b', 'd', 'a', 'c']
+        )
+
+    async def test_wait_for_item(self):
+        """
+        빈 큐에서 get이 항목이 들어올 때까지 기다리는지, 
+        최대 크기에서 put이 기다리는지 테스트.
+        """
+        pq = AsyncPriorityQueue(maxsize=1)
+        getter = asyncio.create_task(pq.get())
+        await asyncio.sleep(0)
+        self.assertFalse(getter.done())
+        await pq.put(('a', 1))
+        self.assertEqual((await asyncio.wait_for(getter, 1)).value, 'a')
+
+        await pq.put(('b', 1))
+        producer = asyncio.create_task(pq.put(('c', 9)))
+        await asyncio.sleep(0)
+        self.assertFalse(producer.done())
+        self.assertEqual((await pq.get()).value, 'b')
+        await asyncio.wait_for(producer, 1)
+        self.assertEqual((await pq.get()).value, 'c')
+
+
 if __name__ == '__main__':
     unittest.main()
     
\ No newline at end of file
@@ -0,0 +1,510 @@
+"""여러 스레드에서 동시에 사용할 수 있는 연결리스트 큐, 스택 구현.
+
+ConcurrentLinkedListQueue는 맨 앞(삭제)과 맨 뒤(삽입)에 각각 락을 두는
+두 개의 락(two-lock) 큐이다. 맨 앞에는 값을 저장하지 않는 더미 노드를 두어
+생산자(enqueue)는 맨 뒤 노드만, 소비자(dequeue)는 맨 앞 노드만 바꾸므로
+생산자와 소비자가 서로의 락을 기다리지 않는다.
+
+ConcurrentLinkedListStack은 삽입과 삭제가 모두 맨 위 노드에서 일어나므로
+하나의 락을 사용한다.
+
+두 자료구조 모두 최대 크기(maxsize)를 지정할 수 있으며,
+큐(스택)가 가득 찼거나 비어 있을 때 timeout까지 기다리는 blocking 연산을 지원한다.
+기다려도 연산을 할 수 없으면 표준 라이브러리 queue 모듈의 Full, Empty 예외를 발생시킨다.
+"""
+import queue
+import threading
+import time
+from typing import Callable
+
+try:
+    from my_linked_list import Node
+except ModuleNotFoundError:
+    from linked_list.my_linked_list import Node
+
+__all__ = [
+    'ConcurrentLinkedListQueue',
+    'ConcurrentLinkedListStack',
+    'compare_throughput',
+]
+
+# type alias
+Value = object
+
+
+def _wait_for(
+        condition: threading.Condition,
+        predicate: Callable[[], bool],
+        block: bool,
+        timeout: float | None,
+        exc_type: type[Exception]
+    ) -> (None):
+    """condition의 락을 가진 상태에서 predicate()가 참이 될 때까지 기다린다.
+    기다릴 수 없거나(block=False) timeout초가 지나도 참이 되지 않으면
+    exc_type 예외를 발생시킨다.
+    """
+    if predicate():
+        return
+    if not block:
+        raise exc_type
+    if timeout is not None and timeout < 0:
+        raise ValueError("timeout은 0 이상이어야 합니다.")
+    if not condition.wait_for(predicate, timeout):
+        raise exc_type
+
+
+class ConcurrentLinkedListQueue():
+    """두 개의 락을 사용하는 스레드 안전(thread-safe) 연결리스트 큐.
+
+    _put_lock은 맨 뒤 노드(self._tail)를, _take_lock은 맨 앞 더미 노드(self._head)를
+    보호한다. 두 락 모두가 필요한 연산(clear, __repr__)은
+    항상 _put_lock, _take_lock 순서로 잠가 교착 상태를 피한다.
+    """
+    def __init__(self, maxsize: int = 0) -> (None):
+        """
+        Parameters
+        ----------
+        maxsize : int, default 0
+            큐에 저장할 수 있는 최대 값의 수. 0이면 크기 제한이 없다.
+
+        Attributes
+        ----------
+        self._head : Node
+            값을 저장하지 않는 더미 노드. 맨 앞 값은 self._head.pointer에 있다.
+        self._tail : Node
+            맨 뒤 노드. 큐가 비어 있으면 self._head와 같다.
+        self._count : int
+            큐 내 값의 수. _count_lock을 잡은 상태에서만 바꾼다.
+
+        Raises
+        ------
+        ValueError
+            maxsize가 음수인 경우.
+
+        """
+        if maxsize < 0:
+            raise ValueError("maxsize는 0 이상이어야 합니다.")
+        self.maxsize = maxsize
+        self._head = Node()
+        self._tail = self._head
+        self._count = 0
+        self._count_lock = threading.Lock()
+        self._put_lock = threading.Lock()
+        self._take_lock = threading.Lock()
+        self._not_full = threading.Condition(self._put_lock)
+        self._not_empty = threading.Condition(self._take_lock)
+
+    def __repr__(self):
+        with self._put_lock, self._take_lock:
+            values = []
+            node = self._head.pointer
+            while node is not None:
+                values.append(str(node.value))
+                node = node.pointer
+        if values:
+            return ' -> '.join(values)
+        return "빈 연결리스트."
+
+    def whatKindOfLL(self) -> (str):
+        """현재 해당 연결 리스트의 종류를 반환."""
+        return '스레드 안전 큐 형태의 단일 연결 리스트'
+
+    def isEmpty(self) -> (bool):
+        return self._count == 0
+
+    def isFull(self) -> (bool):
+        return 0 < self.maxsize <= self._count
+
+    def getLength(self) -> (int):
+        return self._count
+
+    def _addCount(self, delta: int) -> (int):
+        """큐 내 값의 수에 delta를 더하고, 더하기 전의 값을 반환."""
+        with self._count_lock:
+            old_count = self._count
+            self._count = old_count + delta
+        return old_count
+
+    def _hasRoom(self) -> (bool):
+        # _put_lock을 가진 동안 _count는 줄어들기만 하므로
+        # 여기서 참이면 삽입하는 순간에도 참이다.
+        return self.maxsize <= 0 or self._count < self.maxsize
+
+    def _hasItems(self) -> (bool):
+        # _take_lock을 가진 동안 _count는 늘어나기만 한다.
+        return self._count > 0
+
+    def _signalNotEmpty(self) -> (None):
+        """빈 큐에 값이 들어왔음을 기다리는 소비자에게 알린다."""
+        with self._not_empty:
+            self._not_empty.notify()
+
+    def _signalNotFull(self, n: int = 1) -> (None):
+        """가득 찬 큐에 자리가 생겼음을 기다리는 생산자에게 알린다."""
+        with self._not_full:
+            self._not_full.notify(n)
+
+    def enqueue(
+            self,
+            new_value: Value,
+            block: bool = True,
+            timeout: float | None = None
+        ) -> (None):
+        """큐의 맨 뒤에 값을 삽입.
+
+        Parameters
+        ----------
+        new_value : Value
+            삽입할 값.
+        block : bool, default True
+            큐가 가득 찼을 때 자리가 생길 때까지 기다릴지 여부.
+        timeout : float | None, default None
+            block이 True일 때 기다릴 최대 시간(초). None이면 무한히 기다린다.
+
+        Raises
+        ------
+        queue.Full
+            큐가 가득 차 있고 기다리지 않거나, timeout초 동안 자리가 나지 않은 경우.
+
+        """
+        new_node = Node(new_value)
+        with self._put_lock:
+            if not self._hasRoom():
+                _wait_for(self._not_full, self._hasRoom, block, timeout, queue.Full)
+            self._tail.pointer = new_node
+            self._tail = new_node
+            old_count = self._addCount(1)
+            if 0 < self.maxsize and old_count + 1 < self.maxsize:
+                # 아직 자리가 남아 있으므로 기다리는 다른 생산자를 깨운다.
+                self._not_full.notify()
+        if old_count == 0:
+            self._signalNotEmpty()
+
+    def _takeNode(self) -> (Value):
+        """맨 앞 노드의 값을 꺼내고, 그 노드를 새 더미 노드로 삼는다."""
+        first_node = self._head.pointer
+        value = first_node.value
+        first_node.value = None
+        self._head.pointer = None
+        self._head = first_node
+        return value
+
+    def dequeue(
+            self,
+            block: bool = True,
+            timeout: float | None = None
+        ) -> (Value):
+        """큐의 맨 앞 값을 꺼내어 반환.
+
+        Parameters
+        ----------
+        block : bool, default True
+            큐가 비어 있을 때 값이 들어올 때까지 기다릴지 여부.
+        timeout : float | None, default None
+            block이 True일 때 기다릴 최대 시간(초). None이면 무한히 기다린다.
+
+        Raises
+        ------
+        queue.Empty
+            큐가 비어 있고 기다리지 않거나, timeout초 동안 값이 들어오지 않은 경우.
+
+        """
+        with self._take_lock:
+            if self._count == 0:
+                _wait_for(self._not_empty, self._hasItems, block, timeout, queue.Empty)
+            value = self._takeNode()
+            old_count = self._addCount(-1)
+            if old_count > 1:
+                self._not_empty.notify()
+        if old_count == self.maxsize:
+            self._signalNotFull()
+        return value
+
+    def dequeueMany(
+            self,
+            n: int,
+            block: bool = True,
+            timeout: float | None = None
+        ) -> (list[Value]):
+        """큐의 맨 앞에서부터 최대 n개의 값을 한꺼번에 꺼내어 리스트로 반환.
+        락을 한 번만 잡으므로 dequeue()를 n번 호출하는 것보다 빠르다.
+        값이 하나 이상 있으면 기다리지 않고 있는 만큼만 꺼낸다.
+
+        Parameters
+        ----------
+        n : int
+            꺼낼 값의 최대 개수.
+        block : bool, default True
+            큐가 비어 있을 때 값이 들어올 때까지 기다릴지 여부.
+        timeout : float | None, default None
+            block이 True일 때 기다릴 최대 시간(초). None이면 무한히 기다린다.
+
+        Raises
+        ------
+        ValueError
+            n이 1보다 작은 경우.
+        queue.Empty
+            큐가 비어 있고 기다리지 않거나, timeout초 동안 값이 들어오지 않은 경우.
+
+        """
+        if n < 1:
+            raise ValueError("n은 1 이상이어야 합니다.")
+        with self._take_lock:
+            if self._count == 0:
+                _wait_for(self._not_empty, self._hasItems, block, timeout, queue.Empty)
+            n = min(n, self._count)
+            values = [self._takeNode() for _ in range(n)]
+            old_count = self._addCount(-n)
+            if old_count > n:
+                self._not_empty.notify()
+        if 0 < self.maxsize and old_count == self.maxsize:
+            self._signalNotFull(n)
+        return values
+
+    def showPeek(self) -> (Value):
+        """큐에서 맨 처음으로 나올 값을 조회함.
+
+        Raises
+        ------
+        IndexError
+            빈 큐에서 조회 시도 시.
+
+        """
+        with self._take_lock:
+            if self._count == 0:
+                raise IndexError("빈 큐입니다.")
+            return self._head.pointer.value
+
+    def clear(self) -> (None):
+        """큐를 비운다."""
+        with self._put_lock, self._take_lock:
+            self._head = Node()
+            self._tail = self._head
+            with self._count_lock:
+                self._count = 0
+            self._not_full.notify_all()
+
+
+class ConcurrentLinkedListStack():
+    """스레드 안전(thread-safe) 연결리스트 스택.
+    맨 위 노드를 연결리스트의 맨 앞에 두어 push, pop 모두 O(1)이다.
+    """
+    def __init__(self, maxsize: int = 0) -> (None):
+        """
+        Parameters
+        ----------
+        maxsize : int, default 0
+            스택에 저장할 수 있는 최대 값의 수. 0이면 크기 제한이 없다.
+
+        Raises
+        ------
+        ValueError
+            maxsize가 음수인 경우.
+
+        """
+        if maxsize < 0:
+            raise ValueError("maxsize는 0 이상이어야 합니다.")
+        self.maxsize = maxsize
+        self._top: Node | None = None
+        self._length = 0
+        self._lock = threading.Lock()
+        self._not_full = threading.Condition(self._lock)
+        self._not_empty = threading.Condition(self._lock)
+
+    def __repr__(self):
+        with self._lock:
+            values = []
+            node = self._top
+            while node is not None:
+                values.append(str(node.value))
+                node = node.pointer
+        if values:
+            # LinkedListStack처럼 맨 아래 값부터 출력한다.
+            return ' -> '.join(reversed(values))
+        return "빈 연결리스트."
+
+    def whatKindOfLL(self) -> (str):
+        """현재 해당 연결 리스트의 종류를 반환."""
+        return '스레드 안전 스택 형태의 단일 연결 리스트'
+
+    def isEmpty(self) -> (bool):
+        return self._length == 0
+
+    def isFull(self) -> (bool):
+        return 0 < self.maxsize <= self._length
+
+    def getLength(self) -> (int):
+        return self._length
+
+    def _hasRoom(self) -> (bool):
+        return self.maxsize <= 0 or self._length < self.maxsize
+
+    def _hasItems(self) -> (bool):
+        return self._length > 0
+
+    def push(
+            self,
+            new_value: Value,
+            block: bool = True,
+            timeout: float | None = None
+        ) -> (None):
+        """스택 맨 위에 값을 삽입.
+
+        Raises
+        ------
+        queue.Full
+            스택이 가득 차 있고 기다리지 않거나, timeout초 동안 자리가 나지 않은 경우.
+
+        """
+        with self._lock:
+            _wait_for(self._not_full, self._hasRoom, block, timeout, queue.Full)
+            self._top = Node(new_value, self._top)
+            self._length += 1
+            self._not_empty.notify()
+
+    def pop(
+            self,
+            block: bool = True,
+            timeout: float | None = None
+        ) -> (Value):
+        """스택 맨 위의 값을 꺼내어 반환.
+
+        Raises
+        ------
+        queue.Empty
+            스택이 비어 있고 기다리지 않거나, timeout초 동안 값이 들어오지 않은 경우.
+
+        """
+        with self._lock:
+            _wait_for(self._not_empty, self._hasItems, block, timeout, queue.Empty)
+            node = self._top
+            self._top = node.pointer
+            self._length -= 1
+            self._not_full.notify()
+        return node.value
+
+    def popMany(
+            self,
+            n: int,
+            block: bool = True,
+            timeout: float | None = None
+        ) -> (list[Value]):
+        """스택 맨 위에서부터 최대 n개의 값을 한꺼번에 꺼내어 리스트로 반환.
+        값이 하나 이상 있으면 기다리지 않고 있는 만큼만 꺼낸다.
+
+        Raises
+        ------
+        ValueError
+            n이 1보다 작은 경우.
+        queue.Empty
+            스택이 비어 있고 기다리지 않거나, timeout초 동안 값이 들어오지 않은 경우.
+
+        """
+        if n < 1:
+            raise ValueError("n은 1 이상이어야 합니다.")
+        values = []
+        with self._lock:
+            _wait_for(self._not_empty, self._hasItems, block, timeout, queue.Empty)
+            node = self._top
+            while node is not None and len(values) < n:
+                values.append(node.value)
+                node = node.pointer
+            self._top = node
+            self._length -= len(values)
+            self._not_full.notify(len(values))
+        return values
+
+    def searchPeek(self) -> (Value):
+        """스택 맨 끝 항목 조회.
+
+        Raises
+        ------
+        IndexError
+            빈 스택에서 조회 시도 시.
+
+        """
+        with self._lock:
+            if self._top is None:
+                raise IndexError("빈 스택입니다.")
+            return self._top.value
+
+    def clear(self) -> (None):
+        """스택 내 모든 항목 제거."""
+        with self._lock:
+            self._top = None
+            self._length = 0
+            self._not_full.notify_all()
+
+
+def compare_throughput(
+        n_producers: int = 8,
+        n_consumers: int = 8,
+        n_items: int = 40000,
+        maxsize: int = 1000,
+        batch_size: int = 16
+    ) -> (dict[str, float]):
+    """생산자 스레드 n_producers개와 소비자 스레드 n_consumers개가
+    n_items개의 값을 주고받을 때의 처리량(초당 값의 수)을
+    ConcurrentLinkedListQueue와 표준 라이브러리 queue.Queue 사이에서 비교한다.
+
+    Parameters
+    ----------
+    n_producers : int, default 8
+        생산자 스레드 수.
+    n_consumers : int, default 8
+        소비자 스레드 수.
+    n_items : int, default 40000
+        주고받을 값의 총 수. n_producers의 배수로 내림된다.
+    maxsize : int, default 1000
+        큐의 최대 크기.
+    batch_size : int, default 16
+        dequeueMany()로 한 번에 꺼낼 값의 수.
+
+    Returns
+    -------
+    dict[str, float]
+        방식별 처리량(초당 값의 수).
+
+    """
+    per_producer = n_items // n_producers
+    total = per_producer * n_producers
+    quotas = [
+        total // n_consumers + (1 if i < total % n_consumers else 0)
+        for i in range(n_consumers)
+    ]
+
+    def run(put: Callable, get_many: Callable[[int], list]) -> (float):
+        def produce():
+            for i in range(per_producer):
+                put(i)
+
+        def consume(quota: int):
+            while quota > 0:
+                quota -= len(get_many(quota))
+
+        threads = [threading.Thread(target=produce) for _ in range(n_producers)]
+        threads += [threading.Thread(target=consume, args=(q, )) for q in quotas]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return total / (time.perf_counter() - start)
+
+    result = {}
+    cq = ConcurrentLinkedListQueue(maxsize)
+    result['ConcurrentLinkedListQueue'] = run(
+        cq.enqueue, lambda quota: [cq.dequeue()]
+    )
+    cq = ConcurrentLinkedListQueue(maxsize)
+    result['ConcurrentLinkedListQueue.dequeueMany'] = run(
+        cq.enqueue, lambda quota: cq.dequeueMany(min(batch_size, quota))
+    )
+    std_q = queue.Queue(maxsize)
+    result['queue.Queue'] = run(std_q.put, lambda quota: [std_q.get()])
+    return result
+
+
+if __name__ == '__main__':
+    for name, throughput in compare_throughput().items():
+        print(f"{name}: {throughput:,.0f} items/s")
@@ -13,6 +13,7 @@ __all__ = [
     'NodeAttr', 
     'NodeKV',
     'LinkedList',
+    'set_debug_mode',
 ]
 
 # type alias
@@ -29,9 +30,22 @@ class NodeAttr():
     ITEM = "ITEM"
 
 
+def set_debug_mode(enabled: bool = True) -> (None):
+    """NodeKV 객체 수 세기(디버그 모드)를 켜거나 끈다. 
+    my_linked_list.set_debug_mode()와 같으며, 
+    my_linked_list의 Node, DPNode의 디버그 모드도 함께 바꾼다.
+    """
+    mll.set_debug_mode(enabled)
+    mll._setNodeCounting(NodeKV, 'node_counter', enabled)
+
+
 class NodeKV():
-    """하나의 노드를 구현하는 클래스."""
-    node_counter = 0
+    """하나의 노드를 구현하는 클래스. 
+    __slots__를 사용하여 노드마다 __dict__를 두지 않는다.
+    """
+    __slots__ = ('key', 'value', 'pointer')
+    node_counter = 0  # 디버그 모드에서만 갱신된다. (set_debug_mode 참고)
+    _debug = False
 
     def __init__(
             self,
@@ -52,40 +66,45 @@ class NodeKV():
             해당 매개변수는 다음 Node 객체를 대입받아야 한다. 
         
         """
-        self._key: Key = key
-        self._value: Value = value
-        self._item: Item = (self._key, self._value)
+        self.key: Key = key
+        self.value: Value = value
         self.pointer: NodeKV = pointer
-        NodeKV.node_counter += 1
-
-    def __del__(self): NodeKV.node_counter -= 1
-
-    @property
-    def key(self) -> (Key): return self._key
-
-    @key.setter
-    def key(self, new_key: Key) -> (None):
-        self._key = new_key
-        self._item = (self._key, self._value)
+        if NodeKV._debug:
+            NodeKV.node_counter += 1
 
     @property
-    def value(self) -> (Value): return self._value
+    def item(self) -> (Item): return (self.key, self.value)
 
-    @value.setter
-    def value(self, new_value: Value) -> (None):
-        self._value = new_value
-        self._item = (self._key, self._value)
 
-    @property
-    def item(self) -> (Item): return self._item
+class LinkedList(mll.LinkedList):
+    def __init__(self, indexed: bool = False):
+        """
+        Parameters
+        ----------
+        indexed : bool, default False
+            True이면 각 키와 그 키를 가진 노드의 이전 노드를 잇는 딕셔너리(색인)를 
+            함께 관리한다. 키로 노드를 찾거나 수정, 삭제하는 연산들이 
+            선형 탐색 없이 O(1)이 되어, 삽입 순서를 유지하는 딕셔너리처럼 쓸 수 있다. 
+            대신 노드마다 딕셔너리 항목 하나만큼의 메모리를 더 사용한다.
 
+        Attributes
+        ----------
+        self._prev_nodes : dict[Key, NodeKV | None] | None
+            키 -> 해당 키를 가진 노드의 이전 노드. (맨 앞 노드이면 None)
+            단일 연결 리스트에서 노드를 O(1)만에 삭제하려면 이전 노드가 필요하므로 
+            노드 대신 이전 노드를 저장한다. indexed가 False이면 None이다.
 
-class LinkedList(mll.LinkedList):
-    def __init__(self):
+        """
         super().__init__()
         # 타입 재정의.
         self._head_pointer: NodeKV | None = None
         self._tail_pointer: NodeKV | None = None
+        self._prev_nodes: dict[Key, NodeKV | None] | None = \
+            {} if indexed else None
+
+    def isIndexed(self) -> (bool):
+        """키 색인을 사용하는 연결 리스트인지 여부 반환."""
+        return self._prev_nodes is not None
 
     def __iter__(self):
         node = self._head_pointer
@@ -114,6 +133,11 @@ class LinkedList(mll.LinkedList):
         """연결리스트 내 주어진 키와 일치하는 키를 가지는 노드의 value를 
         new_v로 바꿈. 
         """
+        if self._prev_nodes is not None:
+            node = self.findNodeByKey(k)[0]
+            if node is not None:
+                node.value = new_v
+            return
         node = self._head_pointer
         while node:
             if node.key == k:
@@ -173,7 +197,12 @@ class LinkedList(mll.LinkedList):
         self._addNodeFront(NodeKV(new_key, new_value))
 
     def _addNodeFront(self, new_node: NodeKV) -> (None):
+        old_head = self._head_pointer
         super()._addNodeFront(new_node)
+        if self._prev_nodes is not None:
+            self._prev_nodes[new_node.key] = None
+            if old_head is not None:
+                self._prev_nodes[old_head.key] = new_node
 
     @dispatch(tuple)
     def addNodeBack(self, new_kv: tuple[Key, Value]) -> (None):
@@ -226,7 +255,10 @@ class LinkedList(mll.LinkedList):
         self._addNodeBack(NodeKV(new_key, new_value))
 
     def _addNodeBack(self, new_node: NodeKV) -> (None):
+        old_tail = self._tail_pointer
         super()._addNodeBack(new_node)
+        if self._prev_nodes is not None:
+            self._prev_nodes[new_node.key] = old_tail
 
     def findNodeByIndex(self, index: Index) -> (tuple[NodeKV, Index, NodeKV | None]):
         return super().findNodeByIndex(index)
@@ -243,6 +275,13 @@ class LinkedList(mll.LinkedList):
             new_key: Key,
             new_value: Value
         ) -> (None):
+        """지정된 인덱스 위치에 새 노드 삽입. 
+        키 색인을 사용하는 경우, 이미 같은 키가 존재하면 노드를 새로 삽입하지 않고 
+        해당 노드의 value만 바꾼다.
+        """
+        if self._prev_nodes is not None and new_key in self._prev_nodes:
+            self._findAndFix(new_key, new_value)
+            return
         self._insertNode(index, NodeKV(new_key, new_value))
 
     def _insertNode(
@@ -251,8 +290,18 @@ class LinkedList(mll.LinkedList):
             new_node: NodeKV
         ) -> (None):
         super()._insertNode(index, new_node)
+        if self._prev_nodes is not None:
+            # 부모 클래스의 _insertNode()는 커서를 새 노드로 옮기며 
+            # 새 노드의 이전 노드를 self._finger_prev에 기억해 둔다.
+            self._prev_nodes[new_node.key] = self._finger_prev
+            self._prev_nodes[new_node.pointer.key] = new_node
 
     def _deleteNode(self, target_node: NodeKV, prev_pointer: NodeKV | None) -> (None):
+        next_node = target_node.pointer
+        if self._prev_nodes is not None:
+            del self._prev_nodes[target_node.key]
+            if next_node is not None:
+                self._prev_nodes[next_node.key] = prev_pointer
         super()._deleteNode(target_node, prev_pointer)
 
     def popFront(self, node_mode: bool = True) -> (NodeKV | Item):
@@ -262,6 +311,12 @@ class LinkedList(mll.LinkedList):
         return node_to_pop.item
 
     def popBack(self, node_mode: bool = True) -> (NodeKV | Item):
+        if self._prev_nodes is not None and self._tail_pointer is not None:
+            # 색인으로 맨 뒤 노드의 이전 노드를 바로 찾는다. O(1)
+            node_to_pop = self._tail_pointer
+            self._deleteNode(node_to_pop, self._prev_nodes[node_to_pop.key])
+            if node_mode: return node_to_pop
+            return node_to_pop.item
         last_index = self.getLength() - 1
         node_to_pop = self.findNodeByIndex(last_index)[0]
         self.deleteNodeByIndex(last_index)
@@ -274,6 +329,8 @@ class LinkedList(mll.LinkedList):
         super().clear()
         self._head_pointer: NodeKV | None = None
         self._tail_pointer: NodeKV | None = None
+        if self._prev_nodes is not None:
+            self._prev_nodes.clear()
 
     def findNodeByKey(self, target_key: Key) \
         -> (tuple[NodeKV, Index, NodeKV] | tuple[None, None, None]):
@@ -289,11 +346,20 @@ class LinkedList(mll.LinkedList):
         -------
         (node, index, prev_pointer)
             node : 찾고자 하는 key와 일치하는 노드 객체
-            index : 해당 노드의 인덱스
+            index : 해당 노드의 인덱스. 
+                키 색인을 사용하는 경우 인덱스를 구하려면 선형 탐색이 필요하므로 
+                None을 반환한다.
             prev_pointer : 해당 노드의 이전 노드 객체
         (None, None, None)
             
         """
+        if self._prev_nodes is not None:
+            if target_key not in self._prev_nodes:
+                return (None, None, None)
+            prev_pointer = self._prev_nodes[target_key]
+            if prev_pointer is None:
+                return (self._head_pointer, None, None)
+            return (prev_pointer.pointer, None, prev_pointer)
         node = self._head_pointer
         prev_pointer = None
         cur_i = 0
@@ -308,6 +374,9 @@ class LinkedList(mll.LinkedList):
         """주어진 key를 통해 key에 대응되는 value를 찾아 반환. 
         존재하지 않는 경우 None을 반환. 
         """
+        if self._prev_nodes is not None:
+            node = self.findNodeByKey(target_key)[0]
+            return None if node is None else node.value
         node = self._head_pointer
         while node:
             if node.key == target_key: return node.value
@@ -1,8 +1,10 @@
 """연결리스트(linked list) 자료구조 구현 모듈. 
 단일 연결리스트, 단일 연결리스트를 이용한 큐와 스택 자료구조, 
-이중 연결리스트, 원형 연결리스트를 구현함. 
+이중 연결리스트, 원형 연결리스트, 
+한 노드에 여러 값을 저장하는 풀린 연결리스트(unrolled linked list)를 구현함. 
 
 """
+from itertools import chain
 
 __all__ = [
     'LinkedList',
@@ -10,18 +12,62 @@ __all__ = [
     'LinkedListStack',
     'DoublyLinkedList',
     'CircularLinkedList',
+    'UnrolledLinkedList',
     'Node',
-    'DPNode'
+    'DPNode',
+    'ULNode',
+    'set_debug_mode',
 ]
 
 # For type alias.
 Node_ = object
 DPNode_ = object
+DoublyLinkedList_ = object
+ULNode_ = object
 Value = object
 
+def set_debug_mode(enabled: bool = True) -> (None):
+    """노드 객체 수 세기(디버그 모드)를 켜거나 끈다. 
+
+    디버그 모드에서는 Node, DPNode 객체가 생성, 소멸될 때마다 
+    클래스 속성 node_counter, dpnode_counter를 갱신하여 
+    _remainingNodeNumbers()로 남아있는 노드 수를 확인할 수 있다. 
+    소멸자(__del__)는 노드 삭제와 순환 참조 정리를 느리게 하므로 
+    기본적으로는 꺼져 있다. 
+    켜거나 끌 때 노드 수는 0으로 초기화되므로, 
+    노드들을 생성하기 전에 호출해야 정확한 수를 알 수 있다.
+    """
+    for node_class, counter_name in ((Node, 'node_counter'),
+                                     (DPNode, 'dpnode_counter')):
+        _setNodeCounting(node_class, counter_name, enabled)
+
+
+def _setNodeCounting(
+        node_class: type,
+        counter_name: str,
+        enabled: bool
+    ) -> (None):
+    """node_class의 객체 수 세기를 켜거나 끈다. 
+    켜져 있는 동안에만 node_class에 소멸자(__del__)를 둔다.
+    """
+    node_class._debug = enabled
+    setattr(node_class, counter_name, 0)
+    if enabled:
+        def __del__(self):
+            setattr(node_class, counter_name,
+                    getattr(node_class, counter_name) - 1)
+        node_class.__del__ = __del__
+    elif '__del__' in node_class.__dict__:
+        del node_class.__del__
+
+
 class Node():
-    """하나의 노드를 구현하는 클래스."""
-    node_counter = 0
+    """하나의 노드를 구현하는 클래스. 
+    __slots__를 사용하여 노드마다 __dict__를 두지 않는다.
+    """
+    __slots__ = ('value', 'pointer')
+    node_counter = 0  # 디버그 모드에서만 갱신된다. (set_debug_mode 참고)
+    _debug = False
 
     def __init__(
             self,
@@ -41,17 +87,18 @@ class Node():
         """
         self.value: Value = value
         self.pointer: Node | None = pointer
-        Node.node_counter += 1
-
-    def __del__(self):
-        Node.node_counter -= 1
+        if Node._debug:
+            Node.node_counter += 1
 
 
 class DPNode():
     """Double pointer node.
     각각 다음 노드와 이전 노드를 가리키는 포인터 두 개를 가지는 노드 객체. 
+    __slots__를 사용하여 노드마다 __dict__를 두지 않는다.
     """
-    dpnode_counter = 0
+    __slots__ = ('value', 'next_pointer', 'prev_pointer')
+    dpnode_counter = 0  # 디버그 모드에서만 갱신된다. (set_debug_mode 참고)
+    _debug = False
 
     def __init__(
             self,
@@ -73,10 +120,37 @@ class DPNode():
         self.value = value
         self.next_pointer: DPNode | None = next_pointer
         self.prev_pointer: DPNode | None = prev_pointer
-        DPNode.dpnode_counter += 1
+        if DPNode._debug:
+            DPNode.dpnode_counter += 1
+
+
+class ULNode():
+    """Unrolled linked list node.
+    여러 개의 값을 하나의 리스트(블록)에 담는 노드 객체. 
+    UnrolledLinkedList에서 사용한다.
+    """
+    __slots__ = ('values', 'next_pointer', 'prev_pointer')
+
+    def __init__(
+            self,
+            values: list | None = None,
+            next_pointer: ULNode_ = None,
+            prev_pointer: ULNode_ = None
+        ):
+        """
+        Parameters
+        ----------
+        values : list | None, default None
+            노드(블록)에 저장할 값들. None이면 빈 리스트로 시작한다.
+        next_pointer : ULNode | None, default None
+            현재 노드가 가리킬 다음 노드 ULNode 객체.
+        prev_pointer : ULNode | None, default None
+            현재 노드가 가리킬 이전 노드 ULNode 객체.
 
-    def __del__(self):
-        DPNode.dpnode_counter -= 1
+        """
+        self.values: list = values if values is not None else []
+        self.next_pointer: ULNode | None = next_pointer
+        self.prev_pointer: ULNode | None = prev_pointer
 
 
 class LinkedList():
@@ -97,6 +171,14 @@ class LinkedList():
         self._iter_mode : bool, default True
             연결리스트를 반복할 때 노드 객체를 반환시킬 것인지, 노드의 
             값만을 반환시킬지를 결정하는 변수. 
+        self._finger : Node | None, default None
+            마지막으로 인덱스를 통해 접근한 노드를 기억하는 커서(finger). 
+            인덱스로 노드를 찾을 때 맨 앞 노드 대신 이 노드부터 탐색하여, 
+            순차적이거나 가까운 인덱스들에 대한 연속 접근을 빠르게 한다.
+        self._finger_index : int, default 0
+            self._finger 노드의 인덱스.
+        self._finger_prev : Node | None, default None
+            self._finger 노드의 이전 노드.
         
         """
         self._head_pointer: Node | None = None
@@ -104,6 +186,15 @@ class LinkedList():
         self._length = 0
         self.link_char = ' -> '
         self._iter_mode = True
+        self._resetFinger()
+
+    def _resetFinger(self) -> (None):
+        """커서(finger)를 초기화한다. 
+        커서가 가리키는 노드의 인덱스가 바뀔 수 있는 변경이 일어나면 호출한다.
+        """
+        self._finger = None
+        self._finger_index = 0
+        self._finger_prev = None
 
     def __iter__(self):
         node = self._head_pointer
@@ -177,6 +268,11 @@ class LinkedList():
             newNode.pointer = self._head_pointer
             self._head_pointer = newNode
         self._length += 1
+        if self._finger is not None:
+            # 기존 노드들의 인덱스가 하나씩 뒤로 밀린다.
+            self._finger_index += 1
+            if self._finger_prev is None:
+                self._finger_prev = newNode
 
     def addNodeBack(self, new_value: Value) -> (None):
         """연결리스트의 맨 뒤에 새 노드 삽입.
@@ -237,15 +333,22 @@ class LinkedList():
         """
         if self._length < index + 1 or index < 0:
             raise IndexError("연결 리스트의 길이에서 벗어나는 인덱스를 입력하였습니다.")
-        cur_i = 0
-        targetNode = self._head_pointer
-        prev_pointer = self._head_pointer
+        if self._finger is not None and self._finger_index <= index:
+            # 커서가 찾는 인덱스보다 앞에 있다면 커서부터 탐색한다.
+            cur_i = self._finger_index
+            targetNode = self._finger
+            prev_pointer = self._finger_prev
+        else:
+            cur_i = 0
+            targetNode = self._head_pointer
+            prev_pointer = None
         while cur_i != index:
             prev_pointer = targetNode
             targetNode = targetNode.pointer
             cur_i += 1
-        if index == 0:
-            prev_pointer = None
+        self._finger = targetNode
+        self._finger_index = index
+        self._finger_prev = prev_pointer
         return (targetNode, index, prev_pointer)
 
     def findNodeByValue(
@@ -352,6 +455,9 @@ class LinkedList():
         else:
             prev_pointer.pointer = newNode
         self._length += 1
+        # 새 노드가 해당 인덱스를 차지하므로 커서를 새 노드로 옮긴다.
+        self._finger = newNode
+        self._finger_prev = prev_pointer
 
     def _deleteNode(
             self,
@@ -361,6 +467,9 @@ class LinkedList():
         if prev_pointer is None:
             # 삭제하고자 하는 노드의 인덱스 위치가 0임.
             self._head_pointer = targetNode.pointer
+            if self._head_pointer is None:
+                # 유일한 노드를 삭제한 경우.
+                self._tail_pointer = None
         elif targetNode.pointer is None:
             # 삭제하고자 하는 요소가 연결 리스트의 맨 뒤에 존재하는 경우.
             self._tail_pointer = prev_pointer
@@ -370,6 +479,7 @@ class LinkedList():
         targetNode.pointer = None
         del targetNode
         self._length -= 1
+        self._resetFinger()
 
     def deleteNodeByIndex(self, index: int) -> (None):
         """인덱스에 해당하는 노드 삭제.
@@ -387,7 +497,13 @@ class LinkedList():
 
         """
         targetNode, _, prev_pointer = self.findNodeByIndex(index)
+        next_node = targetNode.pointer
         self._deleteNode(targetNode, prev_pointer)
+        if next_node is not None:
+            # 삭제된 노드의 다음 노드가 해당 인덱스를 차지한다.
+            self._finger = next_node
+            self._finger_index = index
+            self._finger_prev = prev_pointer
 
     def deleteNodeByValue(self, target_value: Value) -> (None):
         """삭제하고자 하는 값과 일치하는 노드를 삭제.
@@ -501,6 +617,7 @@ class LinkedList():
         self._head_pointer: Node | None = None
         self._tail_pointer: Node | None = None
         self._length = 0
+        self._resetFinger()
         Node.node_counter = 0
 
     def _remainingNodeNumbers(self) -> (int):
@@ -511,6 +628,7 @@ class LinkedList():
         둘 이상의 연결 리스트 사용 시 하나의 연결 리스트 내 
         Node 객체의 수를 정확히 판별하지 못할 수 있으므로 
         단 하나의 연결리스트만 생성하고 테스트하기를 권장.
+        디버그 모드(set_debug_mode)에서만 노드 수를 센다.
         """
         return Node.node_counter
 
@@ -659,6 +777,9 @@ class DoublyLinkedList(LinkedList):
             self._head_pointer.prev_pointer = newNode
             self._head_pointer = newNode
         self._length += 1
+        if self._finger is not None:
+            # 기존 노드들의 인덱스가 하나씩 뒤로 밀린다.
+            self._finger_index += 1
 
     def addNodeBack(self, new_value: Value) -> (None):
         self._addNodeBack(DPNode(new_value))
@@ -705,11 +826,26 @@ class DoublyLinkedList(LinkedList):
         """
         if self._length < index + 1 or index < 0:
             raise IndexError("연결 리스트의 길이에서 벗어나는 인덱스를 입력하였습니다.")
+        # 맨 앞 노드, 맨 뒤 노드, 커서 중 찾는 인덱스와 가장 가까운 곳부터 탐색한다.
         cur_i = 0
         targetNode = self._head_pointer
-        while cur_i != index:
+        distance = index
+        if self._length - 1 - index < distance:
+            cur_i = self._length - 1
+            targetNode = self._tail_pointer
+            distance = cur_i - index
+        if self._finger is not None \
+            and abs(index - self._finger_index) < distance:
+            cur_i = self._finger_index
+            targetNode = self._finger
+        while cur_i < index:
             targetNode = targetNode.next_pointer
             cur_i += 1
+        while cur_i > index:
+            targetNode = targetNode.prev_pointer
+            cur_i -= 1
+        self._finger = targetNode
+        self._finger_index = index
         return (targetNode, index)
 
     def findNodeByValue(
@@ -770,9 +906,15 @@ class DoublyLinkedList(LinkedList):
             oldNode.prev_pointer.next_pointer = newNode
             oldNode.prev_pointer = newNode
         self._length += 1
+        # 새 노드가 해당 인덱스를 차지하므로 커서를 새 노드로 옮긴다.
+        self._finger = newNode
 
     def __deleteNode(self, targetNode: DPNode):
-        if targetNode.prev_pointer is None:
+        if targetNode.prev_pointer is None and targetNode.next_pointer is None:
+            # 유일한 노드를 삭제하는 경우.
+            self._head_pointer = None
+            self._tail_pointer = None
+        elif targetNode.prev_pointer is None:
             # 삭제하고자 하는 인덱스 위치가 0임.
             self._head_pointer = targetNode.next_pointer
             self._head_pointer.prev_pointer = None
@@ -788,9 +930,37 @@ class DoublyLinkedList(LinkedList):
         targetNode.next_pointer = None
         del targetNode
         self._length -= 1
+        self._resetFinger()
 
     def deleteNodeByIndex(self, index: int) -> (None):
         targetNode = self.findNodeByIndex(index)[0]
+        next_node = targetNode.next_pointer
+        prev_node = targetNode.prev_pointer
+        self.__deleteNode(targetNode)
+        # 삭제된 노드의 다음 노드가 해당 인덱스를 차지한다.
+        # 맨 뒤 노드를 삭제했다면 이전 노드로 커서를 옮긴다.
+        if index < self._length:
+            self._finger = next_node
+            self._finger_index = index
+        elif index > 0:
+            self._finger = prev_node
+            self._finger_index = index - 1
+
+    def deleteNode(self, targetNode: DPNode) -> (None):
+        """연결리스트 내에 있는 노드 객체를 직접 삭제. 
+        인덱스나 value로 노드를 찾는 과정이 없으므로 O(1)이다. 
+
+        Parameters
+        ----------
+        targetNode : DPNode
+            삭제할 노드 객체. 반드시 현재 연결리스트에 속한 노드여야 한다.
+
+        See Also
+        --------
+        deleteNodeByIndex : 인덱스 위치에 해당하는 노드 객체 삭제. 
+        deleteNodeByValue : 삭제하고자 하는 value와 일치하는 노드 삭제.
+
+        """
         self.__deleteNode(targetNode)
 
     def deleteNodeByValue(self, target_value: Value) -> (None):
@@ -813,8 +983,125 @@ class DoublyLinkedList(LinkedList):
         self._head_pointer: DPNode | None = None
         self._tail_pointer: DPNode | None = None
         self._length = 0
+        self._resetFinger()
         DPNode.dpnode_counter = 0
 
+    @classmethod
+    def fromIterable(cls, iterable) -> (DoublyLinkedList_):
+        """iterable의 값들을 차례로 저장한 새 연결리스트를 만들어 반환. 
+        값마다 addNodeBack()을 호출하지 않고 노드들을 곧바로 이어 붙인다.
+        """
+        new_list = cls()
+        head = tail = None
+        length = 0
+        for value in iterable:
+            node = DPNode(value, None, tail)
+            if tail is None: head = node
+            else: tail.next_pointer = node
+            tail = node
+            length += 1
+        new_list._head_pointer = head
+        new_list._tail_pointer = tail
+        new_list._length = length
+        return new_list
+
+    def splice(self, other: DoublyLinkedList_) -> (None):
+        """other 연결리스트의 모든 노드들을 현재 연결리스트의 맨 뒤에 옮겨 붙인다. 
+        노드를 복사하지 않고 맨 앞, 맨 뒤 노드의 포인터만 다시 이으므로 O(1)이다. 
+        other는 빈 연결리스트가 된다.
+
+        Parameters
+        ----------
+        other : DoublyLinkedList
+            옮겨 붙일 노드들을 가진 이중(또는 원형) 연결리스트.
+
+        Raises
+        ------
+        TypeError
+            other가 DoublyLinkedList 객체가 아닐 경우.
+        ValueError
+            other가 현재 연결리스트 자신일 경우.
+
+        """
+        if not isinstance(other, DoublyLinkedList):
+            raise TypeError("DoublyLinkedList 객체만 이어 붙일 수 있습니다.")
+        if other is self:
+            raise ValueError("자기 자신을 이어 붙일 수 없습니다.")
+        other_head = other._head_pointer
+        if other_head is None: return
+
+        # other가 원형 연결리스트일 경우를 위해 양 끝의 연결을 끊는다.
+        other_head.prev_pointer = None
+        other._tail_pointer.next_pointer = None
+        if self._tail_pointer is None:
+            self._head_pointer = other_head
+        else:
+            self._tail_pointer.next_pointer = other_head
+            other_head.prev_pointer = self._tail_pointer
+        self._tail_pointer = other._tail_pointer
+        self._length += other._length
+
+        other._head_pointer = None
+        other._tail_pointer = None
+        other._length = 0
+        other._resetFinger()
+
+    def _indexOfNode(self, targetNode: DPNode) -> (int):
+        """연결리스트 내 노드의 인덱스를 구한다. 
+        커서(finger)가 가리키는 노드이면 O(1)이며, 그 외에는 노드에서 
+        맨 앞과 맨 뒤 방향으로 동시에 따라가므로 O(min(k, n - k))이다.
+        """
+        if targetNode is self._finger: return self._finger_index
+        forward_node = backward_node = targetNode
+        steps = 0
+        while True:
+            if backward_node is self._head_pointer: return steps
+            if forward_node is self._tail_pointer: return self._length - 1 - steps
+            backward_node = backward_node.prev_pointer
+            forward_node = forward_node.next_pointer
+            steps += 1
+
+    def splitAt(self, targetNode: DPNode) -> (DoublyLinkedList_):
+        """targetNode부터 맨 뒤 노드까지를 떼어내어 새 연결리스트로 반환. 
+        현재 연결리스트에는 targetNode 이전의 노드들만 남는다.
+
+        노드들은 복사하지 않고 targetNode 앞의 연결만 끊는다. 
+        다만 두 연결리스트의 길이를 알기 위해 targetNode의 인덱스를 구해야 하므로 
+        targetNode가 커서(finger)가 가리키는 노드일 때(예: 직전에 
+        findNodeByIndex()로 찾은 노드) O(1), 그 외에는 O(min(k, n - k))이다.
+
+        Parameters
+        ----------
+        targetNode : DPNode
+            새 연결리스트의 맨 앞 노드가 될 노드. 
+            반드시 현재 연결리스트에 속한 노드여야 한다.
+
+        Returns
+        -------
+        DoublyLinkedList
+            targetNode부터 맨 뒤 노드까지를 가지는 현재 연결리스트와 같은 종류의 
+            새 연결리스트.
+
+        """
+        index = self._indexOfNode(targetNode)
+        new_list = type(self)()
+        new_list._head_pointer = targetNode
+        new_list._tail_pointer = self._tail_pointer
+        new_list._length = self._length - index
+
+        prev_node = targetNode.prev_pointer
+        targetNode.prev_pointer = None
+        if prev_node is None:
+            self._head_pointer = None
+            self._tail_pointer = None
+        else:
+            prev_node.next_pointer = None
+            self._tail_pointer = prev_node
+        self._length = index
+        if self._finger is not None and self._finger_index >= index:
+            self._resetFinger()
+        return new_list
+
     # 반환 타입 Node -> DPNode로 고침.
     def popFront(self) -> (DPNode | None): return super().popFront()
     def popBack(self) -> (DPNode | None): return super().popBack()
@@ -831,6 +1118,7 @@ class CircularLinkedList(DoublyLinkedList):
 
     def __iter__(self):
         node = self._head_pointer
+        if node is None: return
         while True:
             if self._iter_mode: yield node
             else: yield node.value
@@ -912,13 +1200,84 @@ class CircularLinkedList(DoublyLinkedList):
         index = self.__handleOverIndex(index)
         return super().findNodeByIndex(index)
 
+    def _openRing(self) -> (None):
+        """맨 앞 노드와 맨 뒤 노드 사이의 연결을 끊어 이중 연결리스트처럼 만든다. 
+        DoublyLinkedList의 메서드들로 노드를 삽입, 삭제하기 전에 호출한다.
+        """
+        if self._head_pointer is not None:
+            self._head_pointer.prev_pointer = None
+            self._tail_pointer.next_pointer = None
+
+    def _closeRing(self) -> (None):
+        """맨 뒤 노드와 맨 앞 노드를 다시 이어 원형으로 만든다."""
+        if self._length > 1:
+            self._tail_pointer.next_pointer = self._head_pointer
+            self._head_pointer.prev_pointer = self._tail_pointer
+
+    @classmethod
+    def fromIterable(cls, iterable) -> (DoublyLinkedList_):
+        new_list = super().fromIterable(iterable)
+        new_list._closeRing()
+        return new_list
+
     def insertNode(self, index: int, new_value: Value) -> (None):
         index = self.__handleOverIndex(index)
-        super().insertNode(index, new_value)
+        self._openRing()
+        try:
+            super().insertNode(index, new_value)
+        finally:
+            self._closeRing()
 
     def deleteNodeByIndex(self, index: int) -> (None):
         index = self.__handleOverIndex(index)
-        super().deleteNodeByIndex(index)
+        self._openRing()
+        try:
+            super().deleteNodeByIndex(index)
+        finally:
+            self._closeRing()
+
+    def deleteNode(self, targetNode: DPNode) -> (None):
+        self._openRing()
+        try:
+            super().deleteNode(targetNode)
+        finally:
+            self._closeRing()
+
+    def deleteNodeByValue(self, target_value: Value) -> (None):
+        self._openRing()
+        try:
+            super().deleteNodeByValue(target_value)
+        finally:
+            self._closeRing()
+
+    def splice(self, other: DoublyLinkedList_) -> (None):
+        super().splice(other)
+        self._closeRing()
+
+    def splitAt(self, targetNode: DPNode) -> (DoublyLinkedList_):
+        self._openRing()
+        new_list = super().splitAt(targetNode)
+        self._closeRing()
+        new_list._closeRing()
+        return new_list
+
+    def rotate(self, steps: int = 1) -> (None):
+        """원형 연결리스트를 왼쪽으로 steps칸 회전시킨다. 
+        음수를 입력하면 오른쪽으로 회전시킨다.
+        ex) a <-> b <-> c <-> d -> rotate(1) -> b <-> c <-> d <-> a
+
+        노드들을 다시 잇지 않고 맨 앞, 맨 뒤 포인터만 옮기므로 
+        한 칸 회전은 O(1)이다. 새 맨 앞 노드는 맨 앞 노드, 맨 뒤 노드, 
+        커서 중 가장 가까운 곳부터 찾는다. (k = steps % n일 때 최대 O(min(k, n - k)))
+        """
+        if self._length < 2: return
+        steps %= self._length
+        if steps == 0: return
+        new_head = self.findNodeByIndex(steps)[0]
+        self._head_pointer = new_head
+        self._tail_pointer = new_head.prev_pointer
+        # findNodeByIndex()가 커서를 새 맨 앞 노드로 옮겨 두었다.
+        self._finger_index = 0
 
     def clear(self) -> (None):
         node = self._head_pointer
@@ -935,11 +1294,275 @@ class CircularLinkedList(DoublyLinkedList):
         self._head_pointer: DPNode | None = None
         self._tail_pointer: DPNode | None = None
         self._length = 0
+        self._resetFinger()
 
     def _remainingNodeNumbers(self) -> (int):
         return DPNode.dpnode_counter
 
 
+class UnrolledLinkedList():
+    """Unrolled linked list. 
+
+    노드마다 값을 하나씩 저장하는 대신, 노드 하나에 최대 block_size개의 
+    값을 리스트로 묶어 저장하는 연결 리스트. 
+    값마다 노드 객체를 만들지 않으므로 메모리를 적게 사용하고, 
+    순회와 인덱스 탐색 시 따라가야 하는 노드의 수가 약 1/block_size로 줄어든다. 
+
+    LinkedList와 같은 메서드를 제공하지만, 값마다 노드 객체가 없으므로 
+    순회와 pop 시 노드 대신 값을 반환한다.
+    """
+
+    def __init__(self, block_size: int = 32):
+        """
+        Parameters
+        ----------
+        block_size : int, default 32
+            노드(블록) 하나에 저장할 수 있는 값의 최대 개수. 2 이상이어야 한다.
+
+        Raises
+        ------
+        ValueError
+            block_size가 2보다 작은 경우.
+
+        Attributes
+        ----------
+        self._head_pointer : ULNode | None, default None
+            맨 앞 노드(블록)를 가리키는 포인터.
+        self._tail_pointer : ULNode | None, default None
+            맨 뒤 노드(블록)를 가리키는 포인터.
+        self._length : int, default 0
+            연결 리스트 내 총 값의 개수.
+        self._n_blocks : int, default 0
+            연결 리스트 내 총 노드(블록)의 개수.
+        self.link_char : str, default ' -> '
+            해당 객체 출력 시 값들 간 연결 관계를 표현할 기호.
+
+        """
+        if block_size < 2:
+            raise ValueError("block_size는 2 이상이어야 합니다.")
+        self.block_size = block_size
+        self._head_pointer: ULNode | None = None
+        self._tail_pointer: ULNode | None = None
+        self._length = 0
+        self._n_blocks = 0
+        self.link_char = ' -> '
+
+    def __iter__(self):
+        # 블록 안의 값들은 파이썬 코드를 거치지 않고 리스트 이터레이터로 순회한다.
+        return chain.from_iterable(self.__iterBlocks())
+
+    def __iterBlocks(self):
+        node = self._head_pointer
+        while node:
+            yield node.values
+            node = node.next_pointer
+
+    def __repr__(self):
+        if self._length == 0:
+            return "빈 연결리스트."
+        return self.link_char.join(
+            value if isinstance(value, str) else str(value) for value in self
+        )
+
+    def whatKindOfLL(self) -> (str):
+        """현재 해당 연결 리스트의 종류를 반환."""
+        return '풀린 연결 리스트'
+
+    def getLength(self) -> (int):
+        """현재 연결 리스트 내 총 값의 수 반환."""
+        return self._length
+
+    def getBlockCount(self) -> (int):
+        """현재 연결 리스트 내 총 노드(블록)의 수 반환."""
+        return self._n_blocks
+
+    def __linkAfter(self, node: ULNode | None, new_node: ULNode) -> (None):
+        """new_node를 node의 바로 뒤에 연결한다. 
+        node가 None이면 맨 앞에 연결한다.
+        """
+        if node is None:
+            new_node.next_pointer = self._head_pointer
+            self._head_pointer = new_node
+        else:
+            new_node.next_pointer = node.next_pointer
+            new_node.prev_pointer = node
+            node.next_pointer = new_node
+        if new_node.next_pointer is None:
+            self._tail_pointer = new_node
+        else:
+            new_node.next_pointer.prev_pointer = new_node
+        self._n_blocks += 1
+
+    def __unlink(self, node: ULNode) -> (None):
+        """node를 연결 리스트에서 떼어낸다."""
+        if node.prev_pointer is None:
+            self._head_pointer = node.next_pointer
+        else:
+            node.prev_pointer.next_pointer = node.next_pointer
+        if node.next_pointer is None:
+            self._tail_pointer = node.prev_pointer
+        else:
+            node.next_pointer.prev_pointer = node.prev_pointer
+        node.next_pointer = None
+        node.prev_pointer = None
+        self._n_blocks -= 1
+
+    def _findBlock(self, index: int) -> (tuple[ULNode, int]):
+        """인덱스에 해당하는 값이 저장된 노드(블록)와 블록 내 위치를 반환. 
+        맨 앞 노드와 맨 뒤 노드 중 더 가까운 쪽부터 블록 단위로 탐색한다.
+
+        Raises
+        ------
+        IndexError
+            현재 연결 리스트의 값 개수보다 더 큰 인덱스 값 대입 시,
+            또는 인덱스에 음수 입력 시 해당 예외 발생.
+
+        """
+        if self._length < index + 1 or index < 0:
+            raise IndexError("연결 리스트의 길이에서 벗어나는 인덱스를 입력하였습니다.")
+        if index < self._length // 2:
+            node = self._head_pointer
+            while index >= len(node.values):
+                index -= len(node.values)
+                node = node.next_pointer
+            return (node, index)
+
+        # 맨 뒤에서부터의 위치로 바꾸어 탐색한다.
+        index = self._length - 1 - index
+        node = self._tail_pointer
+        while index >= len(node.values):
+            index -= len(node.values)
+            node = node.prev_pointer
+        return (node, len(node.values) - 1 - index)
+
+    def getValueByIndex(self, index: int) -> (Value):
+        """인덱스에 해당하는 값 반환.
+
+        Raises
+        ------
+        IndexError
+            연결 리스트의 범위를 벗어나는 인덱스 입력 시 해당 예외 발생.
+
+        """
+        node, offset = self._findBlock(index)
+        return node.values[offset]
+
+    def addNodeFront(self, new_value: Value) -> (None):
+        """연결리스트의 맨 앞에 새 값을 삽입."""
+        node = self._head_pointer
+        if node is None or len(node.values) >= self.block_size:
+            self.__linkAfter(None, ULNode([new_value]))
+        else:
+            node.values.insert(0, new_value)
+        self._length += 1
+
+    def addNodeBack(self, new_value: Value) -> (None):
+        """연결리스트의 맨 뒤에 새 값을 삽입. 
+        맨 뒤 노드(블록)가 가득 찬 경우에만 새 노드를 만든다.
+        """
+        node = self._tail_pointer
+        if node is None or len(node.values) >= self.block_size:
+            self.__linkAfter(node, ULNode([new_value]))
+        else:
+            node.values.append(new_value)
+        self._length += 1
+
+    def insertNode(self, index: int, new_value: Value) -> (None):
+        """연결 리스트에서 지정된 인덱스 위치에 새 값 삽입. 
+        해당 노드(블록)가 가득 찬 경우 블록을 반으로 나눈 뒤 삽입한다.
+
+        Raises
+        ------
+        IndexError
+            연결 리스트의 범위를 벗어나는 인덱스 입력 시 해당 예외 발생.
+
+        """
+        node, offset = self._findBlock(index)
+        if len(node.values) >= self.block_size:
+            half = len(node.values) // 2
+            new_node = ULNode(node.values[half:])
+            del node.values[half:]
+            self.__linkAfter(node, new_node)
+            if offset >= half:
+                node = new_node
+                offset -= half
+        node.values.insert(offset, new_value)
+        self._length += 1
+
+    def __removeAt(self, node: ULNode, offset: int) -> (Value):
+        """node의 offset 위치의 값을 제거하고 반환. 
+        노드(블록)가 비면 떼어내고, 절반 미만으로 줄어들면 
+        다음 노드와 합칠 수 있는 경우 합친다.
+        """
+        value = node.values.pop(offset)
+        self._length -= 1
+        if not node.values:
+            self.__unlink(node)
+        elif len(node.values) < self.block_size // 2:
+            next_node = node.next_pointer
+            if next_node is not None and \
+                len(node.values) + len(next_node.values) <= self.block_size:
+                node.values.extend(next_node.values)
+                self.__unlink(next_node)
+        return value
+
+    def deleteNodeByIndex(self, index: int) -> (None):
+        """인덱스에 해당하는 값 삭제.
+
+        Raises
+        ------
+        IndexError
+            연결 리스트의 범위를 벗어나는 인덱스 입력 시 해당 예외 발생.
+
+        """
+        node, offset = self._findBlock(index)
+        self.__removeAt(node, offset)
+
+    def popFront(self) -> (Value):
+        """연결 리스트의 맨 앞에 있는 값을 추출 후 제거.
+
+        Raises
+        ------
+        IndexError
+            빈 연결 리스트에서 pop 시도 시, IndexError 예외 발생.
+
+        """
+        if self._head_pointer is None:
+            raise IndexError("빈 연결 리스트입니다.")
+        return self.__removeAt(self._head_pointer, 0)
+
+    def popBack(self) -> (Value):
+        """연결 리스트의 맨 뒤에 있는 값을 추출 후 제거.
+
+        Raises
+        ------
+        IndexError
+            빈 연결 리스트에서 pop 시도 시, IndexError 예외 발생.
+
+        """
+        node = self._tail_pointer
+        if node is None:
+            raise IndexError("빈 연결 리스트입니다.")
+        value = node.values.pop()
+        self._length -= 1
+        if not node.values:
+            self.__unlink(node)
+        return value
+
+    def clear(self) -> (None):
+        """연결 리스트를 모두 비운다."""
+        node = self._head_pointer
+        while node:
+            next_node = node.next_pointer
+            node.next_pointer = None
+            node.prev_pointer = None
+            node = next_node
+        self._head_pointer: ULNode | None = None
+        self._tail_pointer: ULNode | None = None
+        self._length = 0
+        self._n_blocks = 0
+
+
 def test_ll():
     ll = LinkedList()
     test_data = [
@@ -0,0 +1,436 @@
+"""스킵 리스트(skip list) 자료구조 구현 모듈.
+
+값(또는 키)을 정렬된 상태로 유지하는 연결리스트에 여러 층의
+빠른 연결(express lane)을 두어, 삽입, 삭제, 탐색, 범위 탐색을
+평균 O(log n)만에 할 수 있도록 한다.
+
+각 노드의 층 수는 삽입 시 확률 p에 따라 무작위로 정해지며,
+맨 아래 층(0층)은 모든 노드를 정렬된 순서로 잇는 단일 연결리스트와 같다.
+SkipList는 값만을 저장하고(중복 허용), SkipListKV는 linked_list_kv.LinkedList와
+같은 (key, value) 형태의 데이터를 키 순서로 저장한다. (키 중복 불가)
+"""
+import random
+import time
+from typing import Generator
+
+from multipledispatch import dispatch
+
+try:
+    import my_linked_list as mll
+except ModuleNotFoundError:
+    import linked_list.my_linked_list as mll
+
+__all__ = [
+    'SkipList',
+    'SkipListKV',
+    'SkipNode',
+    'compare_search_time',
+]
+
+# type alias
+Key = object
+Value = object
+Item = tuple[Key, Value]
+SkipNode_ = object
+
+
+class SkipNode():
+    """스킵 리스트의 노드 하나를 구현하는 클래스.
+    __slots__를 사용하여 노드마다 __dict__를 두지 않는다.
+    """
+    __slots__ = ('key', 'value', 'forward')
+
+    def __init__(
+            self,
+            key: Key = None,
+            value: Value = None,
+            level: int = 1
+        ) -> (None):
+        """
+        Parameters
+        ----------
+        key
+            정렬 기준이 되는 노드의 키. SkipList에서는 값과 같다.
+        value
+            노드의 값.
+        level : int, default 1
+            노드의 층 수.
+
+        Attributes
+        ----------
+        self.forward : list[SkipNode | None]
+            각 층에서 다음 노드를 가리키는 포인터들.
+            self.forward[0]은 맨 아래 층의 다음 노드이다.
+
+        """
+        self.key: Key = key
+        self.value: Value = value
+        self.forward: list[SkipNode_ | None] = [None] * level
+
+    @property
+    def item(self) -> (Item): return (self.key, self.value)
+
+
+class SkipList():
+    """값들을 오름차순으로 유지하는 스킵 리스트 클래스.
+    저장되는 값들은 서로 크기 비교가 가능해야 한다.
+    """
+    def __init__(
+            self,
+            max_level: int = 32,
+            p: float = 0.5,
+            seed: int | None = None
+        ) -> (None):
+        """
+        Parameters
+        ----------
+        max_level : int, default 32
+            노드가 가질 수 있는 최대 층 수.
+            약 (1/p) ** max_level개의 노드까지 O(log n) 성능을 유지한다.
+        p : float, default 0.5
+            노드가 한 층 더 높아질 확률. 0 < p < 1이어야 한다.
+        seed : int | None, default None
+            노드의 층 수를 정하는 난수 생성기의 시드.
+            같은 시드를 주면 같은 구조의 스킵 리스트가 만들어진다.
+
+        Attributes
+        ----------
+        self._head : SkipNode
+            모든 층의 맨 앞에 위치하는 머리 노드. 데이터를 저장하지 않는다.
+        self._level : int
+            현재 노드들이 가진 가장 높은 층 수.
+        self._length : int
+            스킵 리스트 내 총 노드 수.
+        self.link_char : str, default ' -> '
+            해당 객체 출력 시 노드 간 연결 관계를 표현할 기호.
+
+        """
+        if max_level < 1:
+            raise ValueError("max_level은 1 이상이어야 합니다.")
+        if not 0 < p < 1:
+            raise ValueError("p는 0보다 크고 1보다 작아야 합니다.")
+        self._max_level = max_level
+        self._p = p
+        self._random = random.Random(seed).random
+        self._head = SkipNode(level=max_level)
+        self._level = 1
+        self._length = 0
+        self.link_char = ' -> '
+
+    def _iterNodes(self) -> (Generator[SkipNode, None, None]):
+        """맨 아래 층을 따라 모든 노드를 오름차순으로 하나씩 반환."""
+        node = self._head.forward[0]
+        while node is not None:
+            yield node
+            node = node.forward[0]
+
+    def __iter__(self):
+        for node in self._iterNodes():
+            yield node.value
+
+    def __len__(self) -> (int): return self._length
+
+    def __contains__(self, key: Key) -> (bool):
+        return self._findNode(key) is not None
+
+    def __repr__(self):
+        """현재 스킵 리스트를 맨 아래 층의 순서대로 출력."""
+        if self._length == 0:
+            return "빈 연결리스트."
+        return self.link_char.join(str(value) for value in self)
+
+    def whatKindOfLL(self) -> (str):
+        """현재 해당 연결 리스트의 종류를 반환."""
+        return '스킵 리스트'
+
+    def getLength(self) -> (int):
+        """현재 스킵 리스트 내 총 노드 수 반환."""
+        return self._length
+
+    def getLevel(self) -> (int):
+        """현재 노드들이 가진 가장 높은 층 수 반환."""
+        return self._level
+
+    def _randomLevel(self) -> (int):
+        """새 노드의 층 수를 무작위로 정한다.
+        층 수가 k 이상일 확률은 p ** (k - 1)이다.
+        """
+        level = 1
+        while level < self._max_level and self._random() < self._p:
+            level += 1
+        return level
+
+    def _findPrevNodes(self, key: Key) -> (list[SkipNode]):
+        """각 층에서 key보다 작은 키를 가진 마지막 노드들을 찾아 반환.
+        반환되는 리스트의 i번째 원소는 i층에서 key가 들어갈 위치의 이전 노드이다.
+        """
+        update = [self._head] * self._max_level
+        node = self._head
+        for lv in range(self._level - 1, -1, -1):
+            next_node = node.forward[lv]
+            while next_node is not None and next_node.key < key:
+                node = next_node
+                next_node = node.forward[lv]
+            update[lv] = node
+        return update
+
+    def _findNode(self, key: Key) -> (SkipNode | None):
+        """key와 일치하는 키를 가진 노드 중 맨 앞의 노드를 반환.
+        없으면 None 반환.
+        """
+        node = self._head
+        for lv in range(self._level - 1, -1, -1):
+            next_node = node.forward[lv]
+            while next_node is not None and next_node.key < key:
+                node = next_node
+                next_node = node.forward[lv]
+        node = node.forward[0]
+        if node is not None and node.key == key:
+            return node
+        return None
+
+    def _insertNode(
+            self,
+            new_node: SkipNode,
+            update: list[SkipNode]
+        ) -> (None):
+        """_findPrevNodes()로 찾은 위치들에 새 노드를 연결한다."""
+        level = len(new_node.forward)
+        if level > self._level:
+            # update의 새 층 부분은 이미 머리 노드로 채워져 있다.
+            self._level = level
+        for lv in range(level):
+            prev_node = update[lv]
+            new_node.forward[lv] = prev_node.forward[lv]
+            prev_node.forward[lv] = new_node
+        self._length += 1
+
+    def _deleteNode(
+            self,
+            target_node: SkipNode,
+            update: list[SkipNode]
+        ) -> (None):
+        """_findPrevNodes()로 찾은 이전 노드들로부터 target_node를 떼어낸다."""
+        for lv in range(len(target_node.forward)):
+            prev_node = update[lv]
+            if prev_node.forward[lv] is not target_node:
+                break
+            prev_node.forward[lv] = target_node.forward[lv]
+        while self._level > 1 and self._head.forward[self._level - 1] is None:
+            self._level -= 1
+        self._length -= 1
+
+    def addNode(self, new_value: Value) -> (None):
+        """새 값을 정렬 순서에 맞는 위치에 삽입. 평균 O(log n).
+        같은 값이 이미 있으면 그 값들 바로 앞에 삽입된다.
+        """
+        update = self._findPrevNodes(new_value)
+        new_node = SkipNode(new_value, new_value, self._randomLevel())
+        self._insertNode(new_node, update)
+
+    def findNodeByValue(self, target_value: Value) -> (SkipNode | None):
+        """찾고자 하는 값을 가진 노드를 반환. 평균 O(log n).
+        LinkedList.findNodeByValue()와 달리 노드의 인덱스와 이전 노드는
+        반환하지 않으며, 찾는 값이 없으면 None을 반환한다.
+        """
+        return self._findNode(target_value)
+
+    def deleteNodeByValue(self, target_value: Value) -> (None):
+        """찾고자 하는 값을 가진 노드 하나를 삭제. 평균 O(log n).
+        해당 값이 없으면 아무것도 하지 않는다.
+        """
+        update = self._findPrevNodes(target_value)
+        target_node = update[0].forward[0]
+        if target_node is None or target_node.key != target_value:
+            return
+        self._deleteNode(target_node, update)
+
+    def _iterRange(
+            self,
+            low: Key,
+            high: Key
+        ) -> (Generator[SkipNode, None, None]):
+        """low 이상 high 미만인 키를 가진 노드들을 오름차순으로 하나씩 반환."""
+        node = self._findPrevNodes(low)[0].forward[0]
+        while node is not None and node.key < high:
+            # 다음 노드를 미리 기억해두어 순회 중 현재 노드가 삭제되어도
+            # 나머지 노드들을 계속 순회할 수 있도록 한다.
+            next_node = node.forward[0]
+            yield node
+            node = next_node
+
+    def range(self, low: Value, high: Value) -> (Generator[Value, None, None]):
+        """low 이상 high 미만인 값들을 오름차순으로 하나씩 반환하는 제너레이터.
+        반환하는 값의 수가 k일 때 평균 O(log n + k)이다.
+        """
+        for node in self._iterRange(low, high):
+            yield node.value
+
+    def clear(self) -> (None):
+        """스킵 리스트를 모두 비운다."""
+        self._head = SkipNode(level=self._max_level)
+        self._level = 1
+        self._length = 0
+
+
+class SkipListKV(SkipList):
+    """(key, value) 데이터를 키의 오름차순으로 유지하는 스킵 리스트 클래스.
+    linked_list_kv.LinkedList와 같은 키-값 메서드들을 제공하며,
+    키로 노드를 찾는 연산들이 평균 O(log n)이다.
+    키들은 서로 크기 비교가 가능해야 한다.
+    """
+    def __iter__(self):
+        for node in self._iterNodes():
+            yield node.item
+
+    def __repr__(self):
+        if self._length == 0:
+            return "<empty>"
+        return self.link_char.join(str(item) for item in self)
+
+    def whatKindOfLL(self) -> (str):
+        """현재 해당 연결 리스트의 종류를 반환."""
+        return 'key-value 스킵 리스트'
+
+    def _addNode(self, new_key: Key, new_value: Value) -> (None):
+        update = self._findPrevNodes(new_key)
+        node = update[0].forward[0]
+        if node is not None and node.key == new_key:
+            node.value = new_value
+            return
+        new_node = SkipNode(new_key, new_value, self._randomLevel())
+        self._insertNode(new_node, update)
+
+    @dispatch(tuple)
+    def addNode(self, new_kv: Item) -> (None):
+        """새 (key, value) 데이터를 키 순서에 맞는 위치에 삽입. 평균 O(log n).
+        이미 같은 키가 존재한다면 해당 노드의 value만 새로 바꾼다.
+        """
+        new_key, new_value = new_kv
+        self._addNode(new_key, new_value)
+
+    @dispatch(Key, Value)
+    def addNode(self, new_key: Key, new_value: Value) -> (None):
+        """새 key, value를 키 순서에 맞는 위치에 삽입. 평균 O(log n).
+        이미 같은 키가 존재한다면 해당 노드의 value만 새로 바꾼다.
+        """
+        self._addNode(new_key, new_value)
+
+    def findNodeByKey(self, target_key: Key) -> (SkipNode | None):
+        """주어진 키와 일치하는 키를 가지는 노드를 반환. 평균 O(log n).
+        linked_list_kv.LinkedList.findNodeByKey()와 달리 노드의 인덱스와
+        이전 노드는 반환하지 않으며, 찾는 키가 없으면 None을 반환한다.
+        """
+        return self._findNode(target_key)
+
+    def getValueByKey(self, target_key: Key) -> (Value | None):
+        """주어진 key에 대응되는 value를 반환.
+        존재하지 않는 경우 None을 반환.
+        """
+        node = self._findNode(target_key)
+        if node is None:
+            return None
+        return node.value
+
+    def deleteNodeByKey(self, target_key: Key) -> (None):
+        """주어진 키와 일치하는 키를 가진 노드를 삭제. 평균 O(log n)."""
+        SkipList.deleteNodeByValue(self, target_key)
+
+    def findNodeByValue(self, target_value: Value) -> (SkipNode | None):
+        """주어진 value를 가진 맨 앞의 노드를 반환. 없으면 None 반환.
+        값은 정렬되어 있지 않으므로 O(n)이다.
+        """
+        for node in self._iterNodes():
+            if node.value == target_value:
+                return node
+        return None
+
+    def deleteNodeByValue(self, target_value: Value) -> (None):
+        """주어진 value를 가진 맨 앞의 노드를 삭제. O(n)."""
+        node = self.findNodeByValue(target_value)
+        if node is not None:
+            self.deleteNodeByKey(node.key)
+
+    def range(self, low: Key, high: Key) -> (Generator[Item, None, None]):
+        """low 이상 high 미만인 키의 (key, value)들을
+        키의 오름차순으로 하나씩 반환하는 제너레이터.
+        반환하는 데이터의 수가 k일 때 평균 O(log n + k)이다.
+        """
+        for node in self._iterRange(low, high):
+            yield node.item
+
+    def items(self) -> (list[Item]):
+        """모든 노드들의 (key, value)를 키의 오름차순으로 리스트로 반환."""
+        return [node.item for node in self._iterNodes()]
+
+    def keys(self) -> (list[Key]):
+        """모든 노드들의 key를 오름차순으로 리스트로 반환."""
+        return [node.key for node in self._iterNodes()]
+
+    def values(self) -> (list[Value]):
+        """모든 노드들의 value를 키의 오름차순으로 리스트로 반환."""
+        return [node.value for node in self._iterNodes()]
+
+
+def compare_search_time(
+        n: int = 10000,
+        n_queries: int = 1000,
+        seed: int | None = 0
+    ) -> (dict[str, float]):
+    """같은 데이터를 기존 연결리스트와 스킵 리스트에 저장한 뒤,
+    무작위 탐색 n_queries번에 걸린 시간(초)을 비교한다.
+
+    Parameters
+    ----------
+    n : int, default 10000
+        저장할 데이터 수.
+    n_queries : int, default 1000
+        탐색 횟수. 탐색 대상의 약 절반은 존재하지 않는 값이다.
+    seed : int | None, default 0
+        데이터 순서와 탐색 대상을 정하는 난수 생성기의 시드.
+
+    Returns
+    -------
+    dict[str, float]
+        탐색 메서드별 총 소요 시간(초).
+
+    """
+    try:
+        import linked_list_kv as llkv
+    except ModuleNotFoundError:
+        import linked_list.linked_list_kv as llkv
+
+    rng = random.Random(seed)
+    dataset = rng.sample(range(n * 2), n)
+    queries = [rng.randrange(n * 2) for _ in range(n_queries)]
+
+    ll = mll.LinkedList()
+    kv_ll = llkv.LinkedList()
+    skip_list = SkipList(seed=seed)
+    skip_list_kv = SkipListKV(seed=seed)
+    for data in dataset:
+        ll.addNodeBack(data)
+        # addNodeBack()은 삽입할 때마다 키 중복을 선형 탐색하므로
+        # 노드를 직접 이어 붙인다.
+        kv_ll._addNodeBack(llkv.NodeKV(data, data))
+        skip_list.addNode(data)
+        skip_list_kv.addNode(data, data)
+
+    targets = {
+        'LinkedList.findNodeByValue': ll.findNodeByValue,
+        'SkipList.findNodeByValue': skip_list.findNodeByValue,
+        'linked_list_kv.LinkedList.findNodeByKey': kv_ll.findNodeByKey,
+        'SkipListKV.findNodeByKey': skip_list_kv.findNodeByKey,
+    }
+    result = {}
+    for name, find in targets.items():
+        start = time.perf_counter()
+        for query in queries:
+            find(query)
+        result[name] = time.perf_counter() - start
+    return result
+
+
+if __name__ == '__main__':
+    for name, elapsed in compare_search_time().items():
+        print(f"{name}: {elapsed * 1000:.2f} ms")
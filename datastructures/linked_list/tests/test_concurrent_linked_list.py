@@ -0,0 +1,163 @@
+import unittest
+import sys
+import queue
+import threading
+
+from dirimporttool import get_super_dir_directly
+super_dir = get_super_dir_directly(__file__, 2)
+sys.path.append(super_dir)
+
+from linked_list.concurrent_linked_list import (
+    ConcurrentLinkedListQueue, ConcurrentLinkedListStack, compare_throughput
+)
+
+
+class TestConcurrentLinkedListQueue(unittest.TestCase):
+    def setUp(self):
+        self.q = ConcurrentLinkedListQueue(maxsize=3)
+
+    def testEmpty(self):
+        """
+        빈 큐 테스트.
+        """
+        self.assertTrue(self.q.isEmpty())
+        self.assertEqual(repr(self.q), "빈 연결리스트.")
+        self.assertRaises(queue.Empty, self.q.dequeue, False)
+        self.assertRaises(queue.Empty, self.q.dequeue, True, 0.01)
+        self.assertRaises(queue.Empty, self.q.dequeueMany, 2, False)
+        self.assertRaises(IndexError, self.q.showPeek)
+        self.assertRaises(ValueError, self.q.dequeueMany, 0)
+        self.assertRaises(ValueError, ConcurrentLinkedListQueue, -1)
+
+    def testFIFOAndBound(self):
+        """
+        선입선출 순서와 최대 크기 테스트.
+        """
+        for value in ['a', 'b', 'c']:
+            self.q.enqueue(value)
+        self.assertTrue(self.q.isFull())
+        self.assertEqual(repr(self.q), "a -> b -> c")
+        self.assertRaises(queue.Full, self.q.enqueue, 'd', False)
+        self.assertRaises(queue.Full, self.q.enqueue, 'd', True, 0.01)
+        self.assertEqual(self.q.getLength(), 3)
+
+        self.assertEqual(self.q.showPeek(), 'a')
+        self.assertEqual(self.q.dequeue(), 'a')
+        self.q.enqueue('d')
+        self.assertEqual(self.q.dequeueMany(10), ['b', 'c', 'd'])
+        self.assertTrue(self.q.isEmpty())
+
+        self.q.enqueue('e')
+        self.q.clear()
+        self.assertEqual(self.q.getLength(), 0)
+        self.q.enqueue('f')
+        self.assertEqual(self.q.dequeue(), 'f')
+
+    def testBlocking(self):
+        """
+        가득 찬 큐에 삽입하려는 스레드가 자리가 생길 때까지 기다리는지 테스트.
+        """
+        for value in range(3):
+            self.q.enqueue(value)
+        producer = threading.Thread(target=self.q.enqueue, args=(3, ))
+        producer.start()
+        self.assertEqual(self.q.dequeue(), 0)
+        producer.join(timeout=5)
+        self.assertFalse(producer.is_alive())
+        self.assertEqual(self.q.dequeueMany(4), [1, 2, 3])
+
+        result = []
+        consumer = threading.Thread(
+            target=lambda: result.append(self.q.dequeue(timeout=5))
+        )
+        consumer.start()
+        self.q.enqueue('x')
+        consumer.join(timeout=5)
+        self.assertEqual(result, ['x'])
+
+    def testProducersAndConsumers(self):
+        """
+        여러 생산자, 소비자 스레드가 주고받은 값이 빠짐없이 한 번씩 전달되는지 확인.
+        """
+        n_producers, n_consumers, per_producer = 4, 4, 500
+        q = ConcurrentLinkedListQueue(maxsize=8)
+        received = []
+        lock = threading.Lock()
+
+        def produce(producer_id: int):
+            for i in range(per_producer):
+                q.enqueue((producer_id, i))
+
+        def consume(quota: int):
+            while quota > 0:
+                values = q.dequeueMany(min(3, quota), timeout=5)
+                quota -= len(values)
+                with lock:
+                    received.extend(values)
+
+        quota = n_producers * per_producer // n_consumers
+        threads = [
+            threading.Thread(target=produce, args=(p, ))
+            for p in range(n_producers)
+        ]
+        threads += [
+            threading.Thread(target=consume, args=(quota, ))
+            for _ in range(n_consumers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        expected = [
+            (p, i) for p in range(n_producers) for i in range(per_producer)
+        ]
+        self.assertEqual(sorted(received), expected)
+        self.assertTrue(q.isEmpty())
+
+    def testCompareThroughput(self):
+        """
+        처리량 비교 결과에 모든 방식이 포함되는지 확인.
+        """
+        result = compare_throughput(2, 2, n_items=200, maxsize=10)
+        self.assertEqual(len(result), 3)
+        self.assertTrue(all(value > 0 for value in result.values()))
+
+
+class TestConcurrentLinkedListStack(unittest.TestCase):
+    def setUp(self):
+        self.stack = ConcurrentLinkedListStack(maxsize=3)
+
+    def testLIFOAndBound(self):
+        """
+        후입선출 순서와 최대 크기 테스트.
+        """
+        self.assertRaises(queue.Empty, self.stack.pop, False)
+        self.assertRaises(IndexError, self.stack.searchPeek)
+        for value in ['a', 'b', 'c']:
+            self.stack.push(value)
+        self.assertEqual(repr(self.stack), "a -> b -> c")
+        self.assertTrue(self.stack.isFull())
+        self.assertRaises(queue.Full, self.stack.push, 'd', True, 0.01)
+        self.assertEqual(self.stack.searchPeek(), 'c')
+        self.assertEqual(self.stack.pop(), 'c')
+        self.assertEqual(self.stack.popMany(5), ['b', 'a'])
+        self.assertTrue(self.stack.isEmpty())
+
+    def testBlocking(self):
+        """
+        빈 스택에서 꺼내려는 스레드가 값이 들어올 때까지 기다리는지 테스트.
+        """
+        result = []
+        consumer = threading.Thread(
+            target=lambda: result.append(self.stack.pop(timeout=5))
+        )
+        consumer.start()
+        self.stack.push('x')
+        consumer.join(timeout=5)
+        self.assertEqual(result, ['x'])
+        self.assertEqual(self.stack.getLength(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
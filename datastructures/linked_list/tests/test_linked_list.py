@@ -12,7 +12,17 @@ sys.path.append(super_dir)
 
 from linked_list.my_linked_list import (
     LinkedList, LinkedListQueue, LinkedListStack, 
-    DoublyLinkedList, CircularLinkedList)
+    DoublyLinkedList, CircularLinkedList, UnrolledLinkedList,
+    Node, DPNode, set_debug_mode)
+
+
+def setUpModule():
+    # 노드 삭제 여부 확인을 위해 노드 수 세기(디버그 모드)를 켠다.
+    set_debug_mode(True)
+
+
+def tearDownModule():
+    set_debug_mode(False)
 
 
 class TestLinkedList(unittest.TestCase):
@@ -288,6 +298,63 @@ class TestLinkedList(unittest.TestCase):
             all_data.append(data)
         self.assertEqual(all_data, ['a', 'b', 'c', 'd'])
 
+    def test_compact_node(self):
+        """
+        __slots__ 노드와 디버그 모드 해제 시 노드 수를 세지 않는지 테스트.
+        """
+        for node in (Node(1), DPNode(1)):
+            self.assertFalse(hasattr(node, '__dict__'))
+        set_debug_mode(False)
+        try:
+            ll = LinkedList()
+            for i in range(3):
+                ll.addNodeBack(i)
+            self.assertEqual(ll._remainingNodeNumbers(), 0)
+            self.assertNotIn('__del__', Node.__dict__)
+            del ll
+        finally:
+            set_debug_mode(True)
+
+    def test_finger_cursor(self):
+        """
+        인덱스 접근 커서(finger)를 이용한 연속 접근과 
+        삽입, 삭제 후의 인덱스 정합성 테스트.
+        """
+        expected = list(range(10))
+        for value in expected:
+            self.linked_list.addNodeBack(value)
+        for i in range(10):
+            self.assertEqual(self.linked_list.getValueByIndex(i), i)
+
+        # 커서보다 앞쪽에서 일어난 변경도 반영되어야 한다.
+        self.linked_list.getValueByIndex(5)
+        self.linked_list.addNodeFront(-1)
+        expected.insert(0, -1)
+        self.linked_list.insertNode(3, 'x')
+        expected.insert(3, 'x')
+        self.linked_list.deleteNodeByIndex(1)
+        del expected[1]
+        self.linked_list.popFront()
+        del expected[0]
+        for i, value in enumerate(expected):
+            node, index, prev_node = self.linked_list.findNodeByIndex(i)
+            self.assertEqual((node.value, index), (value, i))
+            if i == 0:
+                self.assertIsNone(prev_node)
+            else:
+                self.assertIs(prev_node.pointer, node)
+
+        # 연속 삽입, 삭제
+        for i in range(5):
+            self.linked_list.insertNode(2 + i, i * 100)
+            expected.insert(2 + i, i * 100)
+        for _ in range(3):
+            self.linked_list.deleteNodeByIndex(4)
+            del expected[4]
+        self.linked_list.iterMode(False)
+        self.assertEqual(list(self.linked_list), expected)
+        self.assertEqual(self.linked_list.getLength(), len(expected))
+
 
 class TestLLQueue(unittest.TestCase):
     """
@@ -745,6 +812,79 @@ class TestDoublyLinkedList(unittest.TestCase):
             all_data.append(data)
         self.assertEqual(all_data, ['a', 'b', 'c', 'd'])
 
+    def testFingerCursor(self):
+        """
+        맨 뒤 노드 또는 커서(finger)부터의 인덱스 탐색 테스트.
+        """
+        expected = list(range(10))
+        for value in expected:
+            self.dll.addNodeBack(value)
+        for i in reversed(range(10)):
+            self.assertEqual(self.dll.getValueByIndex(i), i)
+        self.assertIs(self.dll.findNodeByIndex(9)[0], self.dll._tail_pointer)
+
+        self.dll.getValueByIndex(6)
+        self.dll.addNodeFront(-1)
+        expected.insert(0, -1)
+        self.dll.insertNode(5, 'x')
+        expected.insert(5, 'x')
+        self.dll.deleteNodeByIndex(7)
+        del expected[7]
+        self.dll.deleteNodeByIndex(len(expected) - 1)
+        expected.pop()
+        self.assertEqual(self.dll.popBack().value, expected.pop())
+        for i in [3, 4, 2, 8, 0, len(expected) - 1, 5]:
+            self.assertEqual(self.dll.getValueByIndex(i), expected[i])
+
+        self.dll.iterMode(False)
+        self.assertEqual(list(self.dll), expected)
+        self.assertEqual(self.dll.getLength(), len(expected))
+
+
+    def testFromIterableAndSplice(self):
+        """
+        fromIterable(), splice() 테스트.
+        """
+        dll = DoublyLinkedList.fromIterable(range(5))
+        self.assertIsInstance(dll, DoublyLinkedList)
+        self.assertEqual(dll.getLength(), 5)
+        self.assertEqual(repr(dll), '0 <-> 1 <-> 2 <-> 3 <-> 4')
+        self.assertEqual(dll.popBack().value, 4)
+
+        self.dll.splice(dll)
+        self.assertEqual(dll.getLength(), 0)
+        self.assertEqual(repr(dll), "빈 연결리스트.")
+        self.dll.splice(DoublyLinkedList.fromIterable(['a', 'b']))
+        self.dll.splice(DoublyLinkedList())
+        self.assertEqual(repr(self.dll), '0 <-> 1 <-> 2 <-> 3 <-> a <-> b')
+        self.assertEqual(self.dll.getLength(), 6)
+        self.assertEqual(self.dll.findNodeByIndex(4)[0].prev_pointer.value, 3)
+        self.assertEqual(self.dll.popBack().value, 'b')
+
+        self.assertRaises(ValueError, self.dll.splice, self.dll)
+        self.assertRaises(TypeError, self.dll.splice, [1, 2])
+
+    def testSplitAt(self):
+        """
+        need_dataset\n
+        splitAt() 테스트.
+        """
+        node = self.dll.findNodeByIndex(2)[0]
+        back = self.dll.splitAt(node)
+        self.assertEqual(repr(self.dll), 'a <-> b')
+        self.assertEqual(repr(back), 'c <-> d')
+        self.assertEqual(self.dll.getLength(), 2)
+        self.assertEqual(back.getLength(), 2)
+        self.assertIsNone(node.prev_pointer)
+        self.assertEqual(self.dll.popBack().value, 'b')
+
+        # 커서가 가리키지 않는 노드로 나누기.
+        front = back.splitAt(back._head_pointer)
+        self.assertEqual(back.getLength(), 0)
+        self.assertEqual(repr(front), 'c <-> d')
+        self.dll.splice(front)
+        self.assertEqual(repr(self.dll), 'a <-> c <-> d')
+
 
 class TestCircleLL(unittest.TestCase):
     """
@@ -826,6 +966,147 @@ class TestCircleLL(unittest.TestCase):
         )
 
 
+    def testInsertAndDeleteAtEnds(self):
+        """
+        need_dataset\n
+        맨 앞, 맨 뒤 위치의 삽입 및 삭제 후에도 원형이 유지되는지 테스트.
+        """
+        self.cll.insertNode(0, 'x')
+        self.cll.deleteNodeByIndex(10)
+        self.cll.deleteNodeByIndex(1)
+        self.assertEqual(self.cll.popFront().value, 'x')
+        self.assertEqual(self.cll.popBack().value, 'i')
+        self.assertEqual(repr(self.cll), 'b <-> c <-> d <-> e <-> f <-> g <-> h')
+        self.assertIs(self.cll._tail_pointer.next_pointer, self.cll._head_pointer)
+        self.assertIs(self.cll._head_pointer.prev_pointer, self.cll._tail_pointer)
+
+    def testRotate(self):
+        """
+        need_dataset\n
+        rotate() 테스트.
+        """
+        self.cll.rotate()
+        self.assertEqual(self.cll.getValueByIndex(0), 'b')
+        self.assertEqual(self.cll.getValueByIndex(9), 'a')
+        self.cll.rotate(-3)
+        self.assertEqual(
+            repr(self.cll),
+            'i <-> j <-> a <-> b <-> c <-> d <-> e <-> f <-> g <-> h'
+            )
+        self.cll.rotate(22)
+        self.cll.iterMode(False)
+        self.assertEqual(list(self.cll), list('abcdefghij'))
+        self.assertEqual(self.cll.getLength(), 10)
+
+        single = CircularLinkedList.fromIterable(['z'])
+        single.rotate(5)
+        self.assertEqual(repr(single), 'z')
+
+    def testSpliceAndSplit(self):
+        """
+        need_dataset\n
+        fromIterable(), splice(), splitAt() 후에도 원형이 유지되는지 테스트.
+        """
+        self.cll.splice(CircularLinkedList.fromIterable(['k', 'l']))
+        self.cll.splice(DoublyLinkedList.fromIterable(['m']))
+        self.assertEqual(self.cll.getLength(), 13)
+        self.assertEqual(self.cll.findNodeByIndex(13)[0].value, 'a')
+
+        back = self.cll.splitAt(self.cll.findNodeByIndex(10)[0])
+        self.assertIsInstance(back, CircularLinkedList)
+        self.assertEqual(repr(back), 'k <-> l <-> m')
+        self.assertEqual(back.findNodeByIndex(3)[0].value, 'k')
+        self.assertEqual(self.cll.findNodeByIndex(-1)[0].value, 'i')
+        self.assertIs(self.cll._tail_pointer.next_pointer, self.cll._head_pointer)
+        self.assertEqual(list(CircularLinkedList.fromIterable([])), [])
+
+
+class TestUnrolledLinkedList(unittest.TestCase):
+    """
+    my_linked_list.py의 UnrolledLinkedList 클래스 테스트.
+    """
+    def setUp(self):
+        self.ull = UnrolledLinkedList(block_size=4)
+        self.desc = self.shortDescription()
+        self.dataset = list(range(10))
+
+        if self.desc == 'need_dataset':
+            for data in self.dataset:
+                self.ull.addNodeBack(data)
+
+    def tearDown(self):
+        self.ull.clear()
+
+    def testEmpty(self):
+        """
+        비어있는 연결리스트 테스트.
+        """
+        self.assertEqual(repr(self.ull), "빈 연결리스트.")
+        self.assertEqual(self.ull.getLength(), 0)
+        self.assertEqual(list(self.ull), [])
+        self.assertRaises(IndexError, self.ull.popFront)
+        self.assertRaises(IndexError, self.ull.popBack)
+        self.assertRaises(IndexError, self.ull.getValueByIndex, 0)
+        self.assertRaises(ValueError, UnrolledLinkedList, 1)
+
+    def testAddAndIter(self):
+        """
+        need_dataset\n
+        맨 뒤 삽입 시 블록을 가득 채우는지, 순회 및 인덱스 탐색 테스트.
+        """
+        self.assertEqual(list(self.ull), self.dataset)
+        self.assertEqual(self.ull.getBlockCount(), 3)
+        self.assertEqual(repr(self.ull), " -> ".join(map(str, self.dataset)))
+        for i, value in enumerate(self.dataset):
+            self.assertEqual(self.ull.getValueByIndex(i), value)
+        self.assertRaises(IndexError, self.ull.getValueByIndex, 10)
+
+        self.ull.addNodeFront(-1)
+        self.ull.addNodeFront(-2)
+        self.assertEqual(list(self.ull), [-2, -1] + self.dataset)
+        self.assertEqual(self.ull.getLength(), 12)
+
+    def testInsertAndDelete(self):
+        """
+        need_dataset\n
+        insertNode(), deleteNodeByIndex() 테스트. (블록 분할 및 병합)
+        """
+        expected = self.dataset[:]
+        self.ull.insertNode(2, 'a')
+        expected.insert(2, 'a')
+        self.ull.insertNode(0, 'b')
+        expected.insert(0, 'b')
+        self.ull.insertNode(11, 'c')
+        expected.insert(11, 'c')
+        self.assertEqual(list(self.ull), expected)
+        self.assertRaises(IndexError, self.ull.insertNode, 100, 'd')
+
+        for index in [0, 5, 5, 5, 1]:
+            self.ull.deleteNodeByIndex(index)
+            del expected[index]
+            self.assertEqual(list(self.ull), expected)
+        self.assertEqual(self.ull.getLength(), len(expected))
+        self.assertLessEqual(
+            self.ull.getBlockCount(),
+            len(expected) // 2 + 1
+            )
+
+    def testPopFrontAndBack(self):
+        """
+        need_dataset\n
+        popFront(), popBack() 테스트.
+        """
+        self.assertEqual(self.ull.popFront(), 0)
+        self.assertEqual(self.ull.popBack(), 9)
+        self.assertEqual(list(self.ull), list(range(1, 9)))
+        for _ in range(8):
+            self.ull.popBack()
+        self.assertEqual(self.ull.getLength(), 0)
+        self.assertEqual(self.ull.getBlockCount(), 0)
+        self.ull.addNodeBack('x')
+        self.assertEqual(self.ull.popFront(), 'x')
+
+
 def test_only_some_methods() -> (None):
     """
     테스트 도중 프로그램이 멈추는 현상이 발생. 
@@ -5,7 +5,16 @@ from dirimporttool import get_super_dir_directly
 super_dir = get_super_dir_directly(__file__, 2)
 sys.path.append(super_dir)
 
-from linked_list.linked_list_kv import LinkedList
+from linked_list.linked_list_kv import LinkedList, set_debug_mode
+
+
+def setUpModule():
+    # 노드 삭제 여부 확인을 위해 노드 수 세기(디버그 모드)를 켠다.
+    set_debug_mode(True)
+
+
+def tearDownModule():
+    set_debug_mode(False)
 
 
 class TestLinkedList(unittest.TestCase):
@@ -221,6 +230,63 @@ class TestLinkedList(unittest.TestCase):
         self.assertEqual(self.ll.getValueByKey(target_key), None)
         self.assertEqual(self.ll.findNodeByKey(target_key), (None, None, None))
 
+
+class TestIndexedLinkedList(TestLinkedList):
+    """
+    키 색인을 사용하는 LinkedList(indexed=True) 테스트. 
+    TestLinkedList의 모든 테스트를 색인을 사용하는 연결리스트로 다시 수행한다.
+    """
+    def setUp(self) -> (None):
+        super().setUp()
+        self.ll = LinkedList(indexed=True)
+        if self.desc == 'need_dataset':
+            for data in self.test_dataset:
+                self.ll.addNodeBack(data)
+
+    def testFindNodeByKey(self):
+        """
+        need_dataset\n
+        FindNodeByKey() 메서드 테스트. 
+        색인을 사용하면 노드의 인덱스 대신 None을 반환한다.
+        """
+        self.assertTrue(self.ll.isIndexed())
+        find_node, find_idx, prev_node = self.ll.findNodeByKey('계산기')
+        self.assertEqual(find_node.item, ('계산기', 5000))
+        self.assertIsNone(find_idx)
+        self.assertEqual(prev_node.key, '책')
+        self.assertEqual(self.ll.findNodeByKey('책')[0].value, 12000)
+        self.assertEqual(self.ll.findNodeByKey('우산'), (None, None, None))
+
+    def testInsertNode(self):
+        """
+        need_dataset\n
+        insertNode()와 삭제 후에도 색인이 올바른지 테스트.
+        """
+        self.ll.insertNode(1, '우산', 10000)
+        self.ll.insertNode(0, '펜', 1000)
+        self.ll.insertNode(3, '책', 15000)
+        self.assertEqual(
+            self.ll.keys(),
+            ['펜', '책', '우산', '계산기', '이어폰', '립밤']
+            )
+        self.assertEqual(self.ll.getValueByKey('책'), 15000)
+        self.assertEqual(self.ll.findNodeByKey('계산기')[2].key, '우산')
+
+        self.ll.deleteNodeByIndex(2)
+        self.assertEqual(self.ll.findNodeByKey('계산기')[2].key, '책')
+        self.assertEqual(self.ll.popBack(False), ('립밤', 5000))
+        self.assertEqual(self.ll.popBack(False), ('이어폰', 20000))
+        self.assertEqual(self.ll._tail_pointer.key, '계산기')
+        self.assertEqual(self.ll.popFront(False), ('펜', 1000))
+        self.assertIsNone(self.ll.findNodeByKey('책')[2])
+        self.assertEqual(self.ll.items(), [('책', 15000), ('계산기', 5000)])
+
+        self.ll.clear()
+        self.assertIsNone(self.ll.getValueByKey('책'))
+        self.ll.addNodeBack('책', 1)
+        self.assertEqual(self.ll.items(), [('책', 1)])
+
+
 if __name__ == '__main__':
     unittest.main()
     
\ No newline at end of file
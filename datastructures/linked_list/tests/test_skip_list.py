@@ -0,0 +1,179 @@
+import unittest
+import sys
+import random
+
+from dirimporttool import get_super_dir_directly
+super_dir = get_super_dir_directly(__file__, 2)
+sys.path.append(super_dir)
+
+from linked_list.skip_list import SkipList, SkipListKV, compare_search_time
+
+
+class TestSkipList(unittest.TestCase):
+    def setUp(self):
+        self.sl = SkipList(seed=0)
+        self.desc = self.shortDescription()
+        self.dataset = [50, 20, 80, 10, 30, 70, 90, 40, 60]
+
+        if self.desc == 'need_dataset':
+            for data in self.dataset:
+                self.sl.addNode(data)
+
+    def tearDown(self):
+        self.sl.clear()
+
+    def testEmpty(self):
+        """
+        비어있는 스킵 리스트 테스트.
+        """
+        self.assertEqual(repr(self.sl), "빈 연결리스트.")
+        self.assertEqual(self.sl.getLength(), 0)
+        self.assertEqual(list(self.sl), [])
+        self.assertIsNone(self.sl.findNodeByValue(10))
+        self.sl.deleteNodeByValue(10)
+        self.assertEqual(list(self.sl.range(0, 100)), [])
+        self.assertRaises(ValueError, SkipList, 0)
+        self.assertRaises(ValueError, SkipList, 16, 1)
+
+    def testSortedInsert(self):
+        """
+        need_dataset\n
+        삽입 순서와 관계없이 오름차순으로 유지되는지 테스트.
+        """
+        self.assertEqual(list(self.sl), sorted(self.dataset))
+        self.assertEqual(len(self.sl), len(self.dataset))
+        self.assertEqual(
+            repr(self.sl),
+            " -> ".join(map(str, sorted(self.dataset)))
+            )
+        self.sl.addNode(50)
+        self.assertEqual(list(self.sl).count(50), 2)
+
+    def testFindAndDelete(self):
+        """
+        need_dataset\n
+        findNodeByValue(), deleteNodeByValue() 테스트.
+        """
+        self.assertEqual(self.sl.findNodeByValue(30).value, 30)
+        self.assertIsNone(self.sl.findNodeByValue(35))
+        self.assertIn(90, self.sl)
+        self.assertNotIn(100, self.sl)
+
+        for value in [10, 90, 50, 50]:
+            self.sl.deleteNodeByValue(value)
+        expected = sorted(set(self.dataset) - {10, 50, 90})
+        self.assertEqual(list(self.sl), expected)
+        self.assertEqual(self.sl.getLength(), len(expected))
+
+    def testRange(self):
+        """
+        need_dataset\n
+        range() 범위 탐색 테스트. (low 이상 high 미만)
+        """
+        self.assertEqual(list(self.sl.range(25, 60)), [30, 40, 50])
+        self.assertEqual(list(self.sl.range(60, 60)), [])
+        self.assertEqual(list(self.sl.range(0, 1000)), sorted(self.dataset))
+
+    def testRandomOperations(self):
+        """
+        무작위 삽입, 삭제 결과가 정렬된 리스트와 같은지 확인.
+        """
+        rng = random.Random(1)
+        expected = []
+        for _ in range(2000):
+            value = rng.randrange(200)
+            if rng.random() < 0.6:
+                self.sl.addNode(value)
+                expected.append(value)
+            else:
+                self.sl.deleteNodeByValue(value)
+                if value in expected:
+                    expected.remove(value)
+        self.assertEqual(list(self.sl), sorted(expected))
+        self.assertLessEqual(self.sl.getLevel(), 32)
+
+
+class TestSkipListKV(unittest.TestCase):
+    def setUp(self):
+        self.sl = SkipListKV(seed=0)
+        self.desc = self.shortDescription()
+        self.test_dataset = [
+            ('책', 12000),
+            ('계산기', 5000),
+            ('이어폰', 20000),
+            ('립밤', 5000),
+        ]
+
+        if self.desc == 'need_dataset':
+            for data in self.test_dataset:
+                self.sl.addNode(data)
+
+    def tearDown(self):
+        self.sl.clear()
+
+    def testEmpty(self):
+        """
+        비어있는 스킵 리스트 테스트.
+        """
+        self.assertEqual(repr(self.sl), "<empty>")
+        self.assertEqual(self.sl.items(), [])
+        self.assertIsNone(self.sl.getValueByKey('책'))
+
+    def testItems(self):
+        """
+        need_dataset\n
+        items(), keys(), values() 및 순회 테스트.
+        """
+        expected = sorted(self.test_dataset)
+        self.assertEqual(self.sl.items(), expected)
+        self.assertEqual(list(self.sl), expected)
+        self.assertEqual(self.sl.keys(), [k for k, _ in expected])
+        self.assertEqual(self.sl.values(), [v for _, v in expected])
+
+    def testAddAndUpdate(self):
+        """
+        need_dataset\n
+        같은 키 삽입 시 값만 수정되는지 테스트.
+        """
+        self.sl.addNode('책', 15000)
+        self.sl.addNode(('펜', 1000))
+        self.assertEqual(self.sl.getValueByKey('책'), 15000)
+        self.assertEqual(self.sl.findNodeByKey('펜').item, ('펜', 1000))
+        self.assertEqual(self.sl.getLength(), len(self.test_dataset) + 1)
+
+    def testDelete(self):
+        """
+        need_dataset\n
+        deleteNodeByKey(), deleteNodeByValue() 테스트.
+        """
+        self.sl.deleteNodeByKey('계산기')
+        self.sl.deleteNodeByKey('없는 키')
+        self.assertIsNone(self.sl.findNodeByKey('계산기'))
+        self.assertEqual(self.sl.findNodeByValue(5000).key, '립밤')
+        self.sl.deleteNodeByValue(5000)
+        self.assertEqual(self.sl.keys(), ['이어폰', '책'])
+
+    def testRange(self):
+        """
+        range() 범위 탐색 테스트.
+        """
+        for key in range(0, 100, 10):
+            self.sl.addNode(key, str(key))
+        self.assertEqual(
+            list(self.sl.range(25, 60)),
+            [(30, '30'), (40, '40'), (50, '50')]
+            )
+
+
+class TestCompareSearchTime(unittest.TestCase):
+    def testResult(self):
+        """
+        비교 결과에 모든 탐색 메서드가 포함되는지 확인.
+        """
+        result = compare_search_time(n=200, n_queries=50)
+        self.assertEqual(len(result), 4)
+        self.assertTrue(all(elapsed >= 0 for elapsed in result.values()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,22 +1,51 @@
 """큐(queue) 자료구조를 구현한 모듈. 
 사이즈를 고정시킨 큐(StaticQueue)와 
-사이즈를 동적으로 변경시킬 수 있는 큐(DynamicQueue)로 구성되어 있음. 
+사이즈를 동적으로 변경시킬 수 있는 큐(DynamicQueue), 
+고정 크기의 원형 버퍼를 사용하는 큐(RingBufferQueue), 
+asyncio에서 사용할 수 있는 동적 큐(AsyncDynamicQueue)로 구성되어 있음. 
+
+모든 큐는 raise_error 모드를 지원한다. raise_error 모드에서는 가득 찬 큐에 
+삽입하거나 빈 큐에서 추출할 때 메시지를 출력하는 대신 Full, Empty 예외를 발생시킨다.
 
 """
 
-from typing import Any
+import asyncio
+import queue
+from array import array
+from itertools import chain
+from typing import Any, AsyncGenerator, Iterator
 
 __all__ = [
     'StaticQueue',
     'DynamicQueue',
+    'RingBufferQueue',
+    'AsyncDynamicQueue',
+    'Full',
+    'Empty',
 ]
 
+FULL_MSG = "큐에 데이터가 꽉 차서 더 이상 삽입할 수 없습니다."
+EMPTY_MSG = "큐가 비어서 출력할 데이터가 없습니다."
+
+
+class Full(queue.Full):
+    """raise_error 모드에서 가득 찬 큐에 삽입 시도 시 발생하는 예외.
+    표준 라이브러리의 queue.Full을 상속받는다.
+    """
+
+
+class Empty(queue.Empty):
+    """raise_error 모드에서 빈 큐에서 추출 시도 시 발생하는 예외.
+    표준 라이브러리의 queue.Empty를 상속받는다.
+    """
+
 
 class StaticQueue():
     def __init__(
             self,
             limit_size: int = 10,
-            msg_on_off: bool = True
+            msg_on_off: bool = True,
+            raise_error: bool = False
         ):
         """큐의 왼쪽에서 데이터 삽입, 오른쪽에서 데이터 추출 가능한 구조.
 
@@ -27,43 +56,60 @@ class StaticQueue():
         msg_on_off : bool, default True
             enqueue, dequeue에서 발생할 수 있는 메시지를 출력할 것인지에 대한 변수. 
             True -> 메시지가 출력된다. False -> 메시지가 출력되지 않는다. 
+        raise_error : bool, default False
+            True이면 메시지를 출력하거나 None을 반환하는 대신, 
+            가득 찬 큐에 삽입 시 Full, 빈 큐에서 추출 시 Empty 예외를 발생시킨다. 
+            이 때는 msg_on_off와 관계없이 메시지를 출력하지 않는다.
         
         """
         self._en_stack = []
         self._de_stack = []
         self._limit_size = limit_size
         self._msg_mode: bool = msg_on_off
+        self._raise_error: bool = raise_error
 
     def getMsgMode(self) -> (bool): return self._msg_mode
     def setMsgMode(self, on_off: bool) -> (None): self._msg_mode = on_off
+    def getRaiseMode(self) -> (bool): return self._raise_error
+    def setRaiseMode(self, on_off: bool) -> (None): self._raise_error = on_off
 
     def _transfer(self):
-        while self._en_stack:
-            self._de_stack.append(self._en_stack.pop())
+        # self._de_stack이 비어 있을 때만 호출되므로, 항목들을 하나씩 옮기는 대신 
+        # self._en_stack을 뒤집어 두 리스트를 맞바꾼다.
+        self._en_stack.reverse()
+        self._en_stack, self._de_stack = self._de_stack, self._en_stack
+
+    def _onFull(self) -> (None):
+        if self._raise_error:
+            raise Full(FULL_MSG)
+        if self._msg_mode:
+            print(FULL_MSG)
+
+    def _onEmpty(self) -> (None):
+        if self._raise_error:
+            raise Empty(EMPTY_MSG)
+        if self._msg_mode:
+            print(EMPTY_MSG)
 
     def isEmpty(self) -> (bool):
-        return self._en_stack == [] and self._de_stack == []
+        return not self._en_stack and not self._de_stack
 
     def getCurrentSize(self) -> (int):
         return len(self._en_stack) + len(self._de_stack)
 
     def enqueue(self, item):
-        cur_size = self.getCurrentSize()
-        if cur_size != self._limit_size:
+        if len(self._en_stack) + len(self._de_stack) != self._limit_size:
             self._en_stack.append(item)
-        elif self._msg_mode:
-            print("큐에 데이터가 꽉 차서 더 이상 삽입할 수 없습니다.")
+        else:
+            self._onFull()
 
     def dequeue(self) -> (Any | None):
         if not self._de_stack:
+            if not self._en_stack:
+                self._onEmpty()
+                return None
             self._transfer()
-
-        try:
-            return self._de_stack.pop()
-        except IndexError:
-            if self._msg_mode:
-                print("큐가 비어서 출력할 데이터가 없습니다.")
-        return None
+        return self._de_stack.pop()
 
     def seek_peek(self) -> (Any | None):
         if not self._de_stack:
@@ -78,6 +124,12 @@ class StaticQueue():
         self._en_stack.clear()
         self._de_stack.clear()
 
+    def __iter__(self) -> (Iterator[Any]):
+        """__repr__()과 같은 순서(마지막으로 삽입된 항목부터 다음에 추출될 항목까지)로
+        항목들을 순회한다. 큐에서 항목을 꺼내지는 않는다.
+        """
+        return chain(reversed(self._en_stack), self._de_stack)
+
     def __repr__(self):
         if self._en_stack == [] and self._de_stack == []:
             return repr([])
@@ -94,7 +146,11 @@ class StaticQueue():
 
 
 class DynamicQueue(StaticQueue):
-    def __init__(self, msg_on_off: bool = True) -> (None):
+    def __init__(
+            self,
+            msg_on_off: bool = True,
+            raise_error: bool = False
+        ) -> (None):
         """크기 제한없이 동적으로 데이터를 enqueue및 dequeue할 수 있는 동적 큐.
 
         Parameters
@@ -102,15 +158,192 @@ class DynamicQueue(StaticQueue):
         msg_on_off : bool, default True
             enqueue, dequeue에서 발생할 수 있는 메시지를 출력할 것인지에 대한 변수. 
             True -> 메시지가 출력된다. False -> 메시지가 출력되지 않는다. 
+        raise_error : bool, default False
+            True이면 빈 큐에서 추출 시 메시지 출력 대신 Empty 예외를 발생시킨다.
         """
         self._en_stack = []
         self._de_stack = []
         self._msg_mode: bool = msg_on_off
+        self._raise_error: bool = raise_error
 
     def enqueue(self, item: any) -> (None):
         self._en_stack.append(item)
 
 
+class RingBufferQueue():
+    def __init__(
+            self,
+            limit_size: int = 10,
+            msg_on_off: bool = True,
+            typecode: str | None = None,
+            raise_error: bool = False
+        ):
+        """고정 크기의 원형 버퍼(ring buffer)를 이용한 큐. 
+        StaticQueue와 같은 메서드들을 제공한다.
+
+        버퍼의 맨 앞 항목 위치와 항목 수만으로 삽입, 추출 위치를 계산하므로 
+        StaticQueue처럼 한 번에 모든 항목을 옮기는 일이 없어 
+        enqueue(), dequeue(), seek_peek()이 최악의 경우에도 O(1)이다.
+
+        Parameters
+        ----------
+        limit_size : int
+            queue가 담을 수 있는 총 아이템 수 지정.
+        msg_on_off : bool, default True
+            enqueue, dequeue에서 발생할 수 있는 메시지를 출력할 것인지에 대한 변수. 
+            True -> 메시지가 출력된다. False -> 메시지가 출력되지 않는다. 
+        typecode : str | None, default None
+            지정 시 리스트 대신 해당 타입 코드의 array.array를 버퍼로 사용한다. 
+            ex) 'i' -> 정수, 'd' -> 실수. 
+            숫자 항목만 저장할 때 항목마다 파이썬 객체를 보관하지 않으므로 
+            메모리를 적게 사용한다. 
+        raise_error : bool, default False
+            True이면 메시지를 출력하거나 None을 반환하는 대신, 
+            가득 찬 큐에 삽입 시 Full, 빈 큐에서 추출 시 Empty 예외를 발생시킨다.
+
+        Raises
+        ------
+        ValueError
+            limit_size가 1보다 작은 경우.
+
+        """
+        if limit_size < 1:
+            raise ValueError("limit_size는 1 이상이어야 합니다.")
+        self._limit_size = limit_size
+        self._msg_mode: bool = msg_on_off
+        self._raise_error: bool = raise_error
+        self._typecode = typecode
+        if typecode is None:
+            self._buffer = [None] * limit_size
+        else:
+            self._buffer = array(typecode, [0]) * limit_size
+        self._head = 0  # 다음에 추출할 항목의 버퍼 내 위치.
+        self._size = 0
+
+    def getMsgMode(self) -> (bool): return self._msg_mode
+    def setMsgMode(self, on_off: bool) -> (None): self._msg_mode = on_off
+    def getRaiseMode(self) -> (bool): return self._raise_error
+    def setRaiseMode(self, on_off: bool) -> (None): self._raise_error = on_off
+
+    def isEmpty(self) -> (bool):
+        return self._size == 0
+
+    def isFull(self) -> (bool):
+        return self._size == self._limit_size
+
+    def getCurrentSize(self) -> (int):
+        return self._size
+
+    def enqueue(self, item):
+        if self._size == self._limit_size:
+            if self._raise_error:
+                raise Full(FULL_MSG)
+            if self._msg_mode:
+                print(FULL_MSG)
+            return
+        tail = self._head + self._size
+        if tail >= self._limit_size:
+            tail -= self._limit_size
+        self._buffer[tail] = item
+        self._size += 1
+
+    def dequeue(self) -> (Any | None):
+        if self._size == 0:
+            if self._raise_error:
+                raise Empty(EMPTY_MSG)
+            if self._msg_mode:
+                print(EMPTY_MSG)
+            return None
+        head = self._head
+        item = self._buffer[head]
+        if self._typecode is None:
+            # 꺼낸 항목을 버퍼가 계속 참조하지 않도록 한다.
+            self._buffer[head] = None
+        head += 1
+        self._head = 0 if head == self._limit_size else head
+        self._size -= 1
+        return item
+
+    def seek_peek(self) -> (Any | None):
+        if self._size == 0:
+            return None
+        return self._buffer[self._head]
+
+    def clear(self) -> (None):
+        """큐를 비운다."""
+        if self._typecode is None:
+            self._buffer = [None] * self._limit_size
+        self._head = 0
+        self._size = 0
+
+    def __repr__(self):
+        # StaticQueue와 같이 가장 최근에 삽입된 항목부터 출력한다.
+        items = []
+        for i in range(self._size - 1, -1, -1):
+            items.append(self._buffer[(self._head + i) % self._limit_size])
+        return repr(items)
+
+
+class AsyncDynamicQueue(asyncio.Queue):
+    """asyncio에서 await할 수 있는 동적 큐. 
+
+    asyncio.Queue의 항목 저장 방식(_init, _put, _get)만 DynamicQueue로 바꾼 것으로, 
+    항목을 꺼내는 순서는 DynamicQueue와 같다. 
+    await put(), await get()과 최대 크기(maxsize), 대기 중 취소(cancel) 처리 등은 
+    asyncio.Queue를 그대로 따른다. 
+    큐가 비었거나 가득 찼을 때는 이벤트 루프에 제어를 넘기고 기다리므로, 
+    큐를 반복해서 확인하는(polling) 방식과 달리 기다리는 동안 CPU를 사용하지 않는다.
+
+    ex) q = AsyncDynamicQueue(maxsize=100)
+    """
+    def _init(self, maxsize: int) -> (None):
+        self._queue = DynamicQueue(msg_on_off=False, raise_error=True)
+
+    def _put(self, item) -> (None):
+        self._queue.enqueue(item)
+
+    def _get(self) -> (Any):
+        return self._queue.dequeue()
+
+    def qsize(self) -> (int):
+        """현재 큐에 존재하는 총 아이템 개수 반환."""
+        return self._queue.getCurrentSize()
+
+    def empty(self) -> (bool):
+        return self._queue.isEmpty()
+
+    async def drain(
+            self,
+            timeout: float | None = 0
+        ) -> (AsyncGenerator[Any, None]):
+        """큐의 항목들을 차례로 꺼내어 반환하는 비동기 제너레이터. (async for)
+
+        큐가 비면 timeout초 동안 새 항목이 들어오기를 기다리고, 
+        그래도 들어오지 않으면 끝난다. 
+
+        Parameters
+        ----------
+        timeout : float | None, default 0
+            0이면 기다리지 않고 바로 끝나며, None이면 새 항목을 끝없이 기다린다.
+
+        """
+        while True:
+            if not self.empty():
+                yield self.get_nowait()
+                continue
+            if timeout == 0:
+                return
+            try:
+                item = await asyncio.wait_for(self.get(), timeout)
+            except asyncio.TimeoutError:
+                return
+            yield item
+
+    def __aiter__(self) -> (AsyncGenerator[Any, None]):
+        """async for로 큐가 빌 때까지 항목들을 꺼낸다. (drain() 참고)"""
+        return self.drain()
+
+
 def test_static_queue():
     q = StaticQueue()
     data = ['a', 'b', 'c', 'd']
@@ -1,11 +1,15 @@
 import unittest
 import sys
+import queue
+import asyncio
 
 from dirimporttool import get_super_dir_directly
 super_dir = get_super_dir_directly(__file__, 2)
 sys.path.append(super_dir)
 
-from queue_.my_queue import StaticQueue, DynamicQueue
+from queue_.my_queue import (
+    StaticQueue, DynamicQueue, RingBufferQueue, AsyncDynamicQueue, Full, Empty
+)
 
 
 class TestQueue(unittest.TestCase):
@@ -91,6 +95,28 @@ class TestQueue(unittest.TestCase):
         self.assertEqual(self.q.dequeue(), None)
         self.assertEqual(self.q.seek_peek(), None)
 
+    def test_raise_mode(self):
+        """
+        need_dataset\n
+        raise_error 모드에서 Full, Empty 예외 발생 테스트.
+        """
+        self.q.setRaiseMode(True)
+        self.assertEqual(self.q.getRaiseMode(), True)
+        with self.assertRaises(Full):
+            self.q.enqueue('남색')
+        self.assertEqual(self.q.getCurrentSize(), 5)
+
+        for data in self.dataset:
+            self.assertEqual(self.q.dequeue(), data)
+        # 표준 라이브러리 queue.Empty로도 잡을 수 있다.
+        with self.assertRaises(queue.Empty):
+            self.q.dequeue()
+        self.assertEqual(self.q.seek_peek(), None)
+
+        self.q.setRaiseMode(False)
+        self.q.setMsgMode(False)
+        self.assertEqual(self.q.dequeue(), None)
+
 
 class TestDynamicQueue(unittest.TestCase):
     def setUp(self):
@@ -177,6 +203,137 @@ class TestDynamicQueue(unittest.TestCase):
         self.assertEqual(self.q.dequeue(), None)
         self.assertEqual(self.q.seek_peek(), None)
 
+    def test_raise_mode(self):
+        """
+        빈 동적 큐에서 추출 시 Empty 예외 발생 테스트.
+        """
+        q = DynamicQueue(raise_error=True)
+        q.enqueue('빨강')
+        self.assertEqual(q.dequeue(), '빨강')
+        self.assertRaises(Empty, q.dequeue)
+
+
+class TestRingBufferQueue(TestQueue):
+    """
+    RingBufferQueue 테스트. 
+    StaticQueue와 같은 동작을 하는지 TestQueue의 테스트들을 다시 수행한다.
+    """
+    def setUp(self):
+        self.q = RingBufferQueue(5)
+        self.desc = self.shortDescription()
+        self.dataset = ['빨강', '주황', '노랑', '초록', '파랑']
+
+        if self.desc == 'need_dataset':
+            for data in self.dataset:
+                self.q.enqueue(data)
+
+    def test_wrap_around(self):
+        """
+        need_dataset\n
+        버퍼의 끝을 넘어 처음 위치로 돌아가며 삽입, 추출되는지 테스트.
+        """
+        self.q.setMsgMode(False)
+        self.assertEqual(self.q.isFull(), True)
+        self.q.enqueue('남색')
+        self.assertEqual(self.q.getCurrentSize(), 5)
+
+        for data in ['남색', '보라', '검정']:
+            self.q.dequeue()
+            self.q.enqueue(data)
+        self.assertEqual(self.q.seek_peek(), '초록')
+        self.assertEqual(
+            self.q.__repr__(),
+            "['검정', '보라', '남색', '파랑', '초록']"
+            )
+        self.assertEqual(
+            [self.q.dequeue() for _ in range(5)],
+            ['초록', '파랑', '남색', '보라', '검정']
+            )
+        self.assertEqual(self.q.isEmpty(), True)
+        self.assertRaises(ValueError, RingBufferQueue, 0)
+
+    def test_typed_buffer(self):
+        """
+        array.array를 버퍼로 사용하는 큐 테스트.
+        """
+        q = RingBufferQueue(3, msg_on_off=False, typecode='d')
+        for value in [1.5, 2.5, 3.5, 4.5]:
+            q.enqueue(value)
+        self.assertEqual(q.__repr__(), "[3.5, 2.5, 1.5]")
+        self.assertEqual(q.dequeue(), 1.5)
+        q.enqueue(4.5)
+        self.assertEqual([q.dequeue() for _ in range(3)], [2.5, 3.5, 4.5])
+        self.assertEqual(q.dequeue(), None)
+        self.assertRaises(TypeError, q.enqueue, 'a')
+
+class TestAsyncDynamicQueue(unittest.IsolatedAsyncioTestCase):
+    async def test_repr(self):
+        """
+        항목이 있는 큐의 repr() 테스트.
+        """
+        q = AsyncDynamicQueue(maxsize=5)
+        await q.put('사과')
+        await q.put('바나나')
+        self.assertIn("maxsize=5", repr(q))
+        self.assertIn("_queue=['바나나', '사과']", str(q))
+        self.assertEqual(list(q._queue), ['바나나', '사과'])
+        self.assertEqual(await q.get(), '사과')
+        await q.put('당근')
+        self.assertIn("_queue=['당근', '바나나']", repr(q))
+
+    async def test_fifo_and_drain(self):
+        """
+        선입선출 순서와 async for를 이용한 drain 테스트.
+        """
+        q = AsyncDynamicQueue()
+        for data in ['사과', '바나나', '당근']:
+            await q.put(data)
+        self.assertEqual(q.qsize(), 3)
+        self.assertEqual(await q.get(), '사과')
+        self.assertEqual([data async for data in q], ['바나나', '당근'])
+        self.assertTrue(q.empty())
+        self.assertRaises(asyncio.QueueEmpty, q.get_nowait)
+
+    async def test_backpressure(self):
+        """
+        가득 찬 큐에 put하는 작업이 자리가 생길 때까지 기다리는지 테스트.
+        """
+        q = AsyncDynamicQueue(maxsize=2)
+        await q.put(1)
+        await q.put(2)
+        self.assertTrue(q.full())
+        self.assertRaises(asyncio.QueueFull, q.put_nowait, 3)
+        producer = asyncio.create_task(q.put(3))
+        await asyncio.sleep(0)
+        self.assertFalse(producer.done())
+        self.assertEqual(await q.get(), 1)
+        await asyncio.wait_for(producer, 1)
+        self.assertEqual([data async for data in q.drain()], [2, 3])
+
+    async def test_cancel_and_wait(self):
+        """
+        기다리던 get을 취소해도 항목이 사라지지 않는지, 
+        drain이 timeout 동안 새 항목을 기다리는지 테스트.
+        """
+        q = AsyncDynamicQueue()
+        getter = asyncio.create_task(q.get())
+        await asyncio.sleep(0)
+        getter.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await getter
+        await q.put('참외')
+        self.assertEqual(q.get_nowait(), '참외')
+
+        async def produce():
+            await asyncio.sleep(0.01)
+            await q.put('오렌지')
+
+        producer = asyncio.create_task(produce())
+        self.assertEqual(
+            [data async for data in q.drain(timeout=1)], ['오렌지']
+        )
+        await producer
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,31 +1,80 @@
 """스택 자료구조 구현 모듈.
 크기가 고정된 스택(StaticStack)과 
-크기를 동적으로 변경시킬 수 있는 스택(DynamicStack)으로 구성되어 있음. 
+크기를 동적으로 변경시킬 수 있는 스택(DynamicStack), 
+정수, 실수, 좌표 등 고정된 길이의 숫자 레코드를 array.array에 저장하는 스택(TypedStack), 
+asyncio에서 사용할 수 있는 동적 스택(AsyncDynamicStack)으로 구성되어 있음. 
+
+모든 스택은 raise_error 모드를 지원한다. raise_error 모드에서는 가득 찬 스택에 
+삽입하거나 빈 스택에서 추출할 때 메시지를 출력하는 대신 Full, Empty 예외를 발생시킨다.
 
 """
 
-from typing import Any
+import asyncio
+import queue
+import sys
+from array import array
+from itertools import chain
+from typing import Any, AsyncGenerator, Iterable, Iterator
 
 __all__ = [
     'StaticStack', 
     'DynamicStack',
+    'TypedStack',
+    'AsyncDynamicStack',
+    'Full',
+    'Empty',
 ]
 
+FULL_MSG = "스택의 최대 크기에 도달하여 요소를 추가할 수 없습니다."
+EMPTY_MSG = "스택이 비어있어 반환할 아이템이 없습니다."
+
+
+class Full(queue.Full):
+    """raise_error 모드에서 가득 찬 스택에 삽입 시도 시 발생하는 예외.
+    표준 라이브러리의 queue.Full을 상속받는다.
+    """
+
+
+class Empty(queue.Empty):
+    """raise_error 모드에서 빈 스택에서 추출 시도 시 발생하는 예외.
+    표준 라이브러리의 queue.Empty를 상속받는다.
+    """
+
+
 class StaticStack():
-    def __init__(self, size_: int):
+    def __init__(
+            self,
+            size_: int,
+            msg_on_off: bool = True,
+            raise_error: bool = False
+        ):
         """스택의 크기를 고정시킨 스택.
 
         Parameters
         ----------
         size_ : int 
             스택 최대 크기 설정.
+        msg_on_off : bool, default True
+            push, pop, setNewSize에서 발생할 수 있는 메시지를 출력할 것인지에 대한 변수. 
+            True -> 메시지가 출력된다. False -> 메시지가 출력되지 않는다. 
+        raise_error : bool, default False
+            True이면 메시지를 출력하는 대신, 가득 찬 스택에 삽입 시 Full, 
+            빈 스택에서 추출 시 Empty, 잘못된 크기 재설정 시 ValueError 예외를 
+            발생시킨다. 이 때는 msg_on_off와 관계없이 메시지를 출력하지 않는다.
         
         """
         self._stack: list = []
         self.size_: int = size_
+        self._msg_mode: bool = msg_on_off
+        self._raise_error: bool = raise_error
+
+    def getMsgMode(self) -> (bool): return self._msg_mode
+    def setMsgMode(self, on_off: bool) -> (None): self._msg_mode = on_off
+    def getRaiseMode(self) -> (bool): return self._raise_error
+    def setRaiseMode(self, on_off: bool) -> (None): self._raise_error = on_off
 
     def is_empty(self) -> (bool):
-        return self._stack == []
+        return not self._stack
 
     def push(self, one_element) -> (bool):
         """맨 끝에 요소 삽입. 
@@ -44,20 +93,32 @@ class StaticStack():
             True: 삽입 성공 시 반환값.
             False: 삽입 실패 시 반환값.
 
+        Raises
+        ------
+        Full
+            raise_error 모드에서 스택이 가득 찬 경우.
+
         """
-        if self.getLength() == self.size_:
-            print("스택의 최대 크기에 도달하여 요소를 추가할 수 없습니다.")
+        if len(self._stack) >= self.size_:
+            if self._raise_error:
+                raise Full(FULL_MSG)
+            if self._msg_mode:
+                print(FULL_MSG)
             return False
         self._stack.append(one_element)
         return True
 
     def pop(self) -> (Any | None):
-        """맨 끝 요소 추출 후 스택에서 제거."""
-        try:
+        """맨 끝 요소 추출 후 스택에서 제거.
+        빈 스택이면 None을 반환한다. (raise_error 모드에서는 Empty 예외 발생)
+        """
+        if self._stack:
             return self._stack.pop()
-        except IndexError:
-            print("스택이 비어있어 반환할 아이템이 없습니다.")
-            return None
+        if self._raise_error:
+            raise Empty(EMPTY_MSG)
+        if self._msg_mode:
+            print(EMPTY_MSG)
+        return None
 
     def peek(self):
         """맨 끝 요소 조회."""
@@ -72,8 +133,12 @@ class StaticStack():
         현재 스택에 들어있는 요소들의 수보다 더 작게 설정하지 못하도록 함.
         """
         if new_size < self.getLength():
-            print("스택 내 항목들의 수보다 더 작게 설정할 수 없습니다.")
-            print(f"현재 스택 내 항목들의 수: {self.getLength()}")
+            msg = "스택 내 항목들의 수보다 더 작게 설정할 수 없습니다."
+            if self._raise_error:
+                raise ValueError(msg)
+            if self._msg_mode:
+                print(msg)
+                print(f"현재 스택 내 항목들의 수: {self.getLength()}")
             return
         self.size_ = new_size
 
@@ -81,14 +146,29 @@ class StaticStack():
         """스택을 모두 비운다."""
         self._stack.clear()
 
+    def __iter__(self) -> (Iterator[Any]):
+        """맨 아래 항목부터 맨 위 항목까지 순회한다."""
+        return iter(self._stack)
+
     def __repr__(self):
         return repr(self._stack)
 
 
 class DynamicStack(StaticStack):
-    def __init__(self):
-        """크기에 제한을 두지 않고 무한정 크기를 동적으로 늘릴 수 있는 스택."""
+    def __init__(self, msg_on_off: bool = True, raise_error: bool = False):
+        """크기에 제한을 두지 않고 무한정 크기를 동적으로 늘릴 수 있는 스택.
+
+        Parameters
+        ----------
+        msg_on_off : bool, default True
+            pop에서 발생할 수 있는 메시지를 출력할 것인지에 대한 변수. 
+        raise_error : bool, default False
+            True이면 빈 스택에서 추출 시 메시지 출력 대신 Empty 예외를 발생시킨다.
+        
+        """
         self._stack: list = []
+        self._msg_mode: bool = msg_on_off
+        self._raise_error: bool = raise_error
 
     def push(self, one_element):
         """맨 끝에 요소 삽입."""
@@ -99,6 +179,301 @@ class DynamicStack(StaticStack):
         pass
 
 
+class TypedStack(StaticStack):
+    def __init__(
+            self,
+            typecode: str = 'q',
+            width: int = 1,
+            size_: int | None = None,
+            msg_on_off: bool = True,
+            raise_error: bool = False
+        ):
+        """숫자로 이루어진 고정 길이의 레코드를 array.array에 저장하는 스택.
+
+        레코드마다 파이썬 객체를 따로 만들어 저장하지 않고, 
+        레코드를 이루는 숫자들을 하나의 array.array에 차례로 이어 붙여 저장한다. 
+        따라서 리스트를 사용하는 StaticStack, DynamicStack보다 요소당 메모리 사용량이 
+        훨씬 적다. 
+        width가 1이면 숫자 하나를, 2 이상이면 width개의 숫자로 이루어진 튜플 
+        (ex. (x, y) 좌표)을 하나의 레코드로 다룬다.
+
+        ex) 
+        st = TypedStack('i', width=2)
+        st.push((3, 4))
+        st.pop()  # (3, 4)
+
+        Parameters
+        ----------
+        typecode : str, default 'q'
+            array.array의 타입 코드. (ex. 'i', 'q': 정수, 'd': 실수)
+        width : int, default 1
+            레코드 하나를 이루는 숫자의 개수.
+        size_ : int | None, default None
+            스택 최대 크기(레코드 수) 설정. None이면 크기에 제한을 두지 않는다.
+        msg_on_off : bool, default True
+            StaticStack의 msg_on_off와 같다.
+        raise_error : bool, default False
+            StaticStack의 raise_error와 같다.
+
+        Raises
+        ------
+        ValueError
+            width가 1보다 작거나 typecode가 올바르지 않은 경우.
+
+        """
+        if width < 1:
+            raise ValueError("width는 1 이상이어야 합니다.")
+        self._stack: array = array(typecode)
+        self._typecode: str = typecode
+        self._width: int = width
+        self.size_: int | None = size_
+        self._msg_mode: bool = msg_on_off
+        self._raise_error: bool = raise_error
+        self._setLimit()
+
+    def _setLimit(self) -> (None):
+        # push 시 곱셈과 None 비교를 하지 않도록 버퍼 길이 기준의 한도를 미리 계산해둔다.
+        if self.size_ is None:
+            self._limit = sys.maxsize
+        else:
+            self._limit = self.size_ * self._width
+
+    def _onFull(self) -> (bool):
+        if self._raise_error:
+            raise Full(FULL_MSG)
+        if self._msg_mode:
+            print(FULL_MSG)
+        return False
+
+    def getTypecode(self) -> (str): return self._typecode
+    def getWidth(self) -> (int): return self._width
+
+    def push(self, one_element: int | float | tuple) -> (bool):
+        """맨 끝에 레코드 삽입. 
+
+        Parameters
+        ----------
+        one_element : int | float | tuple
+            width가 1이면 숫자 하나, 그 외에는 width개의 숫자로 이루어진 튜플.
+        
+        Returns
+        -------
+        bool
+            True: 삽입 성공 시 반환값.
+            False: 삽입 실패 시 반환값.
+
+        Raises
+        ------
+        Full
+            raise_error 모드에서 스택이 가득 찬 경우.
+        ValueError
+            레코드의 길이가 width와 다른 경우.
+
+        """
+        stack = self._stack
+        if len(stack) >= self._limit:
+            return self._onFull()
+        width = self._width
+        if width == 1:
+            stack.append(one_element)
+        elif width == 2:
+            # 가장 흔한 (x, y) 좌표는 extend()보다 빠른 append() 두 번으로 처리.
+            try:
+                x, y = one_element
+            except ValueError:
+                raise ValueError("레코드의 길이는 2이어야 합니다.") from None
+            stack.append(x)
+            try:
+                stack.append(y)
+            except (TypeError, OverflowError):
+                # 레코드의 일부만 남지 않도록 먼저 넣은 x를 되돌린다.
+                stack.pop()
+                raise
+        else:
+            # 레코드 전체를 array로 먼저 변환하여, 값이 잘못된 경우 
+            # 스택에 아무것도 넣지 않은 채로 예외가 발생하도록 한다.
+            record = array(self._typecode, one_element)
+            if len(record) != width:
+                raise ValueError(f"레코드의 길이는 {width}이어야 합니다.")
+            stack.extend(record)
+        return True
+
+    def pushMany(self, elements: Iterable) -> (bool):
+        """여러 레코드들을 순서대로 한 번에 삽입. 
+
+        모든 레코드를 삽입할 자리가 없으면 아무것도 삽입하지 않는다.
+
+        Returns
+        -------
+        bool
+            True: 삽입 성공 시 반환값.
+            False: 삽입 실패 시 반환값.
+
+        Raises
+        ------
+        Full
+            raise_error 모드에서 모든 레코드를 삽입할 자리가 없는 경우.
+        ValueError
+            길이가 width와 다른 레코드가 있는 경우.
+
+        """
+        if self._width == 1:
+            values = array(self._typecode, elements)
+        else:
+            elements = list(elements)
+            # 전체 길이만 비교하면 (1, 2, 3), (4,)처럼 길이가 잘못된 레코드들이
+            # 다른 레코드로 재조합되어 삽입되므로 레코드마다 길이를 확인한다.
+            width = self._width
+            if any(len(record) != width for record in elements):
+                raise ValueError(f"레코드의 길이는 {width}이어야 합니다.")
+            values = array(self._typecode, chain.from_iterable(elements))
+        if len(self._stack) + len(values) > self._limit:
+            return self._onFull()
+        self._stack.extend(values)
+        return True
+
+    def pop(self) -> (int | float | tuple | None):
+        """맨 끝 레코드 추출 후 스택에서 제거.
+        빈 스택이면 None을 반환한다. (raise_error 모드에서는 Empty 예외 발생)
+        """
+        stack = self._stack
+        if not stack:
+            return super().pop()
+        width = self._width
+        if width == 1:
+            return stack.pop()
+        if width == 2:
+            y = stack.pop()
+            return stack.pop(), y
+        record = tuple(stack[-width:])
+        del stack[-width:]
+        return record
+
+    def popMany(self, n: int) -> (list):
+        """맨 끝 레코드부터 최대 n개를 추출하여 꺼낸 순서대로 리스트로 반환.
+        스택에 레코드가 n개보다 적으면 남은 레코드를 모두 꺼낸다. 
+        빈 스택이면 빈 리스트를 반환한다. (raise_error 모드에서는 Empty 예외 발생)
+
+        Raises
+        ------
+        ValueError
+            n이 0보다 작은 경우.
+
+        """
+        if n < 0:
+            raise ValueError("n은 0 이상이어야 합니다.")
+        stack = self._stack
+        if not stack:
+            super().pop()
+            return []
+        count = min(n * self._width, len(stack))
+        values = stack[len(stack)-count:].tolist()
+        del stack[len(stack)-count:]
+        values.reverse()
+        if self._width == 1:
+            return values
+        # 뒤집힌 값들을 width개씩 묶은 뒤 각 레코드 안의 순서를 되돌린다.
+        return [
+            record[::-1] for record in zip(*[iter(values)] * self._width)
+        ]
+
+    def peek(self) -> (int | float | tuple):
+        """맨 끝 레코드 조회."""
+        if self._width == 1:
+            return self._stack[-1]
+        if not self._stack:
+            raise IndexError("pop from empty array")
+        return tuple(self._stack[-self._width:])
+
+    def getLength(self) -> (int):
+        """현재 스택에 들어있는 레코드의 수 반환."""
+        return len(self._stack) // self._width
+
+    def setNewSize(self, new_size: int | None):
+        """스택의 최대 크기 재설정. None이면 크기 제한을 없앤다.
+        현재 스택에 들어있는 레코드의 수보다 더 작게 설정하지 못하도록 함.
+        """
+        if new_size is None:
+            self.size_ = None
+        else:
+            super().setNewSize(new_size)
+        self._setLimit()
+
+    def clear(self):
+        """스택을 모두 비운다."""
+        del self._stack[:]
+
+    def __iter__(self) -> (Iterator[int | float | tuple]):
+        """맨 아래 레코드부터 맨 위 레코드까지 순회한다."""
+        if self._width == 1:
+            return iter(self._stack)
+        return zip(*[iter(self._stack)] * self._width)
+
+    def __repr__(self):
+        if self._width == 1:
+            return repr(self._stack.tolist())
+        values = self._stack.tolist()
+        return repr(list(zip(*[iter(values)] * self._width)))
+
+
+class AsyncDynamicStack(asyncio.Queue):
+    """asyncio에서 await할 수 있는 동적 스택. 
+
+    asyncio.Queue의 항목 저장 방식(_init, _put, _get)만 DynamicStack으로 바꾼 것으로, 
+    가장 나중에 넣은 항목부터 꺼낸다. (LIFO) 
+    await put(), await get()과 최대 크기(maxsize), 대기 중 취소(cancel) 처리 등은 
+    asyncio.Queue를 그대로 따른다. 
+    스택이 비었거나 가득 찼을 때는 이벤트 루프에 제어를 넘기고 기다리므로, 
+    스택을 반복해서 확인하는(polling) 방식과 달리 기다리는 동안 CPU를 사용하지 않는다.
+    """
+    def _init(self, maxsize: int) -> (None):
+        self._queue = DynamicStack(msg_on_off=False, raise_error=True)
+
+    def _put(self, item) -> (None):
+        self._queue.push(item)
+
+    def _get(self) -> (Any):
+        return self._queue.pop()
+
+    def qsize(self) -> (int):
+        """현재 스택에 들어있는 요소들의 수 반환."""
+        return self._queue.getLength()
+
+    def empty(self) -> (bool):
+        return self._queue.is_empty()
+
+    async def drain(
+            self,
+            timeout: float | None = 0
+        ) -> (AsyncGenerator[Any, None]):
+        """스택의 항목들을 차례로 꺼내어 반환하는 비동기 제너레이터. (async for)
+
+        스택이 비면 timeout초 동안 새 항목이 들어오기를 기다리고, 
+        그래도 들어오지 않으면 끝난다. 
+
+        Parameters
+        ----------
+        timeout : float | None, default 0
+            0이면 기다리지 않고 바로 끝나며, None이면 새 항목을 끝없이 기다린다.
+
+        """
+        while True:
+            if not self.empty():
+                yield self.get_nowait()
+                continue
+            if timeout == 0:
+                return
+            try:
+                item = await asyncio.wait_for(self.get(), timeout)
+            except asyncio.TimeoutError:
+                return
+            yield item
+
+    def __aiter__(self) -> (AsyncGenerator[Any, None]):
+        """async for로 스택이 빌 때까지 항목들을 꺼낸다. (drain() 참고)"""
+        return self.drain()
+
+
 def test_static_stack():
     stack = StaticStack(10)
     data = ["초록색", "분홍색", "노란색", '하늘색', '흰색']
@@ -1,9 +1,12 @@
 import unittest
 import sys
+import asyncio
 from dirimporttool import get_super_dir_directly
 super_dir = get_super_dir_directly(__file__, 2)
 sys.path.append(super_dir)
-from stack.my_stack import StaticStack
+from stack.my_stack import (
+    StaticStack, DynamicStack, TypedStack, AsyncDynamicStack, Full, Empty
+)
 
 
 class TestStack(unittest.TestCase):
@@ -105,6 +108,206 @@ class TestStack(unittest.TestCase):
         self.assertEqual(getattr(self.st, '_stack'), [])
         self.assertEqual(self.st.__repr__(), '[]')
 
+    def test_raise_mode(self):
+        """
+        need_dataset\n
+        raise_error 모드에서 Full, Empty, ValueError 예외 발생 테스트.
+        """
+        st2 = StaticStack(2, raise_error=True)
+        st2.push('사과')
+        st2.push('바나나')
+        with self.assertRaises(Full):
+            st2.push('당근')
+        self.assertEqual(st2.pop(), '바나나')
+        self.assertEqual(st2.pop(), '사과')
+        with self.assertRaises(Empty):
+            st2.pop()
+
+        self.st.setRaiseMode(True)
+        with self.assertRaises(ValueError):
+            self.st.setNewSize(3)
+        self.assertEqual(self.st.size_, 10)
+
+        dst = DynamicStack(raise_error=True)
+        dst.push('참외')
+        self.assertEqual(dst.pop(), '참외')
+        self.assertRaises(Empty, dst.pop)
+
+    def test_msg_off(self):
+        """
+        메시지 출력을 끈 경우 출력 없이 실패 결과만 반환하는지 테스트.
+        """
+        st2 = StaticStack(0, msg_on_off=False)
+        self.assertEqual(st2.getMsgMode(), False)
+        self.assertEqual(st2.push('코끼리'), False)
+        self.assertEqual(st2.pop(), None)
+
+
+class TestTypedStack(unittest.TestCase):
+    def setUp(self):
+        self.st = TypedStack('i', width=2)
+        self.desc = self.shortDescription()
+        self.dataset = [(0, 0), (1, 0), (1, 1), (2, 1)]
+
+        if self.desc == "need_dataset":
+            for data in self.dataset:
+                self.st.push(data)
+
+    def test_is_empty(self):
+        """
+        빈 스택 테스트.
+        """
+        self.assertEqual(self.st.__repr__(), '[]')
+        self.assertEqual(self.st.is_empty(), True)
+        self.assertEqual(self.st.getLength(), 0)
+        self.assertRaises(IndexError, self.st.peek)
+        self.assertRaises(ValueError, TypedStack, 'i', 0)
+
+    def test_push_and_pop(self):
+        """
+        need_dataset\n
+        레코드 삽입, 추출 테스트.
+        """
+        self.assertEqual(self.st.getLength(), 4)
+        self.assertEqual(
+            self.st.__repr__(), "[(0, 0), (1, 0), (1, 1), (2, 1)]"
+        )
+        self.assertEqual(self.st.peek(), (2, 1))
+        self.assertEqual(self.st.pop(), (2, 1))
+        self.assertEqual(self.st.pop(), (1, 1))
+        self.assertEqual(self.st.getLength(), 2)
+        with self.assertRaises(ValueError):
+            self.st.push((1, 2, 3))
+        with self.assertRaises(TypeError):
+            self.st.push((1.5, 2))
+        self.assertEqual(self.st.getLength(), 2)
+
+        st1 = TypedStack('d')
+        st1.push(1.5)
+        st1.push(2)
+        self.assertEqual(st1.peek(), 2.0)
+        self.assertEqual([st1.pop(), st1.pop()], [2.0, 1.5])
+
+        st3 = TypedStack('q', width=3)
+        st3.push((1, 2, 3))
+        self.assertEqual(st3.pop(), (1, 2, 3))
+
+    def test_push_invalid_record(self):
+        """
+        need_dataset\n
+        값이 잘못된 레코드 삽입 시 레코드의 일부도 남지 않는지 테스트.
+        """
+        with self.assertRaises(TypeError):
+            self.st.push((3, 2.5))
+        with self.assertRaises(OverflowError):
+            self.st.push((3, 2 ** 40))
+        self.assertEqual(self.st.getLength(), 4)
+        self.assertEqual(self.st.pop(), (2, 1))
+
+        st3 = TypedStack('q', width=3)
+        st3.push((1, 2, 3))
+        with self.assertRaises(TypeError):
+            st3.push((4, 5, '6'))
+        with self.assertRaises(ValueError):
+            st3.push((4, 5))
+        self.assertEqual(st3.__repr__(), "[(1, 2, 3)]")
+        self.assertEqual(list(st3), [(1, 2, 3)])
+        self.assertEqual(st3.pop(), (1, 2, 3))
+        self.assertEqual(st3.is_empty(), True)
+
+    def test_push_many_and_pop_many(self):
+        """
+        need_dataset\n
+        pushMany(), popMany() 테스트.
+        """
+        self.assertEqual(self.st.pushMany([(3, 1), (3, 2)]), True)
+        self.assertEqual(self.st.popMany(3), [(3, 2), (3, 1), (2, 1)])
+        self.assertEqual(self.st.popMany(10), [(1, 1), (1, 0), (0, 0)])
+        self.assertEqual(self.st.is_empty(), True)
+        with self.assertRaises(ValueError):
+            self.st.pushMany([(1, 2), (3, )])
+        with self.assertRaises(ValueError):
+            self.st.pushMany([(1, 2, 3), (4, )])
+        self.assertEqual(self.st.is_empty(), True)
+        self.assertRaises(ValueError, self.st.popMany, -1)
+
+        st1 = TypedStack('q')
+        st1.pushMany(range(5))
+        self.assertEqual(st1.popMany(2), [4, 3])
+        self.assertEqual(st1.popMany(0), [])
+        self.assertEqual(st1.getLength(), 3)
+
+    def test_size_limit(self):
+        """
+        최대 크기 설정 및 raise_error 모드 테스트.
+        """
+        st2 = TypedStack('i', width=2, size_=2, msg_on_off=False)
+        self.assertEqual(st2.pushMany([(1, 1), (2, 2), (3, 3)]), False)
+        self.assertEqual(st2.is_empty(), True)
+        st2.push((1, 1))
+        st2.push((2, 2))
+        self.assertEqual(st2.push((3, 3)), False)
+        self.assertEqual(st2.pop(), (2, 2))
+        st2.setNewSize(None)
+        st2.pushMany([(3, 3), (4, 4)])
+        self.assertEqual(st2.getLength(), 3)
+
+        st2.setRaiseMode(True)
+        st2.setNewSize(3)
+        with self.assertRaises(Full):
+            st2.push((5, 5))
+        with self.assertRaises(ValueError):
+            st2.setNewSize(1)
+        st2.clear()
+        self.assertEqual(st2.is_empty(), True)
+        self.assertRaises(Empty, st2.pop)
+        self.assertRaises(Empty, st2.popMany, 1)
+
+
+class TestAsyncDynamicStack(unittest.IsolatedAsyncioTestCase):
+    async def test_repr(self):
+        """
+        항목이 있는 스택의 repr() 테스트.
+        """
+        st = AsyncDynamicStack()
+        await st.put('사과')
+        await st.put('바나나')
+        self.assertIn("_queue=['사과', '바나나']", repr(st))
+        self.assertIn("maxsize=0", str(st))
+
+    async def test_lifo_and_drain(self):
+        """
+        후입선출 순서와 async for를 이용한 drain 테스트.
+        """
+        st = AsyncDynamicStack()
+        for data in ['사과', '바나나', '당근']:
+            await st.put(data)
+        self.assertEqual(st.qsize(), 3)
+        self.assertEqual(await st.get(), '당근')
+        self.assertEqual([data async for data in st], ['바나나', '사과'])
+        self.assertTrue(st.empty())
+
+    async def test_backpressure_and_cancel(self):
+        """
+        최대 크기에서 put이 기다리는지, 기다리던 get을 취소할 수 있는지 테스트.
+        """
+        st = AsyncDynamicStack(maxsize=1)
+        await st.put('사과')
+        producer = asyncio.create_task(st.put('바나나'))
+        await asyncio.sleep(0)
+        self.assertFalse(producer.done())
+        self.assertEqual(await st.get(), '사과')
+        await asyncio.wait_for(producer, 1)
+        self.assertEqual(await st.get(), '바나나')
+
+        getter = asyncio.create_task(st.get())
+        await asyncio.sleep(0)
+        getter.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await getter
+        st.put_nowait('참외')
+        self.assertEqual([data async for data in st], ['참외'])
+
 
 if __name__ == '__main__':
     unittest.main()